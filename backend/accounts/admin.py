@@ -3,6 +3,8 @@ from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 from django.utils.translation import gettext_lazy as _
 
+from sports.db.pagination import EstimatedCountPaginator
+
 from .models import User
 
 
@@ -14,6 +16,9 @@ class UserCreationForm(forms.ModelForm):
         model = User
         fields = ('email', 'first_name', 'last_name', 'role', 'tenant')
 
+    def clean_email(self):
+        return User.objects.normalize_email(self.cleaned_data['email'])
+
     def clean_password2(self):
         password1 = self.cleaned_data.get('password1')
         password2 = self.cleaned_data.get('password2')
@@ -34,12 +39,21 @@ class UserChangeForm(forms.ModelForm):
         model = User
         fields = ('email', 'first_name', 'last_name', 'role', 'tenant', 'is_active', 'is_staff')
 
+    def clean_email(self):
+        return User.objects.normalize_email(self.cleaned_data['email'])
+
 
 @admin.register(User)
 class UserAdmin(BaseUserAdmin):
     ordering = ('email',)
     list_display = ('email', 'first_name', 'last_name', 'role', 'tenant', 'is_active', 'is_staff')
-    search_fields = ('email', 'first_name', 'last_name', 'tenant')
+    list_select_related = ('tenant',)
+    # tenant__name is served by the tenant name trigram index on PostgreSQL.
+    search_fields = ('email', 'first_name', 'last_name', 'tenant__name')
+    # Both forms get a search-as-you-type widget instead of every tenant in a <select>.
+    autocomplete_fields = ('tenant',)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     form = UserChangeForm
     add_form = UserCreationForm
 
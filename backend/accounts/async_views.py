@@ -0,0 +1,67 @@
+from functools import wraps
+
+from django.http import Http404, JsonResponse
+from rest_framework import exceptions, permissions
+
+from sports.db.routers import replica_safe
+from tenants.cache import acached_response
+
+from .authentication import ClaimsJWTAuthentication, ClaimsUser
+from .serializers import MeSerializer, UserProfileSerializer
+
+
+def _error(exc):
+    detail = exc.detail if isinstance(exc.detail, (dict, list)) else {'detail': exc.detail}
+    return JsonResponse(detail, status=exc.status_code, safe=False)
+
+
+def async_api_view(permission_class=permissions.IsAuthenticated):
+    """
+    Run a native ``async def`` GET view with the same claims authentication and
+    permission checks as the DRF views, without a ``sync_to_async`` hop.
+    """
+
+    def decorator(view):
+        @wraps(view)
+        async def wrapper(request, *args, **kwargs):
+            if request.method != 'GET':
+                return _error(exceptions.MethodNotAllowed(request.method))
+            try:
+                result = await ClaimsJWTAuthentication().aauthenticate(request)
+            except exceptions.APIException as exc:
+                return _error(exc)
+            if result is None:
+                return _error(exceptions.NotAuthenticated())
+
+            request.user, request.auth = result
+            if not permission_class().has_permission(request, None):
+                return _error(exceptions.PermissionDenied())
+            try:
+                return await view(request, *args, **kwargs)
+            except Http404:
+                return _error(exceptions.NotFound())
+            except exceptions.APIException as exc:
+                return _error(exc)
+
+        return replica_safe(wrapper)
+
+    return decorator
+
+
+@async_api_view()
+async def me(request):
+    user: ClaimsUser = request.user
+
+    async def build():
+        profile = await user.aget_user()
+        serializer = MeSerializer(
+            {
+                'role': profile.role,
+                'tenant': profile.tenant,
+                'profile': UserProfileSerializer(profile).data,
+            }
+        )
+        return serializer.data
+
+    payload = await acached_response('me', build, tenant_id=user.tenant_id, user_id=user.pk)
+    return JsonResponse(payload)
@@ -0,0 +1,157 @@
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import DEFAULT_CACHE_ALIAS, cache
+from django.db import router
+from django.utils.functional import cached_property
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.settings import api_settings
+
+from sports.metrics import timed
+from tenants.models import Tenant
+
+from .models import token_version_cache_key
+
+
+User = get_user_model()
+
+TOKEN_VERSION_CLAIM = 'ver'
+TOKEN_VERSION_CACHE_TIMEOUT = 60 * 60
+# Revocation only deletes the key in the saving process's cache; with a
+# per-process cache, other workers must re-read the version this often.
+TOKEN_VERSION_LOCAL_CACHE_TIMEOUT = 5
+PROCESS_LOCAL_CACHE_BACKENDS = (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+
+
+def cache_is_shared(alias=DEFAULT_CACHE_ALIAS):
+    """Whether every worker process sees the same entries of cache ``alias``."""
+    return settings.CACHES[alias]['BACKEND'] not in PROCESS_LOCAL_CACHE_BACKENDS
+
+
+def token_version_cache_timeout():
+    if cache_is_shared():
+        return TOKEN_VERSION_CACHE_TIMEOUT
+    return TOKEN_VERSION_LOCAL_CACHE_TIMEOUT
+
+
+def _primary_users():
+    # Read from the primary so replica lag never caches an outdated version.
+    return User.objects.db_manager(router.db_for_write(User))
+
+
+def get_token_version(user_id):
+    """Return the current token version of an active user, or ``None``."""
+    key = token_version_cache_key(user_id)
+    version = cache.get(key)
+    if version is None:
+        version = (
+            _primary_users().filter(pk=user_id, is_active=True)
+            .values_list('token_version', flat=True)
+            .first()
+        )
+        if version is None:
+            return None
+        cache.set(key, version, token_version_cache_timeout())
+    return version
+
+
+async def aget_token_version(user_id):
+    key = token_version_cache_key(user_id)
+    version = await cache.aget(key)
+    if version is None:
+        version = await (
+            _primary_users().filter(pk=user_id, is_active=True)
+            .values_list('token_version', flat=True)
+            .afirst()
+        )
+        if version is None:
+            return None
+        await cache.aset(key, version, token_version_cache_timeout())
+    return version
+
+
+def check_token_version(token, version):
+    """Reject ``token`` unless it carries the user's current ``version``."""
+    if version is None:
+        raise AuthenticationFailed(_('User not found or inactive'), code='user_inactive')
+    if token.get(TOKEN_VERSION_CLAIM, 0) != version:
+        raise AuthenticationFailed(_('Token has been revoked'), code='token_revoked')
+
+
+class ClaimsUser(TokenUser):
+    """Request user rebuilt from verified JWT claims, without a ``User`` row."""
+
+    @cached_property
+    def role(self):
+        return self.token.get('role')
+
+    @cached_property
+    def tenant_id(self):
+        return self.token.get('tenant')
+
+    @cached_property
+    def tenant(self):
+        if self.tenant_id is None:
+            return None
+        return Tenant.objects.filter(pk=self.tenant_id).first()
+
+    def get_user(self, only=None):
+        return self._user_queryset(only).get(pk=self.pk)
+
+    async def aget_user(self, only=None):
+        return await self._user_queryset(only).aget(pk=self.pk)
+
+    def _user_queryset(self, only):
+        """Users with their tenant joined, restricted to the ``only`` columns when given."""
+        if only is None:
+            return User.objects.select_related('tenant')
+        users = User.objects.only(*only)
+        if 'tenant' in only:
+            users = users.select_related('tenant')
+        return users
+
+
+class ClaimsJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication that trusts the ``role``/``tenant`` claims and only
+    checks the per-user token version, which is served from the cache.
+    """
+
+    def authenticate(self, request):
+        with timed('auth'):
+            return super().authenticate(request)
+
+    def get_user(self, validated_token):
+        return self._claims_user(validated_token, get_token_version(self._user_id(validated_token)))
+
+    async def aauthenticate(self, request):
+        """Async counterpart of ``authenticate`` for plain Django async views."""
+        with timed('auth'):
+            return await self._aauthenticate(request)
+
+    async def _aauthenticate(self, request):
+        header = self.get_header(request)
+        if header is None:
+            return None
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+
+        validated_token = self.get_validated_token(raw_token)
+        version = await aget_token_version(self._user_id(validated_token))
+        return self._claims_user(validated_token, version), validated_token
+
+    def _user_id(self, validated_token):
+        try:
+            return validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_('Token contained no recognizable user identification'))
+
+    def _claims_user(self, validated_token, version):
+        check_token_version(validated_token, version)
+        return ClaimsUser(validated_token)
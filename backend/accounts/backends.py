@@ -0,0 +1,33 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+from django.db.models.functions import Lower
+
+
+User = get_user_model()
+
+
+class EmailBackend(ModelBackend):
+    """
+    Resolves the user with a single ``LOWER(email) = %s`` lookup, served by the
+    ``user_email_lower_uniq`` index.
+    """
+
+    def authenticate(self, request, username=None, password=None, **kwargs):
+        email = kwargs.get(User.USERNAME_FIELD, username)
+        if email is None or password is None:
+            return None
+
+        normalized_email = User.objects.normalize_email(email)
+        user = (
+            User.objects.alias(email_lower=Lower('email'))
+            .filter(email_lower=normalized_email)
+            .first()
+        )
+        if user is None:
+            # Run the hasher anyway so response time doesn't reveal whether
+            # the account exists.
+            User().set_password(password)
+            return None
+        if user.check_password(password) and self.user_can_authenticate(user):
+            return user
+        return None
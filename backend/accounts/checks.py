@@ -0,0 +1,18 @@
+from django.core.checks import Tags, Warning, register
+
+from .authentication import TOKEN_VERSION_LOCAL_CACHE_TIMEOUT, cache_is_shared
+
+
+@register(Tags.caches, deploy=True)
+def check_shared_cache(app_configs, **kwargs):
+    if cache_is_shared():
+        return []
+    return [
+        Warning(
+            'The default cache is local to each process, so token revocations only reach the worker '
+            f'that saved the user; the others keep accepting revoked tokens for up to '
+            f'{TOKEN_VERSION_LOCAL_CACHE_TIMEOUT} seconds and re-read token versions that often.',
+            hint='Set REDIS_URL to a cache shared by every worker.',
+            id='accounts.W001',
+        )
+    ]
@@ -0,0 +1,26 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from accounts.tokens import PRUNE_BATCH_SIZE, prune_expired_tokens
+
+
+class Command(BaseCommand):
+    help = 'Delete expired outstanding and blacklisted JWT refresh tokens in batches.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=PRUNE_BATCH_SIZE)
+        parser.add_argument(
+            '--loop',
+            action='store_true',
+            help='Keep pruning every --interval seconds instead of exiting.',
+        )
+        parser.add_argument('--interval', type=float, default=3600.0)
+
+    def handle(self, *args, **options):
+        while True:
+            pruned = prune_expired_tokens(options['batch_size'])
+            self.stdout.write(f'Pruned {pruned} expired token(s).')
+            if not options['loop']:
+                break
+            time.sleep(options['interval'])
@@ -0,0 +1,46 @@
+# Generated by Django 4.2.21 on 2026-10-18 17:15
+
+from django.db import migrations, models
+import django.db.models.functions.text
+
+
+def lowercase_emails(apps, schema_editor):
+    User = apps.get_model("accounts", "User")
+    Lower = django.db.models.functions.text.Lower
+    # Lowercasing would turn case variants into duplicates and fail the
+    # constraint below without saying which rows clash; list them instead.
+    duplicates = (
+        User.objects.values(lower=Lower("email"))
+        .annotate(n=models.Count("id"))
+        .filter(n__gt=1)
+        .order_by("lower")
+        .values_list("lower", flat=True)
+    )
+    conflicts = []
+    for email in duplicates:
+        ids = User.objects.filter(email__iexact=email).order_by("id").values_list("id", flat=True)
+        conflicts.append(f"{email}: ids {', '.join(map(str, ids))}")
+    if conflicts:
+        raise RuntimeError(
+            "Cannot add user_email_lower_uniq, these emails differ only by case. "
+            "Merge or rename the accounts, then run migrate again.\n" + "\n".join(conflicts)
+        )
+    User.objects.exclude(email=Lower("email")).update(email=Lower("email"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0003_user_token_version"),
+    ]
+
+    operations = [
+        migrations.RunPython(lowercase_emails, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="user",
+            constraint=models.UniqueConstraint(
+                django.db.models.functions.text.Lower("email"),
+                name="user_email_lower_uniq",
+            ),
+        ),
+    ]
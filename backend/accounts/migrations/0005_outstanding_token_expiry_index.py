@@ -0,0 +1,23 @@
+# Generated by Django 4.2.21 on 2026-10-18 17:17
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0004_user_email_lower_uniq"),
+        ("token_blacklist", "0012_alter_outstandingtoken_user"),
+    ]
+
+    # The token tables belong to simplejwt, so the index backing
+    # ``prune_tokens`` is created with raw SQL.
+    operations = [
+        migrations.RunSQL(
+            sql=(
+                "CREATE INDEX IF NOT EXISTS token_outstanding_expires_idx "
+                "ON token_blacklist_outstandingtoken (expires_at)"
+            ),
+            reverse_sql="DROP INDEX IF EXISTS token_outstanding_expires_idx",
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 4.2.21 on 2026-10-18 17:28
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tenants", "0006_invitation_tenant_indexes"),
+        ("accounts", "0005_outstanding_token_expiry_index"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="user",
+            index=models.Index(fields=["tenant", "role"], name="user_tenant_role_idx"),
+        ),
+        migrations.AlterField(
+            model_name="user",
+            name="tenant",
+            field=models.ForeignKey(
+                blank=True,
+                db_index=False,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="users",
+                to="tenants.tenant",
+            ),
+        ),
+    ]
@@ -1,19 +1,127 @@
 from django.contrib.auth.base_user import AbstractBaseUser, BaseUserManager
 from django.contrib.auth.models import PermissionsMixin
-from django.db import models
+from django.core.cache import cache
+from django.db import models, router, transaction
+from django.db.models import F
+from django.db.models.functions import Lower
 
+from tenants.cache import bump_tenant_version, bump_user_version
+from tenants.counters import apply_membership_change, recount_role_counts
+from tenants.scoping import TenantScopedManager
+
+
+TOKEN_VERSION_CACHE_KEY = 'accounts:token-version:{user_id}'
+MEMBERSHIP_FIELDS = {'role', 'tenant', 'tenant_id'}
+CLAIM_FIELDS = MEMBERSHIP_FIELDS | {'is_active'}
+
+
+def token_version_cache_key(user_id):
+    return TOKEN_VERSION_CACHE_KEY.format(user_id=user_id)
+
+
+def _invalidate_users(user_tenant_pairs, extra_tenant_ids=()):
+    tenant_ids = set(extra_tenant_ids)
+    for user_id, tenant_id in user_tenant_pairs:
+        key = token_version_cache_key(user_id)
+        cache.delete(key)
+        transaction.on_commit(lambda key=key: cache.delete(key))
+        bump_user_version(user_id)
+        tenant_ids.add(tenant_id)
+    for tenant_id in tenant_ids:
+        bump_tenant_version(tenant_id)
+
+
+class UserQuerySet(models.QuerySet):
+    """
+    Keeps the tenant role counters and token versions right for bulk writes,
+    which bypass ``User.save``.
+    """
+
+    # Cleared on the queryset Django's bulk_update() writes through, so its
+    # inner update() doesn't repeat the bookkeeping.
+    _track_claims = True
+
+    def _clone(self):
+        clone = super()._clone()
+        clone._track_claims = self._track_claims
+        return clone
+
+    def _write_claims(self, users, write, fields, bump_version):
+        with transaction.atomic(using=self.db):
+            affected = list(users.values_list('pk', 'tenant_id'))
+            rows = write()
+            # The written values may be expressions (F(), Case()), so read the
+            # new tenants back instead of taking them from the arguments.
+            written = self.model._base_manager.using(self.db).filter(pk__in=[pk for pk, _ in affected])
+            if bump_version:
+                written.update(token_version=F('token_version') + 1)
+            tenant_ids = {tenant_id for _, tenant_id in affected}
+            tenant_ids.update(written.values_list('tenant_id', flat=True))
+            if MEMBERSHIP_FIELDS & set(fields):
+                recount_role_counts(tenant_ids)
+            _invalidate_users(affected, tenant_ids)
+        return rows
+
+    def update(self, **kwargs):
+        if not self._track_claims or not CLAIM_FIELDS & kwargs.keys():
+            return super().update(**kwargs)
+
+        kwargs.setdefault('token_version', F('token_version') + 1)
+        return self._write_claims(
+            self, lambda: super(UserQuerySet, self).update(**kwargs), kwargs.keys(), bump_version=False
+        )
+
+    update.alters_data = True
+
+    def delete(self):
+        with transaction.atomic(using=self.db):
+            affected = list(self.values_list('pk', 'tenant_id'))
+            result = super().delete()
+            recount_role_counts({tenant_id for _, tenant_id in affected})
+            _invalidate_users(affected)
+        return result
+
+    delete.alters_data = True
+    delete.queryset_only = True
+
+    def bulk_create(self, objs, *args, **kwargs):
+        with transaction.atomic(using=self.db):
+            created = super().bulk_create(objs, *args, **kwargs)
+            recount_role_counts({user.tenant_id for user in created})
+        for tenant_id in {user.tenant_id for user in created}:
+            bump_tenant_version(tenant_id)
+        return created
+
+    def bulk_update(self, objs, fields, *args, **kwargs):
+        objs = list(objs)
+        if not self._track_claims or not CLAIM_FIELDS & set(fields):
+            return super().bulk_update(objs, fields, *args, **kwargs)
+
+        untracked = self._clone()
+        untracked._track_claims = False
+        return self._write_claims(
+            self.filter(pk__in=[user.pk for user in objs]),
+            lambda: super(UserQuerySet, untracked).bulk_update(objs, fields, *args, **kwargs),
+            fields,
+            bump_version=True,
+        )
+
+    bulk_update.alters_data = True
+
+
+class UserManager(BaseUserManager.from_queryset(UserQuerySet)):
+    @classmethod
+    def normalize_email(cls, email):
+        # Emails are stored lowercased so logins can use the LOWER(email) index.
+        return super().normalize_email(email or '').strip().lower()
 
-class UserManager(BaseUserManager):
     def create_user(self, email, password=None, role=None, tenant=None, **extra_fields):
         if not email:
             raise ValueError('Users must have an email address')
 
         email = self.normalize_email(email)
-        if email:
-            email = email.strip()
         if not email:
             raise ValueError('Users must have an email address')
-        email = email.lower()
 
         role = role or self.model.Role.CLIENT
         if role not in dict(self.model.Role.choices):
@@ -59,15 +167,109 @@ class User(AbstractBaseUser, PermissionsMixin):
         blank=True,
         on_delete=models.SET_NULL,
         related_name='users',
+        # Indexed through user_tenant_role_idx.
+        db_index=False,
     )
     is_active = models.BooleanField(default=True)
     is_staff = models.BooleanField(default=False)
     date_joined = models.DateTimeField(auto_now_add=True)
+    # Embedded in issued JWTs; bumping it revokes every token carrying older claims.
+    token_version = models.PositiveIntegerField(default=0, editable=False)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(Lower('email'), name='user_email_lower_uniq'),
+        ]
+        indexes = [
+            models.Index(fields=['tenant', 'role'], name='user_tenant_role_idx'),
+        ]
 
     USERNAME_FIELD = 'email'
     REQUIRED_FIELDS = []
 
+    # Fields mirrored into the JWT claims used by ClaimsJWTAuthentication.
+    TOKEN_CLAIM_FIELDS = ('role', 'tenant_id', 'is_active')
+
     objects = UserManager()
+    # Authentication looks users up before any tenant is known and
+    # superadmins have none, so only this secondary manager is scoped.
+    scoped = TenantScopedManager.from_queryset(UserQuerySet)()
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Deferred loads (``.only()``) snapshot what they have; save() reads
+        # the rest back before comparing.
+        instance._loaded_claims = {
+            field: getattr(instance, field) for field in cls.TOKEN_CLAIM_FIELDS if field in field_names
+        }
+        return instance
+
+    def _claim_state(self, stored=None):
+        # Claims still deferred are unchanged: take them from ``stored``
+        # rather than loading each one with its own query.
+        deferred = self.get_deferred_fields() if stored else ()
+        return {
+            field: stored[field] if field in deferred else getattr(self, field, None)
+            for field in self.TOKEN_CLAIM_FIELDS
+        }
+
+    def _stored_claims(self, using):
+        """The claims as last read from the database, completing deferred loads."""
+        loaded = getattr(self, '_loaded_claims', {})
+        missing = [field for field in self.TOKEN_CLAIM_FIELDS if field not in loaded]
+        if not missing:
+            return loaded
+        stored = type(self)._base_manager.using(using).filter(pk=self.pk).values(*missing).first()
+        return None if stored is None else {**loaded, **stored}
+
+    def save(self, *args, **kwargs):
+        adding = self._state.adding
+        using = kwargs.get('using') or router.db_for_write(type(self), instance=self)
+        with transaction.atomic(using=using):
+            loaded_claims = None if adding else self._stored_claims(using)
+            claims_changed = loaded_claims is not None and loaded_claims != self._claim_state(loaded_claims)
+            if claims_changed:
+                # Incremented in SQL so a concurrent save cannot lose the revocation.
+                self.token_version = F('token_version') + 1
+                update_fields = kwargs.get('update_fields')
+                if update_fields is not None:
+                    kwargs['update_fields'] = {*update_fields, 'token_version'}
+
+            super().save(*args, **kwargs)
+            if claims_changed:
+                self.refresh_from_db(using=using, fields=['token_version'])
+            if adding:
+                apply_membership_change(None, (self.tenant_id, self.role))
+            elif loaded_claims is not None:
+                apply_membership_change(
+                    (loaded_claims['tenant_id'], loaded_claims['role']),
+                    (self.tenant_id, self.role),
+                )
+            else:
+                recount_role_counts([self.tenant_id])
+        self._loaded_claims = self._claim_state(loaded_claims)
+        if adding or loaded_claims != self._loaded_claims:
+            self.invalidate_token_version()
+
+        bump_user_version(self.pk)
+        bump_tenant_version(self.tenant_id)
+        if loaded_claims is not None and loaded_claims['tenant_id'] != self.tenant_id:
+            bump_tenant_version(loaded_claims['tenant_id'])
+
+    def delete(self, *args, **kwargs):
+        tenant_id = self.tenant_id
+        using = kwargs.get('using') or router.db_for_write(type(self), instance=self)
+        with transaction.atomic(using=using):
+            result = super().delete(*args, **kwargs)
+            apply_membership_change((tenant_id, self.role), None)
+        bump_tenant_version(tenant_id)
+        return result
+
+    def invalidate_token_version(self):
+        key = token_version_cache_key(self.pk)
+        cache.delete(key)
+        transaction.on_commit(lambda: cache.delete(key))
 
     def __str__(self):
         return self.email
@@ -1,10 +1,15 @@
 from django.contrib.auth import get_user_model
 from django.contrib.auth.password_validation import validate_password
 from rest_framework import serializers
-from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer, TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
 
+from sports.fieldsets import SparseFieldsMixin
 from tenants.models import Tenant
 
+from .authentication import check_token_version, get_token_version
+from .tokens import RotatingRefreshToken
+
 
 User = get_user_model()
 
@@ -59,35 +64,39 @@ class UserProfileSerializer(serializers.ModelSerializer):
         )
 
 
-class MeSerializer(serializers.Serializer):
+class MeSerializer(SparseFieldsMixin, serializers.Serializer):
     role = serializers.CharField()
     tenant = TenantSummarySerializer(allow_null=True)
     profile = UserProfileSerializer()
 
 
+ME_FIELDS = ('role', 'tenant', 'profile')
+
+
+def user_columns(fields) -> tuple[str, ...]:
+    """``User`` columns (and joined tenant columns) needed to render ``fields`` of ``MeSerializer``."""
+    columns = ['role']
+    if 'tenant' in fields or 'profile' in fields:
+        columns += ['tenant', *(f'tenant__{name}' for name in TenantSummarySerializer.Meta.fields)]
+    if 'profile' in fields:
+        columns += [name for name in UserProfileSerializer.Meta.fields if name != 'tenant']
+    return tuple(columns)
+
+
 class EmailTokenObtainPairSerializer(TokenObtainPairSerializer):
     @classmethod
     def get_token(cls, user):
         token = super().get_token(user)
         token['role'] = user.role
         token['tenant'] = user.tenant_id
+        token['ver'] = user.token_version
         return token
 
     def validate(self, attrs):
+        # EmailBackend normalizes and resolves the email in a single query.
         email = attrs.get(self.username_field)
         if email is not None:
-            normalized_email = email.strip()
-            if normalized_email:
-                attrs[self.username_field] = normalized_email
-                matching_user = User.objects.filter(
-                    **{f'{self.username_field}__iexact': normalized_email}
-                ).first()
-                if matching_user:
-                    attrs[self.username_field] = getattr(
-                        matching_user, self.username_field
-                    )
-            else:
-                attrs[self.username_field] = normalized_email
+            attrs[self.username_field] = email.strip()
 
         data = super().validate(attrs)
         data.update(
@@ -98,3 +107,15 @@ class EmailTokenObtainPairSerializer(TokenObtainPairSerializer):
             }
         )
         return data
+
+
+class RotatingTokenRefreshSerializer(TokenRefreshSerializer):
+    token_class = RotatingRefreshToken
+
+    def validate(self, attrs):
+        # Checked before rotation: a token revoked by a claims change must
+        # not be exchanged for an access token the API would then refuse.
+        # The signature is verified by super().validate().
+        refresh = self.token_class(attrs['refresh'], verify=False)
+        check_token_version(refresh, get_token_version(refresh.get(api_settings.USER_ID_CLAIM)))
+        return super().validate(attrs)
@@ -1,8 +1,31 @@
 import json
+from datetime import timedelta
+from importlib import import_module
+from io import StringIO
+from unittest import mock
 
+from django.apps import apps
 from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from sports.db.pagination import EstimatedCountPaginator
+from tenants.models import OwnerInvitation, Tenant
+
+from .authentication import (
+    TOKEN_VERSION_CACHE_TIMEOUT,
+    TOKEN_VERSION_LOCAL_CACHE_TIMEOUT,
+    token_version_cache_timeout,
+)
+from .checks import check_shared_cache
+from .serializers import EmailTokenObtainPairSerializer
 
 
 User = get_user_model()
@@ -31,6 +54,19 @@ class LoginViewTests(TestCase):
         self.assertIn('access', body)
         self.assertIn('refresh', body)
 
+    def test_login_resolves_user_with_a_single_query(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self._post_login(' Owner@EXAMPLE.com')
+
+        self.assertEqual(response.status_code, 200)
+        user_queries = [query['sql'] for query in queries if 'FROM "accounts_user"' in query['sql']]
+        self.assertEqual(len(user_queries), 1)
+        self.assertIn('LOWER', user_queries[0])
+
+    def test_login_rejects_wrong_password(self):
+        response = self._post_login('owner@example.com', 'WrongPass123!')
+        self.assertEqual(response.status_code, 401)
+
     def test_login_strips_whitespace_from_email(self):
         response = self._post_login('  owner@example.com  ')
 
@@ -38,3 +74,275 @@ class LoginViewTests(TestCase):
         body = response.json()
         self.assertIn('access', body)
         self.assertIn('refresh', body)
+
+
+class LowercaseEmailMigrationTests(TestCase):
+    def test_case_variants_abort_with_their_ids(self):
+        lowercase_emails = import_module('accounts.migrations.0004_user_email_lower_uniq').lowercase_emails
+        with connection.cursor() as cursor:
+            # Rolled back with the test, like the rows below.
+            cursor.execute('DROP INDEX user_email_lower_uniq')
+        first = User.objects.create_user(email='dup@example.com', password='x')
+        second = User.objects.create_user(email='other@example.com', password='x')
+        User.objects.filter(pk=second.pk).update(email='Dup@Example.com')
+        User.objects.create_user(email='single@example.com', password='x')
+
+        with self.assertRaisesMessage(RuntimeError, f'dup@example.com: ids {first.pk}, {second.pk}') as raised:
+            lowercase_emails(apps, None)
+
+        self.assertNotIn('single@example.com', str(raised.exception))
+        self.assertTrue(User.objects.filter(email='Dup@Example.com').exists())
+
+
+class RefreshTokenTests(TestCase):
+    def setUp(self):
+        self.password = 'StrongPass123!'
+        self.user = User.objects.create_user(email='refresh@example.com', password=self.password)
+        self.client.defaults['HTTP_HOST'] = 'localhost'
+        payload = json.dumps({'email': self.user.email, 'password': self.password})
+        response = self.client.post(reverse('accounts:login'), data=payload, content_type='application/json')
+        self.refresh = response.json()['refresh']
+
+    def _post_refresh(self, token):
+        payload = json.dumps({'refresh': token})
+        return self.client.post(reverse('accounts:token_refresh'), data=payload, content_type='application/json')
+
+    def test_rotated_refresh_token_cannot_be_replayed(self):
+        first = self._post_refresh(self.refresh)
+        self.assertEqual(first.status_code, 200)
+        self.assertIn('refresh', first.json())
+
+        cache.clear()  # the unique blacklist row still rejects the replay
+        self.assertEqual(self._post_refresh(self.refresh).status_code, 401)
+        self.assertEqual(self._post_refresh(first.json()['refresh']).status_code, 200)
+
+    def test_replayed_token_is_rejected_from_cache(self):
+        self._post_refresh(self.refresh)
+
+        with self.assertNumQueries(0):
+            response = self._post_refresh(self.refresh)
+        self.assertEqual(response.status_code, 401)
+
+    def test_refresh_token_is_revoked_by_claims_change(self):
+        self.user.role = User.Role.COACH
+        self.user.save()
+
+        response = self._post_refresh(self.refresh)
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.json()['code'], 'token_revoked')
+
+    def test_prune_removes_only_expired_tokens(self):
+        self._post_refresh(self.refresh)
+        OutstandingToken.objects.update(expires_at=timezone.now() - timedelta(days=1))
+        RefreshToken.for_user(self.user)
+
+        out = StringIO()
+        call_command('prune_tokens', '--batch-size=1', stdout=out)
+
+        self.assertIn('Pruned 1', out.getvalue())
+        self.assertEqual(OutstandingToken.objects.count(), 1)
+        self.assertFalse(BlacklistedToken.objects.exists())
+
+
+class ClaimsAuthenticationTests(TestCase):
+    def setUp(self):
+        self.password = 'StrongPass123!'
+        self.user = User.objects.create_user(
+            email='admin@example.com',
+            password=self.password,
+            role=User.Role.SUPERADMIN,
+        )
+        self.client.defaults['HTTP_HOST'] = 'localhost'
+
+    def _authenticate(self):
+        payload = json.dumps({'email': self.user.email, 'password': self.password})
+        response = self.client.post(reverse('accounts:login'), data=payload, content_type='application/json')
+        return {'HTTP_AUTHORIZATION': f"Bearer {response.json()['access']}"}
+
+    def test_authenticated_request_skips_user_lookup(self):
+        headers = self._authenticate()
+        self.client.get('/api/v1/tenants/', **headers)
+
+        with self.assertNumQueries(1):
+            response = self.client.get('/api/v1/tenants/', **headers)
+        self.assertEqual(response.status_code, 200)
+
+    def test_concurrent_claim_changes_both_bump_the_version(self):
+        first = User.objects.get(pk=self.user.pk)
+        second = User.objects.get(pk=self.user.pk)
+        first.role = User.Role.CLIENT
+        first.save()
+        second.is_active = False
+        second.save()
+
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.token_version, 2)
+        self.assertEqual(second.token_version, 2)
+
+    @override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+    def test_process_local_cache_keeps_token_versions_briefly(self):
+        self.assertEqual(token_version_cache_timeout(), TOKEN_VERSION_LOCAL_CACHE_TIMEOUT)
+        self.assertEqual([warning.id for warning in check_shared_cache(None)], ['accounts.W001'])
+
+        with override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.redis.RedisCache'}}):
+            self.assertEqual(token_version_cache_timeout(), TOKEN_VERSION_CACHE_TIMEOUT)
+            self.assertEqual(check_shared_cache(None), [])
+
+    def test_role_change_revokes_issued_tokens(self):
+        headers = self._authenticate()
+        self.user.role = User.Role.CLIENT
+        self.user.save()
+
+        response = self.client.get('/api/v1/me/', **headers)
+        self.assertEqual(response.status_code, 401)
+
+    def test_tenant_deletion_revokes_its_members_tokens(self):
+        first, second = Tenant.objects.create(name='Gone', slug='gone'), Tenant.objects.create(name='Too', slug='too')
+        self.user.tenant = first
+        self.user.save()
+        member = User.objects.create_user(email='member@example.com', password=self.password, tenant=second)
+        headers = self._authenticate()
+        version = User.objects.get(pk=self.user.pk).token_version
+
+        first.delete()
+        self.assertEqual(self.client.get('/api/v1/me/', **headers).status_code, 401)
+        self.user.refresh_from_db()
+        self.assertIsNone(self.user.tenant_id)
+        self.assertEqual(self.user.token_version, version + 1)
+
+        Tenant.objects.filter(pk=second.pk).delete()
+        member.refresh_from_db()
+        self.assertEqual((member.tenant_id, member.token_version), (None, 1))
+
+    def test_me_is_revalidated_with_its_etag(self):
+        headers = self._authenticate()
+        first = self.client.get('/api/v1/me/', **headers)
+
+        with self.assertNumQueries(0):
+            response = self.client.get('/api/v1/me/', HTTP_IF_NONE_MATCH=first['ETag'], **headers)
+        self.assertEqual(response.status_code, 304)
+
+        self.user.first_name = 'Grace'
+        self.user.save()
+        changed = self.client.get('/api/v1/me/', HTTP_IF_NONE_MATCH=first['ETag'], **headers)
+        self.assertEqual(changed.status_code, 200)
+        self.assertEqual(changed.json()['profile']['first_name'], 'Grace')
+
+    def test_me_fields_trim_payload_and_columns(self):
+        headers = self._authenticate()
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/api/v1/me/?fields=role', **headers)
+
+        self.assertEqual(response.json(), {'role': User.Role.SUPERADMIN})
+        user_query = next(query['sql'] for query in queries if 'accounts_user' in query['sql'])
+        self.assertNotIn('email', user_query)
+        self.assertNotIn('tenants_tenant', user_query)
+
+        full = self.client.get('/api/v1/me/', **headers)
+        self.assertEqual(set(full.json()), {'role', 'tenant', 'profile'})
+        self.assertEqual(self.client.get('/api/v1/me/?fields=nope', **headers).status_code, 400)
+
+    def test_profile_fields_are_unchanged(self):
+        headers = self._authenticate()
+        response = self.client.get('/api/v1/me/', **headers)
+
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual(body['role'], User.Role.SUPERADMIN)
+        self.assertEqual(body['profile']['email'], 'admin@example.com')
+
+
+class RequestMetricsTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(email='metrics@example.com', password='StrongPass123!')
+        self.client.defaults['HTTP_HOST'] = 'localhost'
+        token = EmailTokenObtainPairSerializer.get_token(self.user).access_token
+        self.headers = {'HTTP_AUTHORIZATION': f'Bearer {token}'}
+
+    def test_server_timing_breaks_down_the_request(self):
+        cache.clear()
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/api/v1/me/', **self.headers)
+
+        timing = response['Server-Timing']
+        self.assertIn(f'desc="{len(queries)} queries"', timing)
+        for phase in ('db;dur=', 'auth;dur=', 'serialize;dur=', 'total;dur='):
+            self.assertIn(phase, timing)
+
+    @override_settings(METRICS_TOKEN='scrape-secret')
+    def test_metrics_expose_per_route_histograms(self):
+        self.client.get('/api/v1/me/', **self.headers)
+        body = self.client.get('/metrics', HTTP_AUTHORIZATION='Bearer scrape-secret').content.decode()
+
+        self.assertIn('# TYPE http_request_duration_seconds histogram', body)
+        self.assertRegex(body, r'http_request_duration_seconds_bucket\{route="accounts_api:me",method="GET",le="\+Inf"\} [1-9]')
+        self.assertRegex(body, r'http_requests_total\{route="accounts_api:me",method="GET",status="200"\} [1-9]')
+        self.assertIn('http_request_db_queries_count{route="accounts_api:me",method="GET"}', body)
+
+    @override_settings(METRICS_TOKEN='scrape-secret')
+    def test_metrics_token_is_enforced(self):
+        self.assertEqual(self.client.get('/metrics').status_code, 401)
+        response = self.client.get('/metrics', HTTP_AUTHORIZATION='Bearer scrape-secret')
+        self.assertEqual(response.status_code, 200)
+
+    @override_settings(METRICS_TOKEN='')
+    def test_metrics_are_closed_without_a_token(self):
+        self.assertEqual(self.client.get('/metrics').status_code, 403)
+        with override_settings(DEBUG=True):
+            self.assertEqual(self.client.get('/metrics').status_code, 200)
+
+
+class AdminScalingTests(TestCase):
+    def setUp(self):
+        self.admin = User.objects.create_superuser('root@example.com', 'AdminPass123!')
+        self.client.force_login(self.admin)
+        self.client.defaults['HTTP_HOST'] = 'localhost'
+
+    def _add_members(self, count):
+        start = User.objects.count()
+        for index in range(start, start + count):
+            tenant = Tenant.objects.create(name=f'Admin Club {index}', slug=f'admin-club-{index}')
+            User.objects.create_user(
+                email=f'member{index}@example.com', password='StrongPass123!', role=User.Role.OWNER, tenant=tenant
+            )
+
+    def _changelist_queries(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(queries)
+
+    def test_changelists_do_not_query_per_row(self):
+        urls = ('/admin/accounts/user/', '/admin/tenants/ownerinvitation/', '/admin/accounts/user/?q=club')
+        self._add_members(2)
+        for index, tenant in enumerate(Tenant.objects.all()):
+            OwnerInvitation.all_tenants.create(tenant=tenant, email=f'invitee{index}@example.com')
+        few = [self._changelist_queries(url) for url in urls]
+
+        self._add_members(20)
+        for index, tenant in enumerate(Tenant.objects.filter(owner_invitations__isnull=True)):
+            OwnerInvitation.all_tenants.create(tenant=tenant, email=f'late-invitee{index}@example.com')
+        self.assertEqual([self._changelist_queries(url) for url in urls], few)
+
+    def test_user_forms_use_tenant_autocomplete(self):
+        self._add_members(3)
+        for url in ('/admin/accounts/user/add/', f'/admin/accounts/user/{self.admin.pk}/change/'):
+            content = self.client.get(url).content.decode()
+            self.assertIn('admin-autocomplete', content)
+            self.assertNotIn('Admin Club 1', content)
+
+        response = self.client.get(
+            '/admin/autocomplete/', {'app_label': 'accounts', 'model_name': 'user', 'field_name': 'tenant', 'term': 'club 2'}
+        )
+        self.assertEqual([result['text'] for result in response.json()['results']], ['Admin Club 2'])
+
+    def test_unfiltered_count_uses_the_estimate(self):
+        self._add_members(3)
+        with mock.patch('sports.db.pagination.estimated_row_count', return_value=5_000_000):
+            self.assertEqual(EstimatedCountPaginator(User.objects.order_by('pk'), 100).count, 5_000_000)
+            filtered = User.objects.filter(role=User.Role.OWNER).order_by('pk')
+            self.assertEqual(EstimatedCountPaginator(filtered, 100).count, 3)
+        with mock.patch('sports.db.pagination.estimated_row_count', return_value=50):
+            # Small tables keep their exact count.
+            self.assertEqual(EstimatedCountPaginator(User.objects.order_by('pk'), 100).count, 4)
+
@@ -0,0 +1,75 @@
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.utils import datetime_from_epoch
+
+
+BLACKLIST_CACHE_KEY = 'accounts:blacklisted-jti:{jti}'
+PRUNE_BATCH_SIZE = 1000
+
+
+def blacklist_cache_key(jti):
+    return BLACKLIST_CACHE_KEY.format(jti=jti)
+
+
+def _remember_blacklisted(jti, exp):
+    # Past ``exp`` the signature check rejects the token anyway.
+    timeout = max(int(exp - timezone.now().timestamp()), 1)
+    cache.set(blacklist_cache_key(jti), True, timeout)
+
+
+class RotatingRefreshToken(RefreshToken):
+    """
+    Refresh token whose blacklist check is answered by the cache, with the
+    database unique constraint on ``BlacklistedToken.token`` as the fallback.
+
+    With rotation and blacklisting enabled every refresh inserts a
+    ``BlacklistedToken`` row for the presented token, so a replayed token
+    fails on that insert; the separate ``EXISTS`` probe is redundant.
+    """
+
+    def check_blacklist(self):
+        jti = self.payload[api_settings.JTI_CLAIM]
+        if cache.get(blacklist_cache_key(jti)):
+            raise TokenError(_('Token is blacklisted'))
+        if not (api_settings.ROTATE_REFRESH_TOKENS and api_settings.BLACKLIST_AFTER_ROTATION):
+            super().check_blacklist()
+
+    def blacklist(self):
+        jti = self.payload[api_settings.JTI_CLAIM]
+        exp = self.payload['exp']
+
+        token, _created = OutstandingToken.objects.get_or_create(
+            jti=jti,
+            defaults={'token': str(self), 'expires_at': datetime_from_epoch(exp)},
+        )
+        try:
+            with transaction.atomic():
+                blacklisted = BlacklistedToken.objects.create(token=token)
+        except IntegrityError:
+            _remember_blacklisted(jti, exp)
+            raise TokenError(_('Token is blacklisted'))
+        _remember_blacklisted(jti, exp)
+        return blacklisted
+
+
+def prune_expired_tokens(batch_size=PRUNE_BATCH_SIZE, now=None):
+    """
+    Delete expired outstanding tokens (and their blacklist rows) in batches so
+    each statement stays short. Returns the number of outstanding tokens removed.
+    """
+    expired = OutstandingToken.objects.filter(expires_at__lt=now or timezone.now()).order_by()
+    pruned = 0
+    while True:
+        with transaction.atomic():
+            ids = list(expired.values_list('pk', flat=True)[:batch_size])
+            if not ids:
+                return pruned
+            BlacklistedToken.objects.filter(token_id__in=ids).delete()
+            OutstandingToken.objects.filter(pk__in=ids).delete()
+            pruned += len(ids)
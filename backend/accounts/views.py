@@ -1,10 +1,22 @@
 from rest_framework import generics, permissions
-from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 
+from sports.db.routers import replica_safe
+from sports.fieldsets import requested_fields
+from tenants.conditional import conditional_cached_response, sparse_namespace
+
+from .authentication import ClaimsUser
 from .permissions import IsSuperAdmin
-from .serializers import EmailTokenObtainPairSerializer, MeSerializer, RegisterSerializer, UserProfileSerializer
+from .serializers import (
+    ME_FIELDS,
+    EmailTokenObtainPairSerializer,
+    MeSerializer,
+    RegisterSerializer,
+    RotatingTokenRefreshSerializer,
+    UserProfileSerializer,
+    user_columns,
+)
 
 
 class RegisterView(generics.CreateAPIView):
@@ -18,18 +30,33 @@ class LoginView(TokenObtainPairView):
 
 
 class RefreshView(TokenRefreshView):
+    serializer_class = RotatingTokenRefreshSerializer
     permission_classes = [permissions.AllowAny]
 
 
+@replica_safe
 class MeView(APIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get(self, request, *args, **kwargs):
-        serializer = MeSerializer(
-            {
-                'role': request.user.role,
-                'tenant': request.user.tenant,
-                'profile': UserProfileSerializer(request.user).data,
-            }
+        fields = requested_fields(request, ME_FIELDS)
+        return conditional_cached_response(
+            request,
+            sparse_namespace('me', fields),
+            lambda: self.build_payload(request.user, fields),
+            tenant_id=request.user.tenant_id,
+            user_id=request.user.pk,
         )
-        return Response(serializer.data)
+
+    def build_payload(self, user, fields=None):
+        fields = fields or ME_FIELDS
+        if isinstance(user, ClaimsUser):
+            user = user.get_user(only=user_columns(fields))
+        data = {}
+        if 'role' in fields:
+            data['role'] = user.role
+        if 'tenant' in fields:
+            data['tenant'] = user.tenant
+        if 'profile' in fields:
+            data['profile'] = UserProfileSerializer(user).data
+        return MeSerializer(data, fields=fields).data
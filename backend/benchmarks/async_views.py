@@ -0,0 +1,53 @@
+"""
+Compare the sync DRF read endpoints with their native async variants.
+
+Start the ASGI app with a fixed worker count, then point this script at it::
+
+    uvicorn sports.asgi:application --workers 4 --port 8000
+    python -m benchmarks.async_views --token <access token> --requests 5000 --concurrency 64
+
+The access token must belong to a SUPERADMIN so every endpoint is readable.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+
+from .load import run_load
+
+
+ENDPOINTS = {
+    'me': 'me/',
+    'tenant-list': 'tenants/',
+    'tenant-detail': 'tenants/{tenant_id}/',
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--base-url', default='http://127.0.0.1:8000')
+    parser.add_argument('--token', required=True)
+    parser.add_argument('--tenant-id', type=int, default=1)
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--concurrency', type=int, default=32)
+    args = parser.parse_args()
+
+    headers = {'Authorization': f'Bearer {args.token}'}
+    report = {}
+    for name, path in ENDPOINTS.items():
+        path = path.format(tenant_id=args.tenant_id)
+        for variant, prefix in (('sync', '/api/v1/'), ('async', '/api/v1/async/')):
+            result = run_load(
+                f'{name}:{variant}',
+                f'{args.base_url}{prefix}{path}',
+                args.requests,
+                args.concurrency,
+                headers=headers,
+            )
+            report[result.name] = result.as_dict()
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == '__main__':
+    main()
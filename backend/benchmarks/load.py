@@ -0,0 +1,114 @@
+"""Small stdlib-only HTTP load generator shared by the benchmark scripts."""
+
+from __future__ import annotations
+
+import http.client
+import statistics
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable
+from urllib.parse import urlsplit
+
+
+@dataclass
+class Call:
+    method: str
+    path: str
+    headers: dict[str, str] = field(default_factory=dict)
+    body: bytes | None = None
+
+
+@dataclass
+class LoadResult:
+    name: str
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+    statuses: dict[int, int] = field(default_factory=dict)
+    elapsed: float = 0.0
+
+    def percentile(self, pct: float) -> float:
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+        return ordered[index]
+
+    def as_dict(self) -> dict:
+        return {
+            'requests': len(self.latencies) + self.errors,
+            'errors': self.errors,
+            'statuses': {str(code): count for code, count in sorted(self.statuses.items())},
+            'rps': round(len(self.latencies) / self.elapsed, 1) if self.elapsed else 0.0,
+            'mean_ms': round(statistics.fmean(self.latencies) * 1000, 2) if self.latencies else 0.0,
+            'p50_ms': round(self.percentile(50) * 1000, 2),
+            'p95_ms': round(self.percentile(95) * 1000, 2),
+            'p99_ms': round(self.percentile(99) * 1000, 2),
+        }
+
+
+def run_load(
+    name: str,
+    url: str,
+    requests: int,
+    concurrency: int,
+    method: str = 'GET',
+    headers: dict[str, str] | None = None,
+    body: bytes | None = None,
+    expected_status: tuple[int, ...] = (200,),
+    calls: Callable[[int], Call] | None = None,
+) -> LoadResult:
+    """
+    Send ``requests`` requests from ``concurrency`` keep-alive connections.
+
+    Every request goes to ``url`` unless ``calls`` is given, in which case
+    ``calls(n)`` builds the n-th request with a path relative to ``url``'s host.
+    """
+    parts = urlsplit(url)
+    default_path = parts.path + (f'?{parts.query}' if parts.query else '')
+    result = LoadResult(name)
+    lock = threading.Lock()
+    remaining = iter(range(requests))
+
+    def connect() -> http.client.HTTPConnection:
+        return http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=60)
+
+    def worker() -> None:
+        connection = connect()
+        latencies, errors, statuses = [], 0, {}
+        while True:
+            with lock:
+                number = next(remaining, None)
+            if number is None:
+                break
+            call = calls(number) if calls else Call(method, default_path, headers or {}, body)
+            started = time.perf_counter()
+            try:
+                connection.request(call.method, call.path, body=call.body, headers=call.headers)
+                response = connection.getresponse()
+                response.read()
+                statuses[response.status] = statuses.get(response.status, 0) + 1
+                ok = response.status in expected_status
+            except (OSError, http.client.HTTPException):
+                connection.close()
+                connection = connect()
+                ok = False
+            if ok:
+                latencies.append(time.perf_counter() - started)
+            else:
+                errors += 1
+        connection.close()
+        with lock:
+            result.latencies.extend(latencies)
+            result.errors += errors
+            for status, count in statuses.items():
+                result.statuses[status] = result.statuses.get(status, 0) + count
+
+    threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    result.elapsed = time.perf_counter() - started
+    return result
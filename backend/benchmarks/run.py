@@ -0,0 +1,200 @@
+"""
+Seed a throwaway database, start the API locally and drive the main user
+journeys against it, printing requests/sec and latency percentiles per
+scenario as JSON::
+
+    python -m benchmarks.run --output bench.json
+    python -m benchmarks.run --server runserver --tenants 100 --users 1000
+
+Runs use ``benchmarks.settings`` (SQLite in a temporary directory) unless
+``--settings`` names another module, e.g. one pointing at PostgreSQL.
+"""
+
+from __future__ import annotations
+
+import argparse
+import http.client
+import json
+import os
+import platform
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from .load import Call, run_load
+
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+
+def server_command(server: str, port: int, workers: int) -> list[str]:
+    if server == 'uvicorn':
+        return [
+            sys.executable, '-m', 'uvicorn', 'sports.asgi:application',
+            '--port', str(port), '--workers', str(workers), '--no-access-log', '--log-level', 'warning',
+        ]
+    return [sys.executable, 'manage.py', 'runserver', f'127.0.0.1:{port}', '--noreload']
+
+
+def wait_until_ready(base_url: str, process: subprocess.Popen, timeout: float = 60) -> None:
+    parts = urlsplit(base_url)
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f'Server exited with status {process.returncode}')
+        try:
+            connection = http.client.HTTPConnection(parts.hostname, parts.port, timeout=2)
+            connection.request('GET', '/api/v1/me/')
+            connection.getresponse().read()
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError('Server did not start in time')
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def git_revision() -> str | None:
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=BACKEND_DIR, text=True, stderr=subprocess.DEVNULL
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def json_call(method: str, path: str, payload: dict | None = None, token: str | None = None) -> Call:
+    headers = {'Content-Type': 'application/json', 'Host': 'localhost'}
+    if token:
+        headers['Authorization'] = f'Bearer {token}'
+    body = json.dumps(payload).encode('utf-8') if payload is not None else None
+    return Call(method, path, headers, body)
+
+
+def tenant_page_paths(base_url: str, token: str, page_size: int, pages: int) -> list[str]:
+    """Walk the cursor once so the benchmark can replay real page URLs."""
+    parts = urlsplit(base_url)
+    path, result = f'/api/v1/tenants/?page_size={page_size}', []
+    while path and len(result) < pages:
+        result.append(path)
+        connection = http.client.HTTPConnection(parts.hostname, parts.port, timeout=30)
+        call = json_call('GET', path, token=token)
+        connection.request(call.method, call.path, headers=call.headers)
+        next_url = json.loads(connection.getresponse().read())['next']
+        path = None
+        if next_url:
+            next_parts = urlsplit(next_url)
+            path = f'{next_parts.path}?{next_parts.query}'
+    return result
+
+
+def run_scenarios(base_url: str, data, args) -> dict:
+    from .seed import PASSWORD
+
+    results = {}
+    emails, tokens = data.member_emails, data.member_tokens
+
+    results['login-burst'] = run_load(
+        'login-burst', base_url, args.login_requests, args.concurrency,
+        calls=lambda n: json_call('POST', '/auth/login/', {'email': emails[n % len(emails)], 'password': PASSWORD}),
+    )
+    results['me-polling'] = run_load(
+        'me-polling', base_url, args.requests, args.concurrency,
+        calls=lambda n: json_call('GET', '/api/v1/me/', token=tokens[n % len(tokens)]),
+    )
+    pages = tenant_page_paths(base_url, data.superadmin_token, args.page_size, pages=200)
+    results['tenant-browsing'] = run_load(
+        'tenant-browsing', base_url, args.requests, args.concurrency,
+        calls=lambda n: json_call('GET', pages[n % len(pages)], token=data.superadmin_token),
+    )
+    invitations = data.invitation_tokens
+    results['accept-invite-storm'] = run_load(
+        'accept-invite-storm', base_url, len(invitations), args.concurrency, expected_status=(201,),
+        calls=lambda n: json_call(
+            'POST',
+            '/api/v1/owners/accept-invite/',
+            {'token': invitations[n], 'password': PASSWORD, 'first_name': 'Bench', 'last_name': f'Owner {n}'},
+        ),
+    )
+    return {name: result.as_dict() for name, result in results.items()}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--settings', default='benchmarks.settings')
+    parser.add_argument('--server', choices=('uvicorn', 'runserver'), default='uvicorn')
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--tenants', type=int, default=1000)
+    parser.add_argument('--users', type=int, default=10000)
+    parser.add_argument('--invitations', type=int, default=200)
+    parser.add_argument('--requests', type=int, default=5000, help='requests for the read scenarios')
+    parser.add_argument('--login-requests', type=int, default=300)
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--page-size', type=int, default=50)
+    parser.add_argument('--output', help='write the JSON report to this file as well')
+    args = parser.parse_args()
+
+    workdir = tempfile.TemporaryDirectory(prefix='sports-bench-')
+    os.environ['DJANGO_SETTINGS_MODULE'] = args.settings
+    os.environ.setdefault('BENCH_DB', str(Path(workdir.name) / 'bench.sqlite3'))
+    sys.path.insert(0, str(BACKEND_DIR))
+
+    import django
+    from django.core.management import call_command
+
+    django.setup()
+    call_command('migrate', verbosity=0)
+
+    from .seed import seed
+
+    started = time.perf_counter()
+    data = seed(args.tenants, args.users, args.invitations)
+    seed_seconds = round(time.perf_counter() - started, 2)
+
+    port = free_port()
+    base_url = f'http://127.0.0.1:{port}'
+    process = subprocess.Popen(
+        server_command(args.server, port, args.workers),
+        cwd=BACKEND_DIR,
+        env=os.environ.copy(),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        wait_until_ready(base_url, process)
+        results = run_scenarios(base_url, data, args)
+    finally:
+        process.terminate()
+        process.wait(timeout=30)
+        workdir.cleanup()
+
+    report = {
+        'meta': {
+            'revision': git_revision(),
+            'python': platform.python_version(),
+            'settings': args.settings,
+            'server': args.server,
+            'workers': args.workers if args.server == 'uvicorn' else 1,
+            'concurrency': args.concurrency,
+            'tenants': args.tenants,
+            'users': args.users,
+            'seed_seconds': seed_seconds,
+        },
+        'results': results,
+    }
+    output = json.dumps(report, indent=2)
+    print(output)
+    if args.output:
+        Path(args.output).write_text(output + '\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""Synthetic dataset for benchmark runs."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from django.utils import timezone
+
+from accounts.serializers import EmailTokenObtainPairSerializer
+from tenants.models import OwnerInvitation, Tenant
+
+
+PASSWORD = 'BenchPass123!'
+
+
+@dataclass
+class SeededData:
+    superadmin_token: str
+    member_emails: list[str] = field(default_factory=list)
+    member_tokens: list[str] = field(default_factory=list)
+    invitation_tokens: list[str] = field(default_factory=list)
+
+
+@transaction.atomic
+def seed(tenants: int, users: int, invitations: int, token_users: int = 200) -> SeededData:
+    """
+    Create ``tenants`` clubs, ``users`` members spread across them and
+    ``invitations`` pending owner invitations, and mint access tokens for
+    the first ``token_users`` members.
+    """
+    User = get_user_model()
+    # Hashing once keeps seeding fast; logins still verify it at full cost.
+    password_hash = make_password(PASSWORD)
+
+    clubs = Tenant.objects.bulk_create(
+        Tenant(name=f'Club {index:06d}', slug=f'club-{index:06d}') for index in range(tenants)
+    )
+    roles = (User.Role.OWNER, User.Role.COACH, User.Role.CLIENT, User.Role.CLIENT)
+    members = User.objects.bulk_create(
+        User(
+            email=f'member-{index:06d}@bench.example.com',
+            password=password_hash,
+            role=roles[index % len(roles)],
+            tenant=clubs[index % len(clubs)],
+        )
+        for index in range(users)
+    )
+    expires_at = timezone.now() + timedelta(days=7)
+    pending = OwnerInvitation.objects.bulk_create(
+        OwnerInvitation(
+            tenant=clubs[index % len(clubs)],
+            email=f'invitee-{index:06d}@bench.example.com',
+            token=f'bench-invitation-{index:06d}',
+            expires_at=expires_at,
+        )
+        for index in range(invitations)
+    )
+    superadmin = User.objects.create_superuser('superadmin@bench.example.com', PASSWORD)
+
+    def access_token(user) -> str:
+        return str(EmailTokenObtainPairSerializer.get_token(user).access_token)
+
+    return SeededData(
+        superadmin_token=access_token(superadmin),
+        member_emails=[member.email for member in members],
+        member_tokens=[access_token(member) for member in members[:token_users]],
+        invitation_tokens=[invitation.token for invitation in pending],
+    )
@@ -0,0 +1,91 @@
+"""
+Micro-benchmark of the tenant list serialization paths, in process::
+
+    python -m benchmarks.serialization
+    python -m benchmarks.serialization --rows 1000 10000 100000 --repeat 5
+
+For each row count it times fetching, serializing and rendering the rows
+with ``TenantSerializer`` + ``JSONRenderer`` and with ``values_list()`` +
+``tenant_rows`` + ``ORJSONRenderer``, and prints the best run of each as
+JSON. Both paths must produce the same bytes or the run fails.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+
+def best_of(repeat: int, func) -> tuple[float, object]:
+    best, result = float('inf'), None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def measure(rows: int, repeat: int) -> dict:
+    from rest_framework.renderers import JSONRenderer
+
+    from sports.renderers import ORJSONRenderer
+    from tenants.models import Tenant
+    from tenants.serializers import TenantSerializer, tenant_rows
+
+    queryset = Tenant.objects.order_by('name', 'id')[:rows]
+
+    def model_path():
+        data = TenantSerializer(list(queryset), many=True).data
+        return JSONRenderer().render(data)
+
+    def values_path():
+        data = tenant_rows.serialize(queryset.values_list(*tenant_rows.columns))
+        return ORJSONRenderer().render(data)
+
+    model_seconds, model_body = best_of(repeat, model_path)
+    values_seconds, values_body = best_of(repeat, values_path)
+    if model_body != values_body:
+        raise SystemExit(f'Output differs at {rows} rows')
+    return {
+        'rows': rows,
+        'model_serializer_ms': round(model_seconds * 1000, 2),
+        'values_orjson_ms': round(values_seconds * 1000, 2),
+        'speedup': round(model_seconds / values_seconds, 2),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--settings', default='benchmarks.settings')
+    parser.add_argument('--rows', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    workdir = tempfile.TemporaryDirectory(prefix='sports-bench-')
+    os.environ['DJANGO_SETTINGS_MODULE'] = args.settings
+    os.environ.setdefault('BENCH_DB', str(Path(workdir.name) / 'bench.sqlite3'))
+    sys.path.insert(0, str(BACKEND_DIR))
+
+    import django
+    from django.core.management import call_command
+
+    django.setup()
+    call_command('migrate', verbosity=0)
+
+    from .seed import seed
+
+    seed(max(args.rows), users=0, invitations=0, token_users=0)
+    print(json.dumps([measure(rows, args.repeat) for rows in args.rows], indent=2))
+    workdir.cleanup()
+
+
+if __name__ == '__main__':
+    main()
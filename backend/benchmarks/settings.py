@@ -0,0 +1,24 @@
+"""
+Self-contained settings for benchmark runs: a SQLite file instead of
+PostgreSQL and no debug overhead. ``BENCH_DB`` points the runner and the
+server it starts at the same database file.
+"""
+
+import os
+
+from sports.settings import *  # noqa: F401,F403
+from sports.settings import ALLOWED_HOSTS, BASE_DIR
+
+
+DEBUG = False
+ALLOWED_HOSTS = [*ALLOWED_HOSTS, '127.0.0.1']
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': os.getenv('BENCH_DB', str(BASE_DIR / 'benchmark.sqlite3')),
+        # Writers queue on SQLite's file lock instead of failing fast.
+        'OPTIONS': {'timeout': 30},
+    }
+}
+REPLICA_DATABASES = []
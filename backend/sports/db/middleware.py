@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import base64
+import json
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.cache import cache
+from django.urls import Resolver404, get_resolver
+from rest_framework_simplejwt.settings import api_settings
+
+from .routers import allows_replica_reads, replica_aliases, replica_reads
+
+
+PRIMARY_PIN_KEY = 'db:primary-pin:{client}'
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+
+def request_client(request) -> str | None:
+    """
+    Identify the client from the ``user_id`` claim of its bearer token.
+
+    The token is not verified here: the value only picks a database, and
+    authentication still rejects forged tokens.
+    """
+    header = request.META.get('HTTP_AUTHORIZATION', '')
+    try:
+        _, payload, _ = header.split(' ', 1)[1].split('.')
+        claims = json.loads(base64.urlsafe_b64decode(payload + '=' * (-len(payload) % 4)))
+        return str(claims[api_settings.USER_ID_CLAIM])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+def pin_seconds() -> int:
+    return getattr(settings, 'REPLICA_PIN_SECONDS', 5)
+
+
+def pin_cookie() -> str:
+    return getattr(settings, 'REPLICA_PIN_COOKIE', 'db_primary_pin')
+
+
+def replica_eligible(request) -> bool:
+    """Whether ``request`` is a safe request to a view marked for replica reads."""
+    if request.method not in SAFE_METHODS:
+        return False
+    try:
+        match = get_resolver(getattr(request, 'urlconf', None)).resolve(request.path_info)
+    except Resolver404:
+        return False
+    return allows_replica_reads(match.func, request.method)
+
+
+def pin_response(response) -> None:
+    # Clients without a bearer token (accept-invite, login, admin sessions)
+    # carry their pin in a short-lived cookie.
+    response.set_cookie(
+        pin_cookie(),
+        '1',
+        max_age=pin_seconds(),
+        httponly=True,
+        samesite='Lax',
+        secure=settings.SESSION_COOKIE_SECURE,
+    )
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Serve safe requests to replica-safe views from the replicas, and keep a
+    client on the primary for ``REPLICA_PIN_SECONDS`` after any write it
+    makes, so it reads its own writes despite replication lag. The pin is
+    keyed on the bearer token's user and also set as a cookie.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not replica_aliases():
+            return self.get_response(request)
+
+        client = request_client(request)
+        if request.method not in SAFE_METHODS:
+            response = self.get_response(request)
+            if response.status_code < 500:
+                if client is not None:
+                    cache.set(PRIMARY_PIN_KEY.format(client=client), True, pin_seconds())
+                pin_response(response)
+            return response
+
+        pinned = pin_cookie() in request.COOKIES or (
+            client is not None and cache.get(PRIMARY_PIN_KEY.format(client=client))
+        )
+        with replica_reads(not pinned and replica_eligible(request)):
+            return self.get_response(request)
+
+    async def __acall__(self, request):
+        if not replica_aliases():
+            return await self.get_response(request)
+
+        client = request_client(request)
+        if request.method not in SAFE_METHODS:
+            response = await self.get_response(request)
+            if response.status_code < 500:
+                if client is not None:
+                    await cache.aset(PRIMARY_PIN_KEY.format(client=client), True, pin_seconds())
+                pin_response(response)
+            return response
+
+        pinned = pin_cookie() in request.COOKIES or (
+            client is not None and await cache.aget(PRIMARY_PIN_KEY.format(client=client))
+        )
+        with replica_reads(not pinned and replica_eligible(request)):
+            return await self.get_response(request)
@@ -0,0 +1,47 @@
+"""
+Migration operations for PostgreSQL-only schema features.
+
+SQLite runs the test suite and the benchmarks, so operations such as
+trigram indexes must still update the migration state there while leaving
+the schema untouched.
+"""
+
+from __future__ import annotations
+
+from django.db.migrations.operations.base import Operation
+
+
+class PostgreSQLOnly(Operation):
+    """Apply ``operation`` to the migration state everywhere, and to the schema on PostgreSQL only."""
+
+    def __init__(self, operation: Operation):
+        self.operation = operation
+
+    def deconstruct(self):
+        return self.__class__.__qualname__, [self.operation], {}
+
+    @property
+    def reversible(self) -> bool:
+        return self.operation.reversible
+
+    @property
+    def reduces_to_sql(self) -> bool:
+        return self.operation.reduces_to_sql
+
+    def state_forwards(self, app_label, state):
+        self.operation.state_forwards(app_label, state)
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == 'postgresql':
+            self.operation.database_forwards(app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == 'postgresql':
+            self.operation.database_backwards(app_label, schema_editor, from_state, to_state)
+
+    def describe(self) -> str:
+        return f'{self.operation.describe()} (PostgreSQL only)'
+
+    @property
+    def migration_name_fragment(self) -> str | None:
+        return self.operation.migration_name_fragment
@@ -0,0 +1,44 @@
+"""
+Admin changelist pagination that does not count large tables.
+
+An exact ``COUNT(*)`` reads the whole table on PostgreSQL. For unfiltered
+changelists of tables past ``ADMIN_EXACT_COUNT_LIMIT`` rows, the planner's
+estimate from ``pg_class.reltuples`` (kept fresh by autovacuum/ANALYZE) is
+close enough to number the pages.
+"""
+
+from __future__ import annotations
+
+from django.conf import settings
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import QuerySet
+from django.utils.functional import cached_property
+
+
+def estimated_row_count(queryset: QuerySet) -> int | None:
+    """Planner estimate of the rows in ``queryset``'s table, or ``None`` if unknown."""
+    connection = connections[queryset.db]
+    if connection.vendor != 'postgresql':
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(%s)',
+            [connection.ops.quote_name(queryset.model._meta.db_table)],
+        )
+        row = cursor.fetchone()
+    # -1 until the table is first analyzed (PostgreSQL 14+).
+    if row is None or row[0] is None or row[0] < 0:
+        return None
+    return row[0]
+
+
+class EstimatedCountPaginator(Paginator):
+    @cached_property
+    def count(self) -> int:
+        queryset = self.object_list
+        if isinstance(queryset, QuerySet) and not queryset.query.where:
+            estimate = estimated_row_count(queryset)
+            if estimate is not None and estimate > getattr(settings, 'ADMIN_EXACT_COUNT_LIMIT', 100_000):
+                return estimate
+        return super().count
@@ -0,0 +1,116 @@
+"""
+PostgreSQL backend that checks connections out of a per-process
+``psycopg_pool.ConnectionPool`` instead of opening one per request.
+
+Django closes the connection at the end of every request (``CONN_MAX_AGE=0``);
+here closing hands it back to the pool, so requests skip the TCP and auth
+handshake. Pool arguments come from ``OPTIONS['pool']`` and are passed to
+``ConnectionPool`` as-is (``min_size``, ``max_size``, ``timeout``, ...).
+With ``CONN_HEALTH_CHECKS`` enabled the pool pings a connection before
+handing it out.
+"""
+
+from __future__ import annotations
+
+import threading
+
+from django.core.exceptions import ImproperlyConfigured
+from django.db import NO_DB_ALIAS
+from django.db.backends.postgresql import base
+from django.db.backends.postgresql.psycopg_any import IsolationLevel, is_psycopg3
+
+try:
+    from psycopg_pool import ConnectionPool
+except ImportError as exc:  # pragma: no cover
+    raise ImproperlyConfigured('Error loading psycopg_pool module: %s' % exc)
+
+
+_pools: dict[str, tuple[tuple, ConnectionPool]] = {}
+_pools_lock = threading.Lock()
+
+
+def pool_stats() -> dict[str, dict[str, int]]:
+    """Return ``ConnectionPool.get_stats()`` for every pool opened in this process."""
+    with _pools_lock:
+        pools = {alias: pool for alias, (_, pool) in _pools.items()}
+    return {alias: pool.get_stats() for alias, pool in pools.items()}
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._connection_pool = None
+
+    @property
+    def pool_options(self) -> dict | None:
+        if self.alias == NO_DB_ALIAS:
+            return None
+        return self.settings_dict['OPTIONS'].get('pool') or None
+
+    @property
+    def pool(self) -> ConnectionPool | None:
+        options = self.pool_options
+        if options is None:
+            return None
+        if not is_psycopg3:
+            raise ImproperlyConfigured('Connection pooling requires psycopg 3.')
+        if self.settings_dict['CONN_MAX_AGE'] != 0:
+            raise ImproperlyConfigured('Pooled connections cannot be combined with CONN_MAX_AGE.')
+
+        conn_params = self.get_connection_params()
+        # The test runner swaps NAME for the test database after startup, so
+        # the pool is rebuilt whenever the target database changes.
+        key = tuple(sorted((k, str(v)) for k, v in conn_params.items() if k != 'context'))
+        with _pools_lock:
+            current = _pools.get(self.alias)
+            if current is not None and current[0] == key:
+                return current[1]
+            pool = ConnectionPool(
+                kwargs=conn_params,
+                open=False,
+                check=ConnectionPool.check_connection if self.settings_dict['CONN_HEALTH_CHECKS'] else None,
+                name=self.alias,
+                **options,
+            )
+            _pools[self.alias] = (key, pool)
+        if current is not None:
+            current[1].close()
+        return pool
+
+    def get_connection_params(self):
+        conn_params = super().get_connection_params()
+        conn_params.pop('pool', None)
+        return conn_params
+
+    def get_new_connection(self, conn_params):
+        pool = self.pool
+        if pool is None:
+            return super().get_new_connection(conn_params)
+
+        # Mirrors the isolation level handling of the parent backend.
+        isolation_level = self.settings_dict['OPTIONS'].get('isolation_level')
+        try:
+            self.isolation_level = IsolationLevel(
+                IsolationLevel.READ_COMMITTED if isolation_level is None else isolation_level
+            )
+        except ValueError:
+            raise ImproperlyConfigured(
+                f'Invalid transaction isolation level {isolation_level} specified. '
+                f'Use one of the psycopg.IsolationLevel values.'
+            )
+        pool.open()
+        connection = pool.getconn()
+        if isolation_level is not None:
+            connection.isolation_level = self.isolation_level
+        self._connection_pool = pool
+        return connection
+
+    def _close(self):
+        if self.connection is None or self._connection_pool is None:
+            return super()._close()
+        with self.wrap_database_errors:
+            # The pool rolls back anything left open and discards broken
+            # connections instead of handing them out again.
+            self._connection_pool.putconn(self.connection)
+        self.connection = None
+        self._connection_pool = None
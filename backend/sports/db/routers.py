@@ -0,0 +1,81 @@
+"""
+Primary/replica routing.
+
+Reads go to a replica only while ``replica_reads()`` is active, which
+``ReplicaRoutingMiddleware`` does for safe requests to views marked with
+``replica_safe`` (or a viewset's ``replica_read_actions``) from clients that
+have not written recently. Everything else, including the admin, management
+commands and background workers, reads from the primary.
+"""
+
+from __future__ import annotations
+
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+
+
+_replica_reads: ContextVar[bool] = ContextVar('replica_reads', default=False)
+
+
+def replica_aliases() -> list[str]:
+    return list(getattr(settings, 'REPLICA_DATABASES', []))
+
+
+@contextmanager
+def replica_reads(enabled: bool = True) -> Iterator[None]:
+    token = _replica_reads.set(enabled)
+    try:
+        yield
+    finally:
+        _replica_reads.reset(token)
+
+
+def replica_safe(view):
+    """
+    Let ``ReplicaRoutingMiddleware`` serve safe requests for ``view`` (a view
+    function or ``APIView`` class) from the replicas. Viewsets list their
+    eligible actions in ``replica_read_actions`` instead.
+    """
+    view.replica_reads = True
+    return view
+
+
+def allows_replica_reads(view_func, method: str) -> bool:
+    cls = getattr(view_func, 'cls', None)
+    actions = getattr(view_func, 'actions', None)
+    if cls is not None and actions is not None:
+        return actions.get(method.lower()) in getattr(cls, 'replica_read_actions', ())
+    return getattr(cls or view_func, 'replica_reads', False)
+
+
+def primary_reads():
+    """Force reads back to the primary, e.g. for data about to be cached."""
+    return replica_reads(False)
+
+
+class PrimaryReplicaRouter:
+    def db_for_read(self, model, **hints):
+        replicas = replica_aliases()
+        if replicas and _replica_reads.get():
+            return random.choice(replicas)
+        return DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        # Explicit so that saving an instance loaded from a replica does not
+        # fall back to ``instance._state.db``.
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        databases = {DEFAULT_DB_ALIAS, *replica_aliases()}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # Replicas receive the schema through replication.
+        return db not in replica_aliases()
@@ -0,0 +1,54 @@
+"""
+Sparse fieldsets: ``?fields=id,name`` keeps only some fields of a response,
+and the view uses the same names to narrow the columns it selects.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db import models
+from rest_framework.exceptions import ValidationError
+
+
+FIELDS_QUERY_PARAM = 'fields'
+
+
+def requested_fields(request, available: Iterable[str]) -> tuple[str, ...] | None:
+    """
+    Return the fields named by ``?fields=``, in the order of ``available``,
+    or ``None`` when the parameter is absent or empty.
+    """
+    raw = request.query_params.get(FIELDS_QUERY_PARAM, '')
+    names = {name.strip() for name in raw.split(',') if name.strip()}
+    if not names:
+        return None
+    available = tuple(available)
+    unknown = sorted(names.difference(available))
+    if unknown:
+        raise ValidationError({FIELDS_QUERY_PARAM: [f"Unknown field(s): {', '.join(unknown)}."]})
+    return tuple(name for name in available if name in names)
+
+
+def concrete_columns(model: type[models.Model], names: Iterable[str]) -> tuple[str, ...]:
+    """The ``names`` that are concrete columns of ``model``, ready for ``only()``."""
+    columns = []
+    for name in names:
+        try:
+            field = model._meta.get_field(name)
+        except FieldDoesNotExist:
+            continue
+        if field.concrete:
+            columns.append(name)
+    return tuple(columns)
+
+
+class SparseFieldsMixin:
+    """Serializer mixin accepting ``fields=`` to keep only some of the declared fields."""
+
+    def __init__(self, *args, fields: Iterable[str] | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields).difference(fields):
+                self.fields.pop(name)
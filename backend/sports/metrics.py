@@ -0,0 +1,239 @@
+"""
+Per-request timings and a small in-process Prometheus registry.
+
+``RequestMetricsMiddleware`` opens a ``RequestTimings`` for each request;
+SQL executed on any connection, claims authentication and serializer
+``.data`` calls add to it through ``timed()``. The totals go out as a
+``Server-Timing`` header and into per-route histograms rendered by
+``metrics_view`` in the Prometheus text format. Values are per process:
+scrape every worker, or aggregate them upstream.
+"""
+
+from __future__ import annotations
+
+import math
+import sys
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Iterator
+
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils.crypto import constant_time_compare
+
+
+SECONDS_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+
+@dataclass
+class RequestTimings:
+    db_queries: int = 0
+    phases: dict[str, float] = field(default_factory=dict)
+    _open: set[str] = field(default_factory=set)
+
+
+_current: ContextVar[RequestTimings | None] = ContextVar('request_timings', default=None)
+
+
+def current_timings() -> RequestTimings | None:
+    return _current.get()
+
+
+@contextmanager
+def collect_timings() -> Iterator[RequestTimings]:
+    timings = RequestTimings()
+    token = _current.set(timings)
+    try:
+        yield timings
+    finally:
+        _current.reset(token)
+
+
+@contextmanager
+def timed(phase: str) -> Iterator[None]:
+    """Add the wall time of the block to ``phase``; nested blocks of the same phase count once."""
+    timings = _current.get()
+    if timings is None or phase in timings._open:
+        yield
+        return
+    timings._open.add(phase)
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.phases[phase] = timings.phases.get(phase, 0.0) + time.perf_counter() - started
+        timings._open.discard(phase)
+
+
+def record_sql(execute, sql, params, many, context):
+    """``connection.execute_wrapper`` hook counting and timing queries."""
+    timings = _current.get()
+    if timings is None:
+        return execute(sql, params, many, context)
+    timings.db_queries += 1
+    with timed('db'):
+        return execute(sql, params, many, context)
+
+
+def instrument_serializers() -> None:
+    """Time ``BaseSerializer.data``, where DRF turns instances into primitives."""
+    from rest_framework.serializers import BaseSerializer
+
+    data = BaseSerializer.data
+    if getattr(data.fget, 'timed', False):
+        return
+
+    def timed_data(self):
+        with timed('serialize'):
+            return data.fget(self)
+
+    timed_data.timed = True
+    BaseSerializer.data = property(timed_data)
+
+
+def _escape(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(names: tuple[str, ...], values: tuple, extra: str = '') -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _number(value: float) -> str:
+    if value == math.inf:
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    def __init__(self, name: str, help_text: str, labels: tuple[str, ...]):
+        self.name, self.help_text, self.labels = name, help_text, labels
+        self._values: dict[tuple, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, labels: tuple, amount: float = 1) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def render(self) -> list[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        lines = [f'# HELP {self.name} {self.help_text}', f'# TYPE {self.name} counter']
+        lines += [f'{self.name}{_labels(self.labels, key)} {_number(value)}' for key, value in values]
+        return lines
+
+
+class Histogram:
+    def __init__(self, name: str, help_text: str, labels: tuple[str, ...], buckets: tuple[float, ...]):
+        self.name, self.help_text, self.labels = name, help_text, labels
+        self.buckets = tuple(buckets) + (math.inf,)
+        self._series: dict[tuple, list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, labels: tuple, value: float) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [[0] * len(self.buckets), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def render(self) -> list[str]:
+        with self._lock:
+            snapshot = sorted((key, (list(counts), total, count)) for key, (counts, total, count) in self._series.items())
+        lines = [f'# HELP {self.name} {self.help_text}', f'# TYPE {self.name} histogram']
+        for key, (counts, total, count) in snapshot:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                le = f'le="{_number(bound)}"'
+                lines.append(f'{self.name}_bucket{_labels(self.labels, key, le)} {cumulative}')
+            lines.append(f'{self.name}_sum{_labels(self.labels, key)} {_number(total)}')
+            lines.append(f'{self.name}_count{_labels(self.labels, key)} {count}')
+        return lines
+
+
+ROUTE_LABELS = ('route', 'method')
+
+REQUESTS = Counter('http_requests_total', 'Requests served.', ('route', 'method', 'status'))
+DURATION = Histogram('http_request_duration_seconds', 'Total time in the Django stack.', ROUTE_LABELS, SECONDS_BUCKETS)
+DB_TIME = Histogram('http_request_db_seconds', 'Time spent executing SQL.', ROUTE_LABELS, SECONDS_BUCKETS)
+DB_QUERIES = Histogram('http_request_db_queries', 'SQL queries executed.', ROUTE_LABELS, COUNT_BUCKETS)
+AUTH_TIME = Histogram('http_request_auth_seconds', 'Time spent authenticating.', ROUTE_LABELS, SECONDS_BUCKETS)
+SERIALIZE_TIME = Histogram(
+    'http_request_serialize_seconds', 'Time spent in serializers, including the SQL they trigger.',
+    ROUTE_LABELS, SECONDS_BUCKETS,
+)
+REQUEST_METRICS = (REQUESTS, DURATION, DB_TIME, DB_QUERIES, AUTH_TIME, SERIALIZE_TIME)
+
+
+def observe_request(route: str, method: str, status: int, total: float, timings: RequestTimings) -> None:
+    labels = (route, method)
+    REQUESTS.inc((route, method, str(status)))
+    DURATION.observe(labels, total)
+    DB_TIME.observe(labels, timings.phases.get('db', 0.0))
+    DB_QUERIES.observe(labels, timings.db_queries)
+    AUTH_TIME.observe(labels, timings.phases.get('auth', 0.0))
+    SERIALIZE_TIME.observe(labels, timings.phases.get('serialize', 0.0))
+
+
+def server_timing(total: float, timings: RequestTimings) -> str:
+    entries = [f'db;dur={timings.phases.get("db", 0.0) * 1000:.1f};desc="{timings.db_queries} queries"']
+    for phase in ('auth', 'serialize'):
+        if phase in timings.phases:
+            entries.append(f'{phase};dur={timings.phases[phase] * 1000:.1f}')
+    entries.append(f'total;dur={total * 1000:.1f}')
+    return ', '.join(entries)
+
+
+def _sample_lines(
+    name: str, help_text: str, samples: list[tuple[tuple[str, ...], tuple, float]], kind: str = 'gauge'
+) -> list[str]:
+    lines = [f'# HELP {name} {help_text}', f'# TYPE {name} {kind}']
+    lines += [f'{name}{_labels(names, values)} {_number(value)}' for names, values, value in samples]
+    return lines
+
+
+def render_metrics() -> str:
+    lines: list[str] = []
+    for metric in REQUEST_METRICS:
+        lines += metric.render()
+
+    from tenants.cache import cache_stats
+
+    cache_events = [
+        (('namespace', 'outcome'), tuple(key.rsplit('.', 1)), value) for key, value in sorted(cache_stats().items())
+    ]
+    lines += _sample_lines('response_cache_events_total', 'Versioned response cache hits and misses.', cache_events, 'counter')
+
+    # Only report pools when the pooled backend is actually in use.
+    pooled = sys.modules.get('sports.db.postgresql_pool.base')
+    if pooled is not None:
+        pool_samples = [
+            (('alias', 'stat'), (alias, stat), value)
+            for alias, stats in sorted(pooled.pool_stats().items())
+            for stat, value in sorted(stats.items())
+        ]
+        lines += _sample_lines('db_pool', 'psycopg_pool statistics per database alias.', pool_samples)
+    return '\n'.join(lines) + '\n'
+
+
+def metrics_view(request):
+    expected = getattr(settings, 'METRICS_TOKEN', '')
+    if not expected:
+        # Unconfigured: only open while developing locally.
+        if not settings.DEBUG:
+            return HttpResponse(status=403)
+    elif not constant_time_compare(request.headers.get('Authorization', ''), f'Bearer {expected}'):
+        return HttpResponse(status=401)
+    return HttpResponse(render_metrics(), content_type='text/plain; version=0.0.4; charset=utf-8')
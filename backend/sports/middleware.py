@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+from .metrics import collect_timings, instrument_serializers, observe_request, record_sql, server_timing
+
+
+def _install_sql_hook(connection, **kwargs) -> None:
+    if record_sql not in connection.execute_wrappers:
+        connection.execute_wrappers.append(record_sql)
+
+
+class RequestMetricsMiddleware:
+    """
+    Time each request, its SQL, authentication and serialization, answer
+    with a ``Server-Timing`` header and feed the ``/metrics`` histograms.
+
+    Keep it first in ``MIDDLEWARE`` so the total covers the whole stack.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+        instrument_serializers()
+        connection_created.connect(_install_sql_hook, dispatch_uid='request-metrics-sql')
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        with collect_timings() as timings:
+            started = time.perf_counter()
+            for connection in connections.all(initialized_only=True):
+                _install_sql_hook(connection)
+            response = self.get_response(request)
+            self._finish(request, response, time.perf_counter() - started, timings)
+        return response
+
+    async def __acall__(self, request):
+        with collect_timings() as timings:
+            started = time.perf_counter()
+            response = await self.get_response(request)
+            self._finish(request, response, time.perf_counter() - started, timings)
+        return response
+
+    def _finish(self, request, response, total, timings) -> None:
+        match = getattr(request, 'resolver_match', None)
+        route = (match.view_name or match.route) if match is not None else 'unmatched'
+        observe_request(route, request.method, response.status_code, total, timings)
+        response['Server-Timing'] = server_timing(total, timings)
@@ -0,0 +1,53 @@
+"""
+orjson-backed JSON renderer and parser.
+
+Both are drop-in replacements for DRF's ``JSONRenderer``/``JSONParser``:
+same media type, same compact UTF-8 output and the same error messages.
+"""
+
+from __future__ import annotations
+
+import codecs
+
+import orjson
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+
+class ORJSONRenderer(JSONRenderer):
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        renderer_context = renderer_context or {}
+        if not self.compact or self.ensure_ascii or self.get_indent(accepted_media_type, renderer_context):
+            # Pretty-printed (browsable API, ``; indent=``) or ASCII output is
+            # not on the hot path; keep the stdlib formatting for it.
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # The DRF encoder covers what orjson does not: lazy strings, Decimal,
+        # querysets, timedeltas, ... Integer keys (owners by tenant id) are
+        # stringified like ``json.dumps`` does.
+        ret = orjson.dumps(data, default=self.encoder_class().default, option=orjson.OPT_NON_STR_KEYS)
+        # Same strict JavaScript subset as ``JSONRenderer``.
+        if b'\xe2\x80\xa8' in ret or b'\xe2\x80\xa9' in ret:
+            ret = ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+        return ret
+
+
+class ORJSONParser(JSONParser):
+    renderer_class = ORJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+
+        try:
+            raw = stream.read()
+            if codecs.lookup(encoding).name != 'utf-8':
+                raw = raw.decode(encoding)
+            # orjson always rejects NaN/Infinity, as ``STRICT_JSON`` does.
+            return orjson.loads(raw)
+        except ValueError as exc:
+            raise ParseError('JSON parse error - %s' % str(exc))
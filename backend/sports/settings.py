@@ -14,6 +14,8 @@ import os
 from datetime import timedelta
 from pathlib import Path
 
+from corsheaders.defaults import default_headers
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -27,8 +29,14 @@ SECRET_KEY = 'django-insecure-i)raxg*(azsovf^b4!ixjd%88#j6_s&e#7yxhc4#%src@u77b(
 # SECURITY WARNING: don't run with debug turned on in production!
 DEBUG = True
 
-ALLOWED_HOSTS = [ 'localhost']
+# Tenants are resolved from <slug>.TENANT_BASE_DOMAIN or the X-Tenant header.
+TENANT_BASE_DOMAIN = os.getenv('TENANT_BASE_DOMAIN', 'localhost')
+TENANT_CACHE_SIZE = int(os.getenv('TENANT_CACHE_SIZE', '1024'))
+TENANT_CACHE_TTL = int(os.getenv('TENANT_CACHE_TTL', '60'))
+
+ALLOWED_HOSTS = [ 'localhost', f'.{TENANT_BASE_DOMAIN}']
 CORS_ALLOW_ALL_ORIGINS = True
+CORS_ALLOW_HEADERS = (*default_headers, 'x-tenant')
 CORS_ALLOWED_ORIGINS = ["http://localhost:4200"]
 CSRF_TRUSTED_ORIGINS = ["http://localhost:4200"]
 # Application definition
@@ -48,10 +56,13 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'sports.middleware.RequestMetricsMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
+    'sports.db.middleware.ReplicaRoutingMiddleware',
+    'tenants.middleware.TenantResolutionMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
@@ -81,18 +92,74 @@ WSGI_APPLICATION = 'sports.wsgi.application'
 
 # Database
 # https://docs.djangoproject.com/en/4.2/ref/settings/#databases
+# Connections come from a psycopg_pool pool per process; the pool sizes apply
+# to each WSGI/ASGI worker. Set DB_POOL=false to connect per request instead.
 
 DATABASES = {
     'default': {
-        'ENGINE': 'django.db.backends.postgresql',
+        'ENGINE': 'sports.db.postgresql_pool',
         'NAME': os.getenv('DB_NAME', 'sports'),
         'USER': os.getenv('DB_USER', 'postgres'),
         'PASSWORD': os.getenv('DB_PASSWORD', '0000'),
         'HOST': os.getenv('DB_HOST', '127.0.0.1'),
         'PORT': os.getenv('DB_PORT', '5432'),
+        'CONN_HEALTH_CHECKS': True,
+        'OPTIONS': {},
+    }
+}
+
+if os.getenv('DB_POOL', 'true').lower() == 'true':
+    DATABASES['default']['OPTIONS']['pool'] = {
+        'min_size': int(os.getenv('DB_POOL_MIN_SIZE', '2')),
+        'max_size': int(os.getenv('DB_POOL_MAX_SIZE', '10')),
+        'timeout': float(os.getenv('DB_POOL_TIMEOUT', '10')),
+        'max_idle': float(os.getenv('DB_POOL_MAX_IDLE', '600')),
+    }
+
+# Read replicas as host[:port][/name], e.g. DB_REPLICA_HOSTS=replica-1,replica-2:5433.
+# Safe requests to the API read views (tenant list/detail, /me) read from them;
+# a client that wrote stays on the primary for REPLICA_PIN_SECONDS so it reads
+# its own writes.
+REPLICA_DATABASES = []
+for index, replica in enumerate(filter(None, os.getenv('DB_REPLICA_HOSTS', '').split(',')), start=1):
+    location, _, replica_name = replica.strip().partition('/')
+    replica_host, _, replica_port = location.partition(':')
+    alias = f'replica_{index}'
+    DATABASES[alias] = {
+        **DATABASES['default'],
+        'NAME': replica_name or DATABASES['default']['NAME'],
+        'HOST': replica_host,
+        'PORT': replica_port or DATABASES['default']['PORT'],
+        'OPTIONS': dict(DATABASES['default']['OPTIONS']),
+        'TEST': {'MIRROR': 'default'},
+    }
+    REPLICA_DATABASES.append(alias)
+
+DATABASE_ROUTERS = ['sports.db.routers.PrimaryReplicaRouter']
+REPLICA_PIN_SECONDS = int(os.getenv('REPLICA_PIN_SECONDS', '5'))
+# Carries the pin for clients without a bearer token (sessions, accept-invite).
+REPLICA_PIN_COOKIE = 'db_primary_pin'
+
+
+# Cache
+# The local-memory cache is per process; point REDIS_URL at a shared instance
+# when running several workers so response-cache invalidation and token
+# revocation reach all of them. Without one, token versions are only cached for
+# a few seconds and `check --deploy` warns (accounts.W001).
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'OPTIONS': {'MAX_ENTRIES': 10000},
     }
 }
 
+if os.getenv('REDIS_URL'):
+    CACHES['default'] = {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': os.getenv('REDIS_URL'),
+    }
+
 
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
@@ -137,15 +204,52 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 AUTH_USER_MODEL = 'accounts.User'
 
+AUTHENTICATION_BACKENDS = ['accounts.backends.EmailBackend']
+
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'accounts.authentication.ClaimsJWTAuthentication',
     ),
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.IsAuthenticated',
     ),
+    'DEFAULT_RENDERER_CLASSES': (
+        'sports.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
+    'DEFAULT_PARSER_CLASSES': (
+        'sports.renderers.ORJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ),
 }
 
+# Email
+# Invitation emails are queued in an outbox and sent by
+# ``python manage.py send_invitation_emails``.
+
+EMAIL_BACKEND = os.getenv('EMAIL_BACKEND', 'django.core.mail.backends.console.EmailBackend')
+EMAIL_HOST = os.getenv('EMAIL_HOST', 'localhost')
+EMAIL_PORT = int(os.getenv('EMAIL_PORT', '25'))
+EMAIL_HOST_USER = os.getenv('EMAIL_HOST_USER', '')
+EMAIL_HOST_PASSWORD = os.getenv('EMAIL_HOST_PASSWORD', '')
+EMAIL_USE_TLS = os.getenv('EMAIL_USE_TLS', 'false').lower() == 'true'
+DEFAULT_FROM_EMAIL = os.getenv('DEFAULT_FROM_EMAIL', 'no-reply@localhost')
+FRONTEND_URL = os.getenv('FRONTEND_URL', 'http://localhost:4200')
+
+INVITATION_RETENTION_DAYS = int(os.getenv('INVITATION_RETENTION_DAYS', '90'))
+
+# Bearer token required by /metrics. When empty the endpoint answers 403,
+# except under DEBUG.
+METRICS_TOKEN = os.getenv('METRICS_TOKEN', '')
+
+# Unfiltered admin changelists of tables estimated above this many rows show
+# the pg_class.reltuples estimate instead of running COUNT(*).
+ADMIN_EXACT_COUNT_LIMIT = int(os.getenv('ADMIN_EXACT_COUNT_LIMIT', '100000'))
+
+TENANTS_PAGE_SIZE = int(os.getenv('TENANTS_PAGE_SIZE', '50'))
+TENANTS_MAX_PAGE_SIZE = int(os.getenv('TENANTS_MAX_PAGE_SIZE', '500'))
+
 SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(minutes=30),
     'REFRESH_TOKEN_LIFETIME': timedelta(days=7),
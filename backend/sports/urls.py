@@ -17,13 +17,27 @@ Including another URLconf
 from django.contrib import admin
 from django.urls import include, path
 
+from accounts import async_views as accounts_async_views
+from tenants import async_views as tenants_async_views
+
+from .metrics import metrics_view
+
 api_patterns = [
     path('', include('tenants.urls')),
     path('', include('accounts.api_urls')),
 ]
 
+# Native async variants of the read endpoints, meant for the ASGI deployment.
+async_api_patterns = [
+    path('me/', accounts_async_views.me, name='async-me'),
+    path('tenants/', tenants_async_views.tenant_list, name='async-tenant-list'),
+    path('tenants/<int:pk>/', tenants_async_views.tenant_detail, name='async-tenant-detail'),
+]
+
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('auth/', include('accounts.urls', namespace='accounts')),
     path('api/v1/', include(api_patterns)),
+    path('api/v1/async/', include(async_api_patterns)),
+    path('metrics', metrics_view, name='metrics'),
 ]
@@ -1,17 +1,38 @@
 from django.contrib import admin
 
-from .models import OwnerInvitation, Tenant
+from sports.db.pagination import EstimatedCountPaginator
+
+from .models import SEARCH_FIELDS, InvitationEmail, OwnerInvitation, Tenant
 
 
 @admin.register(Tenant)
 class TenantAdmin(admin.ModelAdmin):
     list_display = ('name', 'slug', 'is_active', 'contact_email')
-    search_fields = ('name', 'slug', 'contact_email')
+    # icontains lookups, served by the trigram indexes on PostgreSQL.
+    search_fields = SEARCH_FIELDS
     list_filter = ('is_active',)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
 
 
 @admin.register(OwnerInvitation)
 class OwnerInvitationAdmin(admin.ModelAdmin):
     list_display = ('tenant', 'email', 'status', 'expires_at', 'created_at')
-    list_filter = ('status', 'tenant')
+    list_select_related = ('tenant',)
+    # A tenant list filter would render every tenant; search by tenant name instead.
+    list_filter = ('status',)
     search_fields = ('email', 'tenant__name')
+    autocomplete_fields = ('tenant',)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+
+@admin.register(InvitationEmail)
+class InvitationEmailAdmin(admin.ModelAdmin):
+    list_display = ('invitation', 'status', 'attempts', 'next_attempt_at', 'sent_at')
+    list_filter = ('status',)
+    list_select_related = ('invitation__tenant',)
+    search_fields = ('invitation__email',)
+    raw_id_fields = ('invitation',)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
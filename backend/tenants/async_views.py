@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from django.contrib.auth import get_user_model
+from django.http import Http404, JsonResponse
+from rest_framework.request import Request
+
+from accounts.async_views import async_api_view
+from accounts.permissions import IsSuperAdmin
+
+from .cache import acached_response
+from .filters import TenantSearchFilter
+from .models import Tenant
+from .pagination import TenantCursorPagination
+from .serializers import OWNER_FIELDS, TenantDetailSerializer
+from .views import tenant_list_rows, tenants_visible_to
+
+
+User = get_user_model()
+
+
+@async_api_view(IsSuperAdmin)
+async def tenant_list(request):
+    # Same filters, ``?fields=`` and cursor columns as TenantViewSet.list.
+    query = Request(request)
+    paginator = TenantCursorPagination()
+    queryset = TenantSearchFilter().filter_list(query, tenants_visible_to(request.user))
+    _fields, rows, _columns, values = tenant_list_rows(query, paginator, queryset)
+    page = await paginator.apaginate_queryset(values, query)
+    data = rows.serialize(page)
+    return JsonResponse(paginator.get_paginated_response(data).data)
+
+
+@async_api_view()
+async def tenant_detail(request, pk: int):
+    async def build():
+        try:
+            tenant = await tenants_visible_to(request.user).aget(pk=pk)
+        except Tenant.DoesNotExist as exc:
+            raise Http404 from exc
+        owners = User.scoped.filter(tenant_id=pk, role=User.Role.OWNER).only(*OWNER_FIELDS).order_by('email')
+        tenant.prefetched_owners = [owner async for owner in owners]
+        return TenantDetailSerializer(tenant).data
+
+    # Same visibility rule as TenantViewSet.retrieve before touching the cache.
+    user = request.user
+    if user.role != User.Role.SUPERADMIN and not (user.role == User.Role.OWNER and user.tenant_id == pk):
+        raise Http404
+    payload = await acached_response('tenant-detail', build, tenant_id=pk)
+    return JsonResponse(payload)
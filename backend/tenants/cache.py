@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import Counter
+from typing import Any, Awaitable, Callable
+
+from django.core.cache import cache
+from django.db import transaction
+
+from sports.db.routers import primary_reads
+
+
+RESPONSE_CACHE_TIMEOUT = 60 * 5
+TENANT_VERSION_KEY = 'response-cache:tenant:{tenant_id}:version'
+USER_VERSION_KEY = 'response-cache:user:{user_id}:version'
+
+_stats: Counter[str] = Counter()
+_stats_lock = threading.Lock()
+
+
+def _initial_version() -> int:
+    # Seeding from the clock means an evicted counter never restarts at a
+    # value that older payload keys were built with.
+    return time.time_ns() // 1000
+
+
+def _record(namespace: str, outcome: str) -> None:
+    with _stats_lock:
+        _stats[f'{namespace}.{outcome}'] += 1
+
+
+def _modified_key(version_key: str) -> str:
+    return version_key.rsplit(':', 1)[0] + ':modified'
+
+
+def _get_versions(keys: list[str]) -> dict[str, int]:
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            initial = _initial_version()
+            cache.add(key, initial, timeout=None)
+            versions[key] = cache.get(key, initial)
+    return versions
+
+
+def _get_versions_and_modified(keys: list[str]) -> tuple[dict[str, int], int]:
+    """Versions plus the latest modification time (Unix seconds) of ``keys``, in one round trip."""
+    modified_keys = [_modified_key(key) for key in keys]
+    found = cache.get_many(keys + modified_keys)
+    versions = {key: found[key] for key in keys if key in found}
+    if len(versions) < len(keys):
+        versions.update(_get_versions([key for key in keys if key not in versions]))
+
+    now = int(time.time())
+    modified = []
+    for key in modified_keys:
+        if key not in found:
+            # Unknown history: claiming "modified now" only costs a full response.
+            cache.add(key, now, timeout=None)
+            found[key] = cache.get(key, now)
+        modified.append(found[key])
+    return versions, max(modified, default=now)
+
+
+def _bump(key: str) -> None:
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, _initial_version(), timeout=None)
+    cache.set(_modified_key(key), int(time.time()), timeout=None)
+
+
+def _bump_now_and_on_commit(key: str) -> None:
+    _bump(key)
+    # A reader racing the open transaction may cache pre-commit data under
+    # the new version; bumping again once committed orphans that entry.
+    transaction.on_commit(lambda: _bump(key))
+
+
+def bump_tenant_version(tenant_id: int | None) -> None:
+    if tenant_id is not None:
+        _bump_now_and_on_commit(TENANT_VERSION_KEY.format(tenant_id=tenant_id))
+
+
+def bump_user_version(user_id: int | None) -> None:
+    if user_id is not None:
+        _bump_now_and_on_commit(USER_VERSION_KEY.format(user_id=user_id))
+
+
+def _payload_key(namespace: str, tenant_id, user_id, versions: dict[str, int]) -> str:
+    return (
+        f'response-cache:{namespace}'
+        f':t{tenant_id}.{versions.get(TENANT_VERSION_KEY.format(tenant_id=tenant_id))}'
+        f':u{user_id}.{versions.get(USER_VERSION_KEY.format(user_id=user_id))}'
+    )
+
+
+def _version_keys(tenant_id: int | None, user_id: int | None) -> list[str]:
+    keys = []
+    if tenant_id is not None:
+        keys.append(TENANT_VERSION_KEY.format(tenant_id=tenant_id))
+    if user_id is not None:
+        keys.append(USER_VERSION_KEY.format(user_id=user_id))
+    return keys
+
+
+def response_validators(
+    namespace: str,
+    tenant_id: int | None = None,
+    user_id: int | None = None,
+    variant: str = '',
+) -> tuple[dict[str, int], str, int]:
+    """
+    Return ``(versions, etag, last_modified)`` for a cached response without
+    touching the database. ``variant`` separates representations of the same
+    payload, e.g. the negotiated renderer.
+    """
+    versions, last_modified = _get_versions_and_modified(_version_keys(tenant_id, user_id))
+    digest = hashlib.md5(
+        f'{_payload_key(namespace, tenant_id, user_id, versions)}:{variant}'.encode(), usedforsecurity=False
+    )
+    return versions, f'"{digest.hexdigest()}"', last_modified
+
+
+def cached_response(
+    namespace: str,
+    build: Callable[[], Any],
+    tenant_id: int | None = None,
+    user_id: int | None = None,
+    timeout: int = RESPONSE_CACHE_TIMEOUT,
+    versions: dict[str, int] | None = None,
+) -> Any:
+    """
+    Return the payload cached for ``namespace`` and the current tenant/user
+    versions, calling ``build`` on a miss. ``versions`` reuses the ones just
+    read by ``response_validators``.
+    """
+    if versions is None:
+        versions = _get_versions(_version_keys(tenant_id, user_id))
+    key = _payload_key(namespace, tenant_id, user_id, versions)
+    payload = cache.get(key)
+    if payload is not None:
+        _record(namespace, 'hit')
+        return payload
+
+    _record(namespace, 'miss')
+    # Built from the primary: a lagging replica would otherwise pin stale
+    # data under a version that was bumped for the newer write.
+    with primary_reads():
+        payload = build()
+    cache.set(key, payload, timeout)
+    return payload
+
+
+async def _aget_versions(keys: list[str]) -> dict[str, int]:
+    versions = await cache.aget_many(keys)
+    for key in keys:
+        if key not in versions:
+            initial = _initial_version()
+            await cache.aadd(key, initial, timeout=None)
+            versions[key] = await cache.aget(key, initial)
+    return versions
+
+
+async def acached_response(
+    namespace: str,
+    build: Callable[[], Awaitable[Any]],
+    tenant_id: int | None = None,
+    user_id: int | None = None,
+    timeout: int = RESPONSE_CACHE_TIMEOUT,
+) -> Any:
+    """Async counterpart of ``cached_response``; ``build`` is a coroutine function."""
+    versions = await _aget_versions(_version_keys(tenant_id, user_id))
+    key = _payload_key(namespace, tenant_id, user_id, versions)
+    payload = await cache.aget(key)
+    if payload is not None:
+        _record(namespace, 'hit')
+        return payload
+
+    _record(namespace, 'miss')
+    with primary_reads():
+        payload = await build()
+    await cache.aset(key, payload, timeout)
+    return payload
+
+
+def cache_stats() -> dict[str, int]:
+    with _stats_lock:
+        return dict(_stats)
+
+
+def reset_cache_stats() -> None:
+    with _stats_lock:
+        _stats.clear()
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import Iterable
+
+from django.db.models import Count, F
+from django.db.models.functions import Greatest
+
+from .models import Tenant
+
+
+# Maps ``User.Role`` values to the denormalized counter kept on ``Tenant``.
+ROLE_COUNT_FIELDS = {
+    'SUPERADMIN': 'superadmins_count',
+    'OWNER': 'owners_count',
+    'COACH': 'coaches_count',
+    'CLIENT': 'clients_count',
+}
+
+
+def adjust_role_count(tenant_id: int | None, role: str | None, delta: int) -> None:
+    field = ROLE_COUNT_FIELDS.get(role)
+    if tenant_id is None or field is None or not delta:
+        return
+    Tenant.objects.filter(pk=tenant_id).update(**{field: Greatest(F(field) + delta, 0)})
+
+
+def apply_membership_change(
+    previous: tuple[int | None, str | None] | None,
+    current: tuple[int | None, str | None] | None,
+) -> None:
+    """Move one user between ``(tenant_id, role)`` buckets."""
+    if previous == current:
+        return
+    if previous is not None:
+        adjust_role_count(*previous, -1)
+    if current is not None:
+        adjust_role_count(*current, 1)
+
+
+def count_members(tenant_ids: Iterable[int] | None = None) -> dict[int, dict[str, int]]:
+    from django.contrib.auth import get_user_model
+
+    users = get_user_model().objects.filter(tenant__isnull=False)
+    if tenant_ids is not None:
+        users = users.filter(tenant_id__in=list(tenant_ids))
+
+    counts: dict[int, dict[str, int]] = defaultdict(lambda: dict.fromkeys(ROLE_COUNT_FIELDS.values(), 0))
+    for row in users.values('tenant_id', 'role').annotate(total=Count('id')).order_by():
+        field = ROLE_COUNT_FIELDS.get(row['role'])
+        if field is not None:
+            counts[row['tenant_id']][field] = row['total']
+    return counts
+
+
+def recount_role_counts(tenant_ids: Iterable[int] | None = None, dry_run: bool = False) -> list[int]:
+    """
+    Recompute the role counters from ``accounts.User`` and fix any drift.
+
+    Returns the ids of the tenants whose stored counters were wrong.
+    """
+    if tenant_ids is not None:
+        tenant_ids = [tenant_id for tenant_id in set(tenant_ids) if tenant_id is not None]
+        if not tenant_ids:
+            return []
+
+    actual = count_members(tenant_ids)
+    fields = list(ROLE_COUNT_FIELDS.values())
+    tenants = Tenant.objects.only('id', *fields).order_by('id')
+    if tenant_ids is not None:
+        tenants = tenants.filter(pk__in=tenant_ids)
+
+    drifted = []
+    for tenant in tenants.iterator(chunk_size=2000):
+        expected = actual.get(tenant.id, dict.fromkeys(fields, 0))
+        if any(getattr(tenant, field) != expected[field] for field in fields):
+            drifted.append(tenant.id)
+            if not dry_run:
+                Tenant.objects.filter(pk=tenant.id).update(**expected)
+    return drifted
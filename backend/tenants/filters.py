@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from django.db.models import Q, QuerySet
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend
+
+from .models import SEARCH_FIELDS
+
+
+BOOLEAN_VALUES = {'true': True, '1': True, 'false': False, '0': False}
+
+
+class TenantSearchFilter(BaseFilterBackend):
+    """
+    ``?q=`` substring search over name, slug and contact email, and
+    ``?is_active=true|false``, for the tenant list.
+
+    ``icontains`` is served by the trigram indexes on PostgreSQL and falls
+    back to a scan on SQLite.
+    """
+
+    search_param = 'q'
+    active_param = 'is_active'
+
+    def filter_queryset(self, request, queryset: QuerySet, view) -> QuerySet:
+        if getattr(view, 'action', None) != 'list':
+            return queryset
+        return self.filter_list(request, queryset)
+
+    def filter_list(self, request, queryset: QuerySet) -> QuerySet:
+        """Apply ``?q=`` and ``?is_active=``; also used by the async list view."""
+        term = request.query_params.get(self.search_param, '').strip()
+        if term:
+            condition = Q()
+            for field in SEARCH_FIELDS:
+                condition |= Q(**{f'{field}__icontains': term})
+            queryset = queryset.filter(condition)
+
+        active = request.query_params.get(self.active_param)
+        if active is not None:
+            try:
+                queryset = queryset.filter(is_active=BOOLEAN_VALUES[active.lower()])
+            except KeyError:
+                raise ValidationError({self.active_param: ['Expected true or false.']})
+        return queryset
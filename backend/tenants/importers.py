@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import csv
+import io
+import json
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import IO, Iterable, Iterator
+
+from django.db import IntegrityError, transaction
+
+from .models import Tenant
+from .serializers import TenantImportSerializer
+
+
+IMPORT_BATCH_SIZE = 500
+IMPORT_FORMATS = ('csv', 'ndjson')
+
+
+@dataclass
+class TenantImportReport:
+    created: int = 0
+    errors: list[dict] = field(default_factory=list)
+
+    def as_dict(self) -> dict:
+        return {'created': self.created, 'failed': len(self.errors), 'errors': self.errors}
+
+
+def detect_format(filename: str | None, content_type: str | None = None) -> str | None:
+    name = (filename or '').lower()
+    if name.endswith('.csv') or content_type == 'text/csv':
+        return 'csv'
+    if name.endswith(('.ndjson', '.jsonl')) or content_type in {'application/x-ndjson', 'application/jsonl'}:
+        return 'ndjson'
+    return None
+
+
+def _text_stream(stream: IO) -> IO[str]:
+    if isinstance(stream, io.TextIOBase):
+        return stream
+    return io.TextIOWrapper(stream, encoding='utf-8-sig', newline='')
+
+
+def iter_rows(stream: IO, file_format: str) -> Iterator[tuple[int, dict | None, str | None]]:
+    """
+    Yield ``(row_number, data, error)`` one line at a time so the whole file
+    is never held in memory.
+    """
+    text = _text_stream(stream)
+    if file_format == 'csv':
+        for row_number, row in enumerate(csv.DictReader(text), start=1):
+            yield row_number, {key: value for key, value in row.items() if key}, None
+        return
+
+    for row_number, line in enumerate(text, start=1):
+        if not line.strip():
+            continue
+        try:
+            data = json.loads(line)
+        except ValueError as exc:
+            yield row_number, None, f'Invalid JSON: {exc}'
+            continue
+        if not isinstance(data, dict):
+            yield row_number, None, 'Each line must be a JSON object'
+            continue
+        yield row_number, data, None
+
+
+def _chunks(rows: Iterable, size: int) -> Iterator[list]:
+    iterator = iter(rows)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _insert(tenants: list[tuple[int, Tenant]], report: TenantImportReport, retry: bool = True) -> None:
+    slugs = [tenant.slug for _, tenant in tenants]
+    taken = set(Tenant.objects.filter(slug__in=slugs).order_by().values_list('slug', flat=True))
+
+    pending = [tenant for _, tenant in tenants if tenant.slug not in taken]
+    rejected = [
+        {'row': row_number, 'errors': {'slug': ['tenant with this slug already exists.']}}
+        for row_number, tenant in tenants
+        if tenant.slug in taken
+    ]
+    try:
+        with transaction.atomic():
+            Tenant.objects.bulk_create(pending)
+    except IntegrityError:
+        # A concurrent writer claimed one of the slugs after the check above.
+        if retry:
+            _insert(tenants, report, retry=False)
+            return
+        report.errors.extend(
+            {'row': row_number, 'errors': {'non_field_errors': ['Tenant could not be saved.']}}
+            for row_number, tenant in tenants
+            if tenant.slug not in taken
+        )
+        report.errors.extend(rejected)
+        return
+
+    report.created += len(pending)
+    report.errors.extend(rejected)
+
+
+def import_tenants(
+    rows: Iterable[tuple[int, dict | None, str | None]],
+    batch_size: int = IMPORT_BATCH_SIZE,
+) -> TenantImportReport:
+    """Validate and insert tenant rows in chunks of ``batch_size``."""
+    report = TenantImportReport()
+    for chunk in _chunks(rows, batch_size):
+        valid: list[tuple[int, Tenant]] = []
+        seen_slugs: set[str] = set()
+        for row_number, data, error in chunk:
+            if error:
+                report.errors.append({'row': row_number, 'errors': {'non_field_errors': [error]}})
+                continue
+            serializer = TenantImportSerializer(data=data)
+            if not serializer.is_valid():
+                report.errors.append({'row': row_number, 'errors': serializer.errors})
+                continue
+            slug = serializer.validated_data['slug']
+            if slug in seen_slugs:
+                report.errors.append({'row': row_number, 'errors': {'slug': ['Duplicate slug in this file.']}})
+                continue
+            seen_slugs.add(slug)
+            valid.append((row_number, Tenant(**serializer.validated_data)))
+        if valid:
+            _insert(valid, report)
+    return report
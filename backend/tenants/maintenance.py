@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+from django.db import transaction
+from django.utils import timezone
+
+from .cache import bump_tenant_version
+from .models import OwnerInvitation
+
+
+SWEEP_BATCH_SIZE = 1000
+
+
+def expire_overdue_invitations(batch_size: int = SWEEP_BATCH_SIZE, now: datetime | None = None) -> int:
+    """
+    Flip overdue PENDING invitations to EXPIRED in chunks, each one a short
+    ``UPDATE ... WHERE status = 'PENDING' AND expires_at < now`` on the
+    pending-expiry partial index.
+    """
+    now = now or timezone.now()
+    overdue = OwnerInvitation.all_tenants.filter(status=OwnerInvitation.Status.PENDING, expires_at__lt=now).order_by()
+    expired = 0
+    while True:
+        with transaction.atomic():
+            rows = list(overdue.values_list('pk', 'tenant_id')[:batch_size])
+            if not rows:
+                return expired
+            expired += overdue.filter(pk__in=[pk for pk, _ in rows]).update(
+                status=OwnerInvitation.Status.EXPIRED,
+                updated_at=now,
+            )
+        for tenant_id in {tenant_id for _, tenant_id in rows}:
+            bump_tenant_version(tenant_id)
+
+
+def purge_closed_invitations(
+    retention: timedelta,
+    batch_size: int = SWEEP_BATCH_SIZE,
+    now: datetime | None = None,
+) -> int:
+    """Delete ACCEPTED and EXPIRED invitations untouched for longer than ``retention``."""
+    cutoff = (now or timezone.now()) - retention
+    closed = OwnerInvitation.all_tenants.filter(
+        status__in=[OwnerInvitation.Status.ACCEPTED, OwnerInvitation.Status.EXPIRED],
+        updated_at__lt=cutoff,
+    ).order_by()
+    purged = 0
+    while True:
+        with transaction.atomic():
+            ids = list(closed.values_list('pk', flat=True)[:batch_size])
+            if not ids:
+                return purged
+            OwnerInvitation.all_tenants.filter(pk__in=ids).delete()
+            purged += len(ids)
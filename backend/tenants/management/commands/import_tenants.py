@@ -0,0 +1,26 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from tenants.importers import IMPORT_BATCH_SIZE, IMPORT_FORMATS, detect_format, import_tenants, iter_rows
+
+
+class Command(BaseCommand):
+    help = 'Stream tenants from a CSV or NDJSON file and insert them in batches.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='File to import.')
+        parser.add_argument('--format', choices=IMPORT_FORMATS, help='Defaults to the file extension.')
+        parser.add_argument('--batch-size', type=int, default=IMPORT_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        file_format = options['format'] or detect_format(options['path'])
+        if file_format is None:
+            raise CommandError('Could not detect the file format, pass --format.')
+
+        with open(options['path'], 'rb') as stream:
+            report = import_tenants(iter_rows(stream, file_format), batch_size=options['batch_size'])
+
+        for error in report.errors:
+            self.stderr.write(json.dumps(error))
+        self.stdout.write(self.style.SUCCESS(f'Created {report.created} tenant(s), {len(report.errors)} row(s) failed.'))
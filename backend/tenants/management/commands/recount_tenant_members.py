@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+
+from tenants.counters import recount_role_counts
+
+
+class Command(BaseCommand):
+    help = 'Recompute the per-role member counters stored on each tenant and repair drift.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('tenant_ids', nargs='*', type=int, help='Only check these tenants.')
+        parser.add_argument('--dry-run', action='store_true', help='Report drift without fixing it.')
+
+    def handle(self, *args, **options):
+        tenant_ids = options['tenant_ids'] or None
+        drifted = recount_role_counts(tenant_ids, dry_run=options['dry_run'])
+
+        if not drifted:
+            self.stdout.write(self.style.SUCCESS('All tenant counters are up to date.'))
+            return
+        verb = 'Found' if options['dry_run'] else 'Repaired'
+        self.stdout.write(
+            self.style.WARNING(f"{verb} drift on {len(drifted)} tenant(s): {', '.join(map(str, drifted))}")
+        )
@@ -0,0 +1,32 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from tenants.outbox import OUTBOX_BATCH_SIZE, deliver_batch
+
+
+class Command(BaseCommand):
+    help = 'Deliver queued owner invitation emails from the outbox.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=OUTBOX_BATCH_SIZE)
+        parser.add_argument(
+            '--loop',
+            action='store_true',
+            help='Keep polling the outbox instead of exiting once it is drained.',
+        )
+        parser.add_argument('--interval', type=float, default=5.0, help='Seconds between polls with --loop.')
+
+    def handle(self, *args, **options):
+        while True:
+            result = deliver_batch(options['batch_size'])
+            if result.sent or result.retried or result.failed:
+                self.stdout.write(
+                    f'Sent {result.sent}, retrying {result.retried}, failed {result.failed} invitation email(s).'
+                )
+            # A full batch means more rows are probably due right away.
+            if result.sent + result.retried + result.failed >= options['batch_size']:
+                continue
+            if not options['loop']:
+                break
+            time.sleep(options['interval'])
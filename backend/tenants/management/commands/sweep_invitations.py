@@ -0,0 +1,29 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from tenants.maintenance import SWEEP_BATCH_SIZE, expire_overdue_invitations, purge_closed_invitations
+
+
+class Command(BaseCommand):
+    help = 'Expire overdue owner invitations and purge old accepted/expired ones.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=SWEEP_BATCH_SIZE)
+        parser.add_argument(
+            '--retention-days',
+            type=int,
+            default=settings.INVITATION_RETENTION_DAYS,
+            help='Keep accepted/expired invitations this many days before purging them.',
+        )
+        parser.add_argument('--no-purge', action='store_true', help='Only expire overdue invitations.')
+
+    def handle(self, *args, **options):
+        expired = expire_overdue_invitations(options['batch_size'])
+        self.stdout.write(f'Expired {expired} invitation(s).')
+
+        if options['no_purge']:
+            return
+        purged = purge_closed_invitations(timedelta(days=options['retention_days']), options['batch_size'])
+        self.stdout.write(f'Purged {purged} invitation(s) older than {options["retention_days"]} day(s).')
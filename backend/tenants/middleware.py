@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+
+from sports.db.routers import primary_reads
+
+from .models import Tenant
+from .resolution import slug_from_request, tenant_cache
+from .scoping import request_scope
+
+
+def _active_tenants():
+    return Tenant.objects.filter(is_active=True)
+
+
+class TenantResolutionMiddleware:
+    """
+    Attach the tenant named by the host or ``X-Tenant`` header to
+    ``request.tenant`` (``None`` when there is none), served from the
+    in-process LRU so repeated requests make no tenant query.
+
+    The request is also bound as the scope of ``TenantScopedManager``.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        request.tenant = None
+        slug = slug_from_request(request)
+        if slug:
+            tenant = tenant_cache.get(slug)
+            if tenant is tenant_cache.MISSING:
+                with primary_reads():
+                    tenant = _active_tenants().filter(slug=slug).first()
+                tenant_cache.set(slug, tenant)
+            request.tenant = tenant
+        with request_scope(request):
+            return self.get_response(request)
+
+    async def __acall__(self, request):
+        request.tenant = None
+        slug = slug_from_request(request)
+        if slug:
+            tenant = tenant_cache.get(slug)
+            if tenant is tenant_cache.MISSING:
+                with primary_reads():
+                    tenant = await _active_tenants().filter(slug=slug).afirst()
+                tenant_cache.set(slug, tenant)
+            request.tenant = tenant
+        with request_scope(request):
+            return await self.get_response(request)
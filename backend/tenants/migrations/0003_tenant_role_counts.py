@@ -0,0 +1,64 @@
+# Generated by Django 4.2.21 on 2026-10-18 17:06
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+ROLE_COUNT_FIELDS = {
+    "SUPERADMIN": "superadmins_count",
+    "OWNER": "owners_count",
+    "COACH": "coaches_count",
+    "CLIENT": "clients_count",
+}
+
+
+def populate_role_counts(apps, schema_editor):
+    User = apps.get_model("accounts", "User")
+    Tenant = apps.get_model("tenants", "Tenant")
+
+    counts = {}
+    rows = (
+        User.objects.filter(tenant__isnull=False)
+        .values("tenant_id", "role")
+        .annotate(total=Count("id"))
+        .order_by()
+    )
+    for row in rows:
+        field = ROLE_COUNT_FIELDS.get(row["role"])
+        if field is not None:
+            counts.setdefault(row["tenant_id"], {})[field] = row["total"]
+
+    for tenant_id, values in counts.items():
+        Tenant.objects.filter(pk=tenant_id).update(**values)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tenants", "0002_tenant_name_id_idx"),
+        ("accounts", "0003_user_token_version"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="tenant",
+            name="clients_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="tenant",
+            name="coaches_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="tenant",
+            name="owners_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="tenant",
+            name="superadmins_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(populate_role_counts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,66 @@
+# Generated by Django 4.2.21 on 2026-10-18 17:13
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tenants", "0003_tenant_role_counts"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="InvitationEmail",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("PENDING", "Pending"),
+                            ("SENT", "Sent"),
+                            ("FAILED", "Failed"),
+                        ],
+                        default="PENDING",
+                        max_length=20,
+                    ),
+                ),
+                ("attempts", models.PositiveSmallIntegerField(default=0)),
+                (
+                    "next_attempt_at",
+                    models.DateTimeField(default=django.utils.timezone.now),
+                ),
+                ("last_error", models.TextField(blank=True)),
+                ("sent_at", models.DateTimeField(blank=True, null=True)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "invitation",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="emails",
+                        to="tenants.ownerinvitation",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ("next_attempt_at",),
+                "indexes": [
+                    models.Index(
+                        fields=["status", "next_attempt_at"],
+                        name="invitation_email_due_idx",
+                    )
+                ],
+            },
+        ),
+    ]
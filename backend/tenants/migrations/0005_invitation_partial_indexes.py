@@ -0,0 +1,37 @@
+# Generated by Django 4.2.21 on 2026-10-18 17:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tenants", "0004_invitation_email_outbox"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="ownerinvitation",
+            index=models.Index(
+                condition=models.Q(("status", "PENDING")),
+                fields=["tenant", "email"],
+                name="invitation_pending_email_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="ownerinvitation",
+            index=models.Index(
+                condition=models.Q(("status", "PENDING")),
+                fields=["expires_at"],
+                name="invitation_pending_expiry_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="ownerinvitation",
+            index=models.Index(
+                condition=models.Q(("status__in", ["ACCEPTED", "EXPIRED"])),
+                fields=["updated_at"],
+                name="invitation_closed_updated_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 4.2.21 on 2026-10-18 17:28
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tenants", "0005_invitation_partial_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="ownerinvitation",
+            index=models.Index(
+                fields=["tenant", "-created_at"], name="invitation_tenant_created_idx"
+            ),
+        ),
+        migrations.AlterField(
+            model_name="ownerinvitation",
+            name="tenant",
+            field=models.ForeignKey(
+                db_index=False,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="owner_invitations",
+                to="tenants.tenant",
+            ),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 4.2.21 on 2026-10-18 17:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tenants", "0006_invitation_tenant_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="tenant",
+            index=models.Index(
+                fields=["is_active", "name", "id"], name="tenant_active_name_id_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 4.2.21 on 2026-10-18 17:48
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+import django.db.models.functions.text
+
+import sports.db.operations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tenants", "0007_tenant_active_name_idx"),
+    ]
+
+    # GIN indexes and pg_trgm do not exist on SQLite, which only records the
+    # indexes in the migration state; ``icontains`` scans there instead.
+    operations = [
+        sports.db.operations.PostgreSQLOnly(
+            migrations.RunSQL("CREATE EXTENSION IF NOT EXISTS pg_trgm", reverse_sql=migrations.RunSQL.noop),
+        ),
+        sports.db.operations.PostgreSQLOnly(
+            migrations.AddIndex(
+                model_name="tenant",
+                index=django.contrib.postgres.indexes.GinIndex(
+                    django.contrib.postgres.indexes.OpClass(
+                        django.db.models.functions.text.Upper("name"), name="gin_trgm_ops"
+                    ),
+                    name="tenant_name_trgm_idx",
+                ),
+            ),
+        ),
+        sports.db.operations.PostgreSQLOnly(
+            migrations.AddIndex(
+                model_name="tenant",
+                index=django.contrib.postgres.indexes.GinIndex(
+                    django.contrib.postgres.indexes.OpClass(
+                        django.db.models.functions.text.Upper("slug"), name="gin_trgm_ops"
+                    ),
+                    name="tenant_slug_trgm_idx",
+                ),
+            ),
+        ),
+        sports.db.operations.PostgreSQLOnly(
+            migrations.AddIndex(
+                model_name="tenant",
+                index=django.contrib.postgres.indexes.GinIndex(
+                    django.contrib.postgres.indexes.OpClass(
+                        django.db.models.functions.text.Upper("contact_email"), name="gin_trgm_ops"
+                    ),
+                    name="tenant_contact_email_trgm_idx",
+                ),
+            ),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 4.2.21 on 2026-10-18 18:00
+
+from django.db import migrations
+import django.db.models.manager
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tenants", "0008_tenant_trigram_search"),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="ownerinvitation",
+            options={
+                "default_manager_name": "all_tenants",
+                "ordering": ("-created_at",),
+            },
+        ),
+        migrations.AlterModelManagers(
+            name="ownerinvitation",
+            managers=[
+                ("all_tenants", django.db.models.manager.Manager()),
+            ],
+        ),
+    ]
@@ -3,9 +3,37 @@ from __future__ import annotations
 import secrets
 from datetime import timedelta
 
-from django.db import models
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.db import models, router, transaction
+from django.db.models.functions import Upper
 from django.utils import timezone
 
+from .cache import bump_tenant_version
+from .resolution import forget_tenant
+from .scoping import TenantScopedManager
+
+
+SEARCH_FIELDS = ('name', 'slug', 'contact_email')
+
+
+class TenantQuerySet(models.QuerySet):
+    def detach_members(self) -> int:
+        """
+        Clear ``tenant`` on the members of these tenants through
+        ``User.objects``, which bumps their token versions; ``SET_NULL`` on
+        delete would leave their issued tokens carrying the old tenant.
+        """
+        User = self.model._meta.get_field('users').related_model
+        return User.objects.filter(tenant__in=self).update(tenant=None)
+
+    def delete(self):
+        with transaction.atomic(using=self.db):
+            self.detach_members()
+            return super().delete()
+
+    delete.alters_data = True
+    delete.queryset_only = True
+
 
 class Tenant(models.Model):
     name = models.CharField(max_length=255)
@@ -16,11 +44,54 @@ class Tenant(models.Model):
     address = models.TextField(blank=True)
     contact_email = models.EmailField(blank=True)
     is_active = models.BooleanField(default=True)
+    # Member counters per ``User.Role``, maintained by ``tenants.counters``.
+    superadmins_count = models.PositiveIntegerField(default=0, editable=False)
+    owners_count = models.PositiveIntegerField(default=0, editable=False)
+    coaches_count = models.PositiveIntegerField(default=0, editable=False)
+    clients_count = models.PositiveIntegerField(default=0, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ('name',)
+        indexes = [
+            models.Index(fields=['name', 'id'], name='tenant_name_id_idx'),
+            models.Index(fields=['is_active', 'name', 'id'], name='tenant_active_name_id_idx'),
+            # Trigram indexes on UPPER(col), the expression ``icontains`` compiles
+            # to on PostgreSQL, for the API ``?q=`` and the admin search.
+            # Created on PostgreSQL only (see the migration).
+            *(
+                GinIndex(OpClass(Upper(field), name='gin_trgm_ops'), name=f'tenant_{field}_trgm_idx')
+                for field in SEARCH_FIELDS
+            ),
+        ]
+
+    objects = TenantQuerySet.as_manager()
+
+    COUNTER_FIELDS = ('superadmins_count', 'owners_count', 'coaches_count', 'clients_count')
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            # Counters are only ever written with F() updates; a full save of a
+            # stale instance must not overwrite them.
+            kwargs['update_fields'] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.COUNTER_FIELDS
+            ]
+        super().save(*args, **kwargs)
+        bump_tenant_version(self.pk)
+        forget_tenant(self.pk, self.slug)
+
+    def delete(self, *args, **kwargs):
+        tenant_id = self.pk
+        using = kwargs.get('using') or router.db_for_write(type(self), instance=self)
+        with transaction.atomic(using=using):
+            Tenant.objects.using(using).filter(pk=tenant_id).detach_members()
+            result = super().delete(*args, **kwargs)
+        bump_tenant_version(tenant_id)
+        forget_tenant(tenant_id, self.slug)
+        return result
 
     def __str__(self) -> str:
         return self.name
@@ -32,7 +103,8 @@ class OwnerInvitation(models.Model):
         ACCEPTED = 'ACCEPTED', 'Accepted'
         EXPIRED = 'EXPIRED', 'Expired'
 
-    tenant = models.ForeignKey(Tenant, related_name='owner_invitations', on_delete=models.CASCADE)
+    # Indexed through the (tenant, ...) composites below.
+    tenant = models.ForeignKey(Tenant, related_name='owner_invitations', on_delete=models.CASCADE, db_index=False)
     email = models.EmailField()
     token = models.CharField(max_length=64, unique=True, editable=False)
     status = models.CharField(max_length=20, choices=Status.choices, default=Status.PENDING)
@@ -43,13 +115,41 @@ class OwnerInvitation(models.Model):
 
     class Meta:
         ordering = ('-created_at',)
+        indexes = [
+            models.Index(fields=['tenant', '-created_at'], name='invitation_tenant_created_idx'),
+            models.Index(
+                fields=['tenant', 'email'],
+                condition=models.Q(status='PENDING'),
+                name='invitation_pending_email_idx',
+            ),
+            models.Index(
+                fields=['expires_at'],
+                condition=models.Q(status='PENDING'),
+                name='invitation_pending_expiry_idx',
+            ),
+            models.Index(
+                fields=['updated_at'],
+                condition=models.Q(status__in=['ACCEPTED', 'EXPIRED']),
+                name='invitation_closed_updated_idx',
+            ),
+        ]
+        # Admin, related lookups and model forms must see every invitation;
+        # request code opts into scoping through ``objects``.
+        default_manager_name = 'all_tenants'
 
-    def save(self, *args, **kwargs):
+    objects = TenantScopedManager()
+    all_tenants = models.Manager()
+
+    def populate_defaults(self) -> None:
         if not self.token:
             self.token = secrets.token_urlsafe(32)
         if not self.expires_at:
             self.expires_at = timezone.now() + timedelta(days=7)
+
+    def save(self, *args, **kwargs):
+        self.populate_defaults()
         super().save(*args, **kwargs)
+        bump_tenant_version(self.tenant_id)
 
     @property
     def is_expired(self) -> bool:
@@ -66,3 +166,29 @@ class OwnerInvitation(models.Model):
 
     def __str__(self) -> str:
         return f"Invitation for {self.email} ({self.tenant})"
+
+
+class InvitationEmail(models.Model):
+    """Outbox row written in the same transaction as its ``OwnerInvitation``."""
+
+    class Status(models.TextChoices):
+        PENDING = 'PENDING', 'Pending'
+        SENT = 'SENT', 'Sent'
+        FAILED = 'FAILED', 'Failed'
+
+    invitation = models.ForeignKey(OwnerInvitation, related_name='emails', on_delete=models.CASCADE)
+    status = models.CharField(max_length=20, choices=Status.choices, default=Status.PENDING)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ('next_attempt_at',)
+        indexes = [
+            models.Index(fields=['status', 'next_attempt_at'], name='invitation_email_due_idx'),
+        ]
+
+    def __str__(self) -> str:
+        return f"Email for {self.invitation_id} ({self.status})"
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db import transaction
+from django.utils import timezone
+
+from .models import InvitationEmail, OwnerInvitation
+
+
+logger = logging.getLogger(__name__)
+
+OUTBOX_BATCH_SIZE = 100
+MAX_ATTEMPTS = 8
+RETRY_BASE_DELAY = timedelta(seconds=30)
+RETRY_MAX_DELAY = timedelta(hours=1)
+
+
+@dataclass
+class DeliveryResult:
+    sent: int = 0
+    retried: int = 0
+    failed: int = 0
+
+
+def enqueue_invitation_emails(invitations: list[OwnerInvitation]) -> None:
+    """Queue the emails; call inside the transaction that creates the invitations."""
+    InvitationEmail.objects.bulk_create([InvitationEmail(invitation=invitation) for invitation in invitations])
+
+
+def build_message(invitation: OwnerInvitation) -> EmailMessage:
+    accept_url = f"{settings.FRONTEND_URL.rstrip('/')}/accept-invite/{invitation.token}"
+    return EmailMessage(
+        subject=f'Invitation to manage {invitation.tenant.name}',
+        body=(
+            f'You have been invited to manage {invitation.tenant.name}.\n\n'
+            f'Accept the invitation before {invitation.expires_at:%Y-%m-%d %H:%M} UTC:\n{accept_url}\n'
+        ),
+        to=[invitation.email],
+    )
+
+
+def retry_delay(attempts: int) -> timedelta:
+    return min(RETRY_BASE_DELAY * (2 ** max(attempts - 1, 0)), RETRY_MAX_DELAY)
+
+
+def _record_failure(email: InvitationEmail, error: Exception, now, result: DeliveryResult) -> None:
+    email.attempts += 1
+    email.last_error = str(error)[:2000]
+    if email.attempts >= MAX_ATTEMPTS:
+        email.status = InvitationEmail.Status.FAILED
+        result.failed += 1
+    else:
+        email.next_attempt_at = now + retry_delay(email.attempts)
+        result.retried += 1
+
+
+def deliver_batch(batch_size: int = OUTBOX_BATCH_SIZE) -> DeliveryResult:
+    """
+    Claim due outbox rows with ``FOR UPDATE SKIP LOCKED`` and send them over a
+    single mail connection. Rows stay locked until the batch is recorded, so
+    concurrent workers never pick the same email.
+    """
+    result = DeliveryResult()
+    with transaction.atomic():
+        now = timezone.now()
+        emails = list(
+            InvitationEmail.objects.select_for_update(skip_locked=True, of=('self',))
+            .select_related('invitation__tenant')
+            .filter(status=InvitationEmail.Status.PENDING, next_attempt_at__lte=now)
+            .order_by('next_attempt_at')[:batch_size]
+        )
+        if not emails:
+            return result
+
+        connection = get_connection()
+        try:
+            connection.open()
+        except Exception as exc:  # noqa: BLE001 - any transport error defers the batch
+            logger.warning('Could not open mail connection: %s', exc)
+            for email in emails:
+                _record_failure(email, exc, now, result)
+        else:
+            try:
+                for email in emails:
+                    try:
+                        connection.send_messages([build_message(email.invitation)])
+                    except Exception as exc:  # noqa: BLE001
+                        logger.warning('Sending invitation email %s failed: %s', email.pk, exc)
+                        _record_failure(email, exc, now, result)
+                    else:
+                        email.status = InvitationEmail.Status.SENT
+                        email.sent_at = now
+                        email.attempts += 1
+                        result.sent += 1
+            finally:
+                connection.close()
+
+        InvitationEmail.objects.bulk_update(
+            emails, ['status', 'attempts', 'next_attempt_at', 'last_error', 'sent_at']
+        )
+    return result
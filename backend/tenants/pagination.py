@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import base64
+import json
+from collections import OrderedDict
+
+from django.conf import settings
+from django.db.models import Q, QuerySet
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class TenantCursorPagination(BasePagination):
+    """
+    Keyset pagination over ``(name, id)``, or ``(slug, id)`` with ``?ordering=``.
+
+    The cursor encodes the last row of the previous page, so fetching a deep
+    page is a range scan on the ``(name, id)`` index (or the unique slug
+    index) rather than an OFFSET. Descending orderings scan it backwards.
+    """
+
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+    ordering_query_param = 'ordering'
+    page_size = getattr(settings, 'TENANTS_PAGE_SIZE', 50)
+    max_page_size = getattr(settings, 'TENANTS_MAX_PAGE_SIZE', 500)
+    ordering_fields = ('name', 'slug')
+    default_ordering = ('name', 'id')
+    invalid_cursor_message = _('Invalid cursor')
+
+    def paginate_queryset(self, queryset: QuerySet, request, view=None) -> list:
+        return self.finish_page(list(self.page_queryset(queryset, request)))
+
+    async def apaginate_queryset(self, queryset: QuerySet, request) -> list:
+        return self.finish_page([row async for row in self.page_queryset(queryset, request)])
+
+    def page_queryset(self, queryset: QuerySet, request) -> QuerySet:
+        self.request = request
+        self.current_page_size = self.get_page_size(request)
+        self.ordering = self.get_ordering(request)
+        position = self.decode_cursor(request)
+
+        queryset = queryset.order_by(*self.ordering)
+        if position is not None:
+            value, pk = position
+            field = self.ordering[0].lstrip('-')
+            after = 'lt' if self.ordering[0].startswith('-') else 'gt'
+            queryset = queryset.filter(Q(**{f'{field}__{after}': value}) | Q(**{field: value, f'id__{after}': pk}))
+        return queryset[: self.current_page_size + 1]
+
+    def finish_page(self, rows: list) -> list:
+        self.has_next = len(rows) > self.current_page_size
+        page = rows[: self.current_page_size]
+        field = self.ordering[0].lstrip('-')
+        self.next_position = (getattr(page[-1], field), page[-1].id) if self.has_next else None
+        return page
+
+    def get_ordering(self, request) -> tuple[str, str]:
+        requested = request.query_params.get(self.ordering_query_param)
+        if not requested:
+            return self.default_ordering
+        if requested.lstrip('-') not in self.ordering_fields:
+            expected = ', '.join(self.ordering_fields)
+            raise ValidationError(
+                {self.ordering_query_param: [f"Expected one of: {expected}, optionally prefixed with '-'."]}
+            )
+        direction = '-' if requested.startswith('-') else ''
+        return f'{direction}{requested.lstrip("-")}', f'{direction}id'
+
+    def cursor_fields(self, request) -> tuple[str, ...]:
+        """Columns every fetched row needs for the cursor of ``request``."""
+        return tuple(field.lstrip('-') for field in self.get_ordering(request))
+
+    def get_page_size(self, request) -> int:
+        try:
+            requested = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if requested <= 0:
+            return self.page_size
+        return min(requested, self.max_page_size)
+
+    def decode_cursor(self, request) -> tuple[str, int] | None:
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            padded = encoded + '=' * (-len(encoded) % 4)
+            name, pk = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+            return str(name), int(pk)
+        except (TypeError, ValueError, UnicodeError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def encode_cursor(self, position: tuple[str, int]) -> str:
+        raw = json.dumps(list(position), separators=(',', ':')).encode('utf-8')
+        return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+    def get_next_link(self) -> str | None:
+        if self.next_position is None:
+            return None
+        url = self.request.build_absolute_uri()
+        url = replace_query_param(url, self.page_size_query_param, self.current_page_size)
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(self.next_position))
+
+    def get_paginated_response(self, data) -> Response:
+        return Response(OrderedDict([('next', self.get_next_link()), ('results', data)]))
+
+    def get_paginated_response_schema(self, schema: dict) -> dict:
+        return {
+            'type': 'object',
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
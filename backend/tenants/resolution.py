@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+from django.conf import settings
+from django.db import transaction
+
+
+class TenantLRUCache:
+    """
+    Bounded, thread-safe LRU of resolved tenants keyed by slug.
+
+    Entries expire after ``ttl`` seconds so other processes pick up changes
+    that were only invalidated in the process that saved the tenant. Unknown
+    slugs are cached as ``None`` so probing random subdomains stays cheap.
+    """
+
+    MISSING = object()
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, slug: str) -> Any:
+        """Return the cached tenant (possibly ``None``) or ``MISSING``."""
+        with self._lock:
+            entry = self._entries.get(slug)
+            if entry is None:
+                return self.MISSING
+            expires_at, tenant = entry
+            if expires_at <= time.monotonic():
+                del self._entries[slug]
+                return self.MISSING
+            self._entries.move_to_end(slug)
+            return tenant
+
+    def set(self, slug: str, tenant) -> None:
+        with self._lock:
+            self._entries[slug] = (time.monotonic() + self.ttl, tenant)
+            self._entries.move_to_end(slug)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def forget(self, tenant_id: int | None = None, slug: str | None = None) -> None:
+        with self._lock:
+            stale = [
+                key
+                for key, (_, tenant) in self._entries.items()
+                if key == slug or (tenant is not None and tenant.pk == tenant_id)
+            ]
+            for key in stale:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+tenant_cache = TenantLRUCache(
+    maxsize=getattr(settings, 'TENANT_CACHE_SIZE', 1024),
+    ttl=getattr(settings, 'TENANT_CACHE_TTL', 60),
+)
+
+
+def forget_tenant(tenant_id: int | None, slug: str | None = None) -> None:
+    tenant_cache.forget(tenant_id, slug)
+    # Same race as the response cache: a request resolving the tenant while
+    # the write is uncommitted would cache the old row again.
+    transaction.on_commit(lambda: tenant_cache.forget(tenant_id, slug))
+
+
+def slug_from_request(request) -> str | None:
+    """
+    Return the tenant slug named by the request: the subdomain of
+    ``TENANT_BASE_DOMAIN`` (``club.example.com``), else the ``X-Tenant`` header.
+    """
+    base_domain = getattr(settings, 'TENANT_BASE_DOMAIN', '')
+    host = request.get_host().rsplit(':', 1)[0].lower()
+    if base_domain and host.endswith(f'.{base_domain}'):
+        subdomain = host[: -len(base_domain) - 1]
+        if subdomain and '.' not in subdomain:
+            return subdomain
+    slug = request.headers.get('X-Tenant', '').strip().lower()
+    return slug or None
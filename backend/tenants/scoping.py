@@ -0,0 +1,97 @@
+"""
+Automatic tenant filtering for tenant-owned models.
+
+``TenantResolutionMiddleware`` binds the current request to a context
+variable; ``TenantScopedManager`` derives the tenant from it whenever a
+queryset is built:
+
+* an authenticated SUPERADMIN is not scoped;
+* any other authenticated user is scoped to their own tenant (or sees
+  nothing when they have none);
+* an anonymous request is scoped to the tenant resolved from its host or
+  ``X-Tenant`` header, and sees nothing when none was resolved.
+
+Outside a request (management commands, workers) querysets are unscoped
+unless ``tenant_scope()`` says otherwise.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+from django.db import models
+from django.utils.functional import SimpleLazyObject, empty
+
+
+UNSCOPED = object()
+
+_current_request: ContextVar = ContextVar('tenant_scope_request', default=None)
+_explicit_scope: ContextVar = ContextVar('tenant_scope', default=None)
+
+
+@contextmanager
+def request_scope(request) -> Iterator[None]:
+    token = _current_request.set(request)
+    try:
+        yield
+    finally:
+        _current_request.reset(token)
+
+
+@contextmanager
+def tenant_scope(tenant_id) -> Iterator[None]:
+    """Scope queries to ``tenant_id`` (or lift scoping with ``UNSCOPED``), overriding the request."""
+    token = _explicit_scope.set((tenant_id,))
+    try:
+        yield
+    finally:
+        _explicit_scope.reset(token)
+
+
+def unscoped():
+    return tenant_scope(UNSCOPED)
+
+
+def _request_user(request):
+    user = request.__dict__.get('user')
+    # Never force Django's lazy session user here: it would cost queries and
+    # cannot run inside async views. DRF replaces it once it authenticates.
+    if isinstance(user, SimpleLazyObject) and user._wrapped is empty:
+        return None
+    return user
+
+
+def current_tenant_scope():
+    """Return the tenant id to filter on, ``None`` to match nothing, or ``UNSCOPED``."""
+    explicit = _explicit_scope.get()
+    if explicit is not None:
+        return explicit[0]
+
+    request = _current_request.get()
+    if request is None:
+        return UNSCOPED
+    user = _request_user(request)
+    if user is not None and user.is_authenticated:
+        if getattr(user, 'role', None) == 'SUPERADMIN':
+            return UNSCOPED
+        return user.tenant_id
+    # Fail closed: only ``tenant_scope(UNSCOPED)`` lifts scoping in a request.
+    tenant = getattr(request, 'tenant', None)
+    return None if tenant is None else tenant.pk
+
+
+class TenantScopedManager(models.Manager):
+    """Manager adding ``<tenant_field>_id = <current tenant>`` to every queryset."""
+
+    tenant_field = 'tenant'
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        scope = current_tenant_scope()
+        if scope is UNSCOPED:
+            return queryset
+        if scope is None:
+            return queryset.none()
+        return queryset.filter(**{f'{self.tenant_field}_id': scope})
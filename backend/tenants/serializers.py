@@ -1,16 +1,26 @@
 from __future__ import annotations
 
+from typing import Iterable
+
 from django.contrib.auth import get_user_model
 from django.contrib.auth.password_validation import validate_password
+from django.core.exceptions import ImproperlyConfigured
+from django.db import transaction
+from django.db.models import Prefetch
+from django.utils.functional import cached_property
 from rest_framework import serializers
 
+from sports.fieldsets import SparseFieldsMixin
+
+from .cache import bump_tenant_version
 from .models import OwnerInvitation, Tenant
+from .outbox import enqueue_invitation_emails
 
 
 User = get_user_model()
 
 
-class TenantSerializer(serializers.ModelSerializer):
+class TenantSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     owners_count = serializers.IntegerField(read_only=True, default=0)
 
     class Meta:
@@ -29,6 +39,101 @@ class TenantSerializer(serializers.ModelSerializer):
         )
 
 
+# DRF fields whose representation of a database value is the value itself.
+_PASSTHROUGH_REPRESENTATIONS = {
+    serializers.CharField.to_representation,
+    serializers.IntegerField.to_representation,
+    serializers.BooleanField.to_representation,
+}
+
+
+class ValuesSerializer:
+    """
+    Read-only fast path for a flat ``ModelSerializer``.
+
+    The serializer's fields are compiled once into a plan of columns and
+    converters; rows fetched with ``values_list(*columns)`` are then turned
+    into the same dicts without building model instances or dispatching
+    through every field. Trailing extra columns in a row are ignored.
+    """
+
+    def __init__(self, serializer_class: type[serializers.ModelSerializer], fields: frozenset[str] | None = None):
+        self.serializer_class = serializer_class
+        self.fields = fields
+        self._subsets: dict[frozenset[str], ValuesSerializer] = {}
+
+    def subset(self, fields: Iterable[str] | None) -> ValuesSerializer:
+        """The plan restricted to ``fields`` (a ``SparseFieldsMixin`` serializer), compiled once per set."""
+        if fields is None:
+            return self
+        key = frozenset(fields)
+        if key not in self._subsets:
+            self._subsets[key] = ValuesSerializer(self.serializer_class, key)
+        return self._subsets[key]
+
+    @cached_property
+    def _plan(self) -> tuple[tuple[str, ...], tuple[str, ...], tuple]:
+        serializer = self.serializer_class() if self.fields is None else self.serializer_class(fields=self.fields)
+        names, columns, converters = [], [], []
+        for name, field in serializer.fields.items():
+            if field.write_only:
+                continue
+            if field.source == '*' or '.' in field.source:
+                raise ImproperlyConfigured(
+                    f'{self.serializer_class.__name__}.{name} is not a plain column and cannot be read from values().'
+                )
+            names.append(name)
+            columns.append(field.source)
+            to_representation = type(field).to_representation
+            converters.append(None if to_representation in _PASSTHROUGH_REPRESENTATIONS else field.to_representation)
+        return tuple(names), tuple(columns), tuple(converters)
+
+    @property
+    def columns(self) -> tuple[str, ...]:
+        return self._plan[1]
+
+    def serialize(self, rows) -> list[dict]:
+        names, _, converters = self._plan
+        if not any(converters):
+            return [dict(zip(names, row)) for row in rows]
+        steps = tuple(zip(names, converters))
+        return [
+            {
+                name: value if convert is None or value is None else convert(value)
+                for (name, convert), value in zip(steps, row)
+            }
+            for row in rows
+        ]
+
+
+class TenantBrandingSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Tenant
+        fields = ('id', 'name', 'slug', 'logo_url', 'theme_primary', 'theme_secondary')
+        read_only_fields = fields
+
+
+class TenantImportSerializer(TenantSerializer):
+    # Slug uniqueness is checked per batch by ``tenants.importers``.
+    class Meta(TenantSerializer.Meta):
+        extra_kwargs = {'slug': {'validators': []}}
+
+
+tenant_rows = ValuesSerializer(TenantSerializer)
+
+
+OWNER_FIELDS = ('id', 'email', 'first_name', 'last_name')
+
+
+def owners_prefetch() -> Prefetch:
+    """Prefetch the owners of a tenant queryset into ``Tenant.prefetched_owners``."""
+    return Prefetch(
+        'users',
+        queryset=User.scoped.filter(role=User.Role.OWNER).only(*OWNER_FIELDS, 'tenant_id').order_by('email'),
+        to_attr='prefetched_owners',
+    )
+
+
 class TenantDetailSerializer(TenantSerializer):
     owners = serializers.SerializerMethodField()
 
@@ -36,48 +141,116 @@ class TenantDetailSerializer(TenantSerializer):
         fields = TenantSerializer.Meta.fields + ('owners',)
 
     def get_owners(self, obj: Tenant) -> list[dict[str, str]]:
-        owners = obj.users.filter(role=User.Role.OWNER).order_by('email')
-        return [
-            {
-                'id': owner.id,
-                'email': owner.email,
-                'first_name': owner.first_name,
-                'last_name': owner.last_name,
-            }
-            for owner in owners
-        ]
+        owners = getattr(obj, 'prefetched_owners', None)
+        if owners is None:
+            owners = obj.users.filter(role=User.Role.OWNER).order_by('email')
+        return [{field: getattr(owner, field) for field in OWNER_FIELDS} for owner in owners]
+
+
+class TenantOwnersQuerySerializer(serializers.Serializer):
+    ids = serializers.ListField(child=serializers.IntegerField(min_value=1), allow_empty=False, max_length=500)
+
+    def to_internal_value(self, data):
+        raw_ids = data.get('ids', '')
+        ids = [value for value in raw_ids.split(',') if value.strip()] if isinstance(raw_ids, str) else raw_ids
+        return super().to_internal_value({'ids': ids})
 
 
 class OwnerInviteSerializer(serializers.Serializer):
     email = serializers.EmailField()
 
     def validate_email(self, value: str) -> str:
+        value = User.objects.normalize_email(value)
         tenant: Tenant = self.context['tenant']
-        if OwnerInvitation.objects.filter(tenant=tenant, email=value, status=OwnerInvitation.Status.PENDING).exists():
+        pending = OwnerInvitation.all_tenants.filter(tenant=tenant, email=value, status=OwnerInvitation.Status.PENDING)
+        if pending.exists():
             raise serializers.ValidationError('An invitation is already pending for this email')
         return value
 
     def create(self, validated_data: dict) -> OwnerInvitation:
         tenant: Tenant = self.context['tenant']
-        invitation = OwnerInvitation.objects.create(tenant=tenant, **validated_data)
+        with transaction.atomic():
+            invitation = OwnerInvitation.all_tenants.create(tenant=tenant, **validated_data)
+            enqueue_invitation_emails([invitation])
         return invitation
 
 
+class BulkOwnerInviteItemSerializer(serializers.Serializer):
+    tenant_id = serializers.IntegerField(min_value=1)
+    email = serializers.EmailField()
+
+    def validate_email(self, value: str) -> str:
+        return User.objects.normalize_email(value)
+
+
+class BulkOwnerInviteSerializer(serializers.Serializer):
+    """
+    Validates many ``(tenant_id, email)`` pairs with one tenant lookup and one
+    pending-duplicate lookup; rejected pairs are reported in ``item_errors``.
+    """
+
+    invitations = BulkOwnerInviteItemSerializer(many=True, allow_empty=False, max_length=1000)
+
+    def validate_invitations(self, items: list[dict]) -> list[dict]:
+        tenant_ids = {item['tenant_id'] for item in items}
+        emails = {item['email'] for item in items}
+        existing_tenants = set(Tenant.objects.filter(pk__in=tenant_ids).order_by().values_list('pk', flat=True))
+        pending = set(
+            OwnerInvitation.all_tenants.filter(
+                tenant_id__in=tenant_ids,
+                email__in=emails,
+                status=OwnerInvitation.Status.PENDING,
+            )
+            .order_by()
+            .values_list('tenant_id', 'email')
+        )
+
+        self.item_errors: list[dict] = []
+        accepted: list[dict] = []
+        seen: set[tuple[int, str]] = set()
+        for index, item in enumerate(items):
+            pair = (item['tenant_id'], item['email'])
+            if item['tenant_id'] not in existing_tenants:
+                error = {'tenant_id': ['Tenant not found']}
+            elif pair in pending:
+                error = {'email': ['An invitation is already pending for this email']}
+            elif pair in seen:
+                error = {'email': ['Duplicate invitation in this request']}
+            else:
+                seen.add(pair)
+                accepted.append(item)
+                continue
+            self.item_errors.append({'index': index, 'errors': error})
+        return accepted
+
+    def create(self, validated_data: dict) -> list[OwnerInvitation]:
+        invitations = [OwnerInvitation(**item) for item in validated_data['invitations']]
+        for invitation in invitations:
+            invitation.populate_defaults()
+        with transaction.atomic():
+            OwnerInvitation.all_tenants.bulk_create(invitations)
+            enqueue_invitation_emails(invitations)
+        for tenant_id in {invitation.tenant_id for invitation in invitations}:
+            bump_tenant_version(tenant_id)
+        return invitations
+
+
 class AssignOwnerSerializer(serializers.Serializer):
     user_id = serializers.IntegerField()
 
-    def validate_user_id(self, value: int) -> int:
+    def validate(self, attrs: dict) -> dict:
         try:
-            user = User.objects.get(id=value)
+            user = User.objects.get(id=attrs['user_id'])
         except User.DoesNotExist as exc:
-            raise serializers.ValidationError('User not found') from exc
+            raise serializers.ValidationError({'user_id': 'User not found'}) from exc
         if user.role != User.Role.OWNER:
-            raise serializers.ValidationError('User must have OWNER role')
-        return value
+            raise serializers.ValidationError({'user_id': 'User must have OWNER role'})
+        attrs['user'] = user
+        return attrs
 
     def save(self, **kwargs) -> User:
         tenant: Tenant = self.context['tenant']
-        user = User.objects.get(id=self.validated_data['user_id'])
+        user = self.validated_data['user']
         user.tenant = tenant
         user.role = User.Role.OWNER
         user.save()
@@ -91,6 +264,14 @@ class OwnerInvitationResponseSerializer(serializers.ModelSerializer):
         read_only_fields = fields
 
 
+class BulkOwnerInvitationResponseSerializer(OwnerInvitationResponseSerializer):
+    tenant_id = serializers.IntegerField(read_only=True)
+
+    class Meta(OwnerInvitationResponseSerializer.Meta):
+        fields = ('id', 'tenant_id', 'email', 'token', 'status', 'expires_at')
+        read_only_fields = fields
+
+
 class AcceptOwnerInviteSerializer(serializers.Serializer):
     token = serializers.CharField()
     password = serializers.CharField(write_only=True, validators=[validate_password])
@@ -100,7 +281,8 @@ class AcceptOwnerInviteSerializer(serializers.Serializer):
     def validate(self, attrs: dict) -> dict:
         token = attrs['token']
         try:
-            invitation = OwnerInvitation.objects.select_related('tenant').get(token=token)
+            # The token is the credential: never narrow it to the caller's tenant.
+            invitation = OwnerInvitation.all_tenants.select_related('tenant').get(token=token)
         except OwnerInvitation.DoesNotExist as exc:
             raise serializers.ValidationError({'token': 'Invalid invitation token'}) from exc
 
@@ -120,7 +302,7 @@ class AcceptOwnerInviteSerializer(serializers.Serializer):
         last_name = validated_data['last_name']
 
         try:
-            user = User.objects.get(email=invitation.email)
+            user = User.objects.get(email=User.objects.normalize_email(invitation.email))
         except User.DoesNotExist:
             user = User.objects.create_user(
                 email=invitation.email,
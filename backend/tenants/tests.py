@@ -1,8 +1,40 @@
+import os
+import tempfile
+import time
+from datetime import timedelta
+from io import StringIO
+from smtplib import SMTPException
+from unittest import mock, skipUnless
+
 from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Permission
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core import mail
+from django.core.cache import cache
+from django.core.management import call_command
+from django.conf import settings
+from django.db import connection, connections, router
+from django.http import HttpResponse
+from django.test import RequestFactory, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.db.models import Count, F, Q
+from django.utils import timezone
+from django.utils.http import http_date
 from rest_framework import status
+from rest_framework.renderers import JSONRenderer
 from rest_framework.test import APITestCase
 
-from .models import OwnerInvitation, Tenant
+from accounts.serializers import EmailTokenObtainPairSerializer
+from sports.db.middleware import ReplicaRoutingMiddleware
+from sports.renderers import ORJSONRenderer
+
+from .cache import cache_stats, cached_response, reset_cache_stats
+from .models import SEARCH_FIELDS, InvitationEmail, OwnerInvitation, Tenant
+from .outbox import deliver_batch
+from .middleware import TenantResolutionMiddleware
+from .resolution import tenant_cache
+from .scoping import UNSCOPED, tenant_scope
+from .serializers import TenantSerializer, owners_prefetch, tenant_rows
 
 
 User = get_user_model()
@@ -25,7 +57,7 @@ class TenantPermissionsTests(APITestCase):
         self.client.force_authenticate(self.superadmin)
         response = self.client.get('/api/v1/tenants/')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.json()), 1)
+        self.assertEqual(len(response.json()['results']), 1)
 
     def test_owner_cannot_list_tenants(self):
         self.client.force_authenticate(self.owner)
@@ -33,6 +65,1019 @@ class TenantPermissionsTests(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
 
 
+class TenantPaginationTests(APITestCase):
+    def setUp(self):
+        self.superadmin = User.objects.create_superuser('pager@example.com', 'AdminPass123!')
+        # Duplicate names make sure ties are broken by id.
+        for index in range(7):
+            Tenant.objects.create(name=f'Club {index // 2}', slug=f'club-{index}')
+        self.client.force_authenticate(self.superadmin)
+
+    def test_cursor_walks_every_tenant_once_in_order(self):
+        url = '/api/v1/tenants/?page_size=3'
+        seen = []
+        while url:
+            body = self.client.get(url).json()
+            self.assertLessEqual(len(body['results']), 3)
+            seen.extend((tenant['name'], tenant['id']) for tenant in body['results'])
+            url = body['next']
+
+        self.assertEqual(len(seen), 7)
+        self.assertEqual(seen, sorted(seen))
+
+    def test_invalid_cursor_is_rejected(self):
+        response = self.client.get('/api/v1/tenants/?cursor=not-a-cursor')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class TenantRoleCountTests(APITestCase):
+    def setUp(self):
+        self.superadmin = User.objects.create_superuser('counts@example.com', 'AdminPass123!')
+        self.tenant = Tenant.objects.create(name='Counted Club', slug='counted-club')
+        self.other = Tenant.objects.create(name='Other Club', slug='other-counted-club')
+
+    def _counts(self, tenant):
+        tenant.refresh_from_db()
+        return tenant.owners_count, tenant.coaches_count, tenant.clients_count
+
+    def test_counters_follow_user_role_and_tenant_changes(self):
+        user = User.objects.create_user('coach@example.com', 'CoachPass123!', role=User.Role.COACH, tenant=self.tenant)
+        self.assertEqual(self._counts(self.tenant), (0, 1, 0))
+
+        user.role = User.Role.OWNER
+        user.tenant = self.other
+        user.save()
+        self.assertEqual(self._counts(self.tenant), (0, 0, 0))
+        self.assertEqual(self._counts(self.other), (1, 0, 0))
+
+        user.delete()
+        self.assertEqual(self._counts(self.other), (0, 0, 0))
+
+    def test_deferred_load_still_tracks_claim_changes(self):
+        user = User.objects.create_user('deferred@example.com', 'CoachPass123!', role=User.Role.COACH, tenant=self.tenant)
+
+        partial = User.objects.only('email').get(pk=user.pk)
+        partial.role = User.Role.OWNER
+        partial.save()
+        self.assertEqual(self._counts(self.tenant), (1, 0, 0))
+        self.assertEqual(partial.token_version, 1)
+
+        partial = User.objects.only('email', 'role').get(pk=user.pk)
+        partial.tenant = self.other
+        partial.save()
+        self.assertEqual(self._counts(self.tenant), (0, 0, 0))
+        self.assertEqual(self._counts(self.other), (1, 0, 0))
+
+        partial = User.objects.only('email').get(pk=user.pk)
+        partial.first_name = 'Unchanged claims'
+        partial.save()
+        user.refresh_from_db()
+        self.assertEqual(user.token_version, 2)
+        self.assertEqual(self._counts(self.other), (1, 0, 0))
+
+    def test_assign_owner_and_bulk_updates_keep_counters(self):
+        owner = User.objects.create_user('assign@example.com', 'OwnerPass123!', role=User.Role.OWNER, tenant=self.other)
+        User.objects.create_user('client@example.com', 'ClientPass123!', tenant=self.tenant)
+
+        self.client.force_authenticate(self.superadmin)
+        response = self.client.post(f'/api/v1/tenants/{self.tenant.id}/assign-owner/', {'user_id': owner.id})
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(self._counts(self.tenant), (1, 0, 1))
+        self.assertEqual(self._counts(self.other), (0, 0, 0))
+
+        User.objects.filter(tenant=self.tenant).update(role=User.Role.COACH)
+        self.assertEqual(self._counts(self.tenant), (0, 2, 0))
+
+    def test_bulk_update_of_tenant_and_role_counts_once(self):
+        coach = User.objects.create_user('bulk-coach@example.com', 'CoachPass123!', role=User.Role.COACH, tenant=self.tenant)
+        client = User.objects.create_user('bulk-client@example.com', 'ClientPass123!', tenant=self.tenant)
+
+        coach.tenant, coach.role = self.other, User.Role.OWNER
+        client.role = User.Role.COACH
+        User.objects.bulk_update([coach, client], ['tenant', 'role'])
+        self.assertEqual(self._counts(self.tenant), (0, 1, 0))
+        self.assertEqual(self._counts(self.other), (1, 0, 0))
+        self.assertEqual(
+            dict(User.objects.filter(pk__in=[coach.pk, client.pk]).values_list('pk', 'token_version')),
+            {coach.pk: 1, client.pk: 1},
+        )
+
+        User.objects.filter(pk=client.pk).update(tenant=F('tenant'), role=User.Role.CLIENT)
+        self.assertEqual(self._counts(self.tenant), (0, 0, 1))
+
+    def test_tenant_save_does_not_overwrite_counters(self):
+        stale = Tenant.objects.get(pk=self.tenant.pk)
+        User.objects.create_user('owner@example.com', 'OwnerPass123!', role=User.Role.OWNER, tenant=self.tenant)
+
+        stale.name = 'Renamed Club'
+        stale.save()
+        self.assertEqual(self._counts(self.tenant), (1, 0, 0))
+
+    def test_recount_command_repairs_drift(self):
+        User.objects.create_user('owner@example.com', 'OwnerPass123!', role=User.Role.OWNER, tenant=self.tenant)
+        Tenant.objects.filter(pk=self.tenant.pk).update(owners_count=5)
+
+        out = StringIO()
+        call_command('recount_tenant_members', stdout=out)
+
+        self.assertIn(str(self.tenant.pk), out.getvalue())
+        self.assertEqual(self._counts(self.tenant), (1, 0, 0))
+
+
+class TenantOwnersQueryTests(APITestCase):
+    def setUp(self):
+        self.superadmin = User.objects.create_superuser('owners-admin@example.com', 'AdminPass123!')
+        self.tenants = [Tenant.objects.create(name=f'Club {index}', slug=f'owners-club-{index}') for index in range(3)]
+        for index, tenant in enumerate(self.tenants[:2]):
+            for suffix in ('b', 'a'):
+                User.objects.create_user(
+                    email=f'{suffix}-owner{index}@example.com',
+                    password='OwnerPass123!',
+                    role=User.Role.OWNER,
+                    tenant=tenant,
+                )
+        self.client.force_authenticate(self.superadmin)
+
+    def test_detail_fetches_owners_with_one_prefetch(self):
+        tenant = self.tenants[0]
+        with self.assertNumQueries(2):
+            response = self.client.get(f'/api/v1/tenants/{tenant.id}/')
+
+        emails = [owner['email'] for owner in response.json()['owners']]
+        self.assertEqual(emails, ['a-owner0@example.com', 'b-owner0@example.com'])
+
+    def test_owners_of_many_tenants_in_one_query(self):
+        ids = ','.join(str(tenant.id) for tenant in self.tenants)
+        with self.assertNumQueries(1):
+            response = self.client.get(f'/api/v1/tenants/owners/?ids={ids}')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        body = response.json()
+        self.assertEqual(len(body[str(self.tenants[1].id)]), 2)
+        self.assertEqual(body[str(self.tenants[2].id)], [])
+        self.assertEqual(set(body[str(self.tenants[0].id)][0]), {'id', 'email', 'first_name', 'last_name'})
+
+    def test_owners_query_requires_valid_ids(self):
+        response = self.client.get('/api/v1/tenants/owners/?ids=abc')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class TenantImportTests(APITestCase):
+    def setUp(self):
+        self.superadmin = User.objects.create_superuser('import@example.com', 'AdminPass123!')
+        Tenant.objects.create(name='Existing Club', slug='existing')
+        self.client.force_authenticate(self.superadmin)
+
+    def _upload(self, name, content):
+        return self.client.post(
+            '/api/v1/tenants/import/',
+            {'file': SimpleUploadedFile(name, content.encode('utf-8'))},
+            format='multipart',
+        )
+
+    def test_csv_import_reports_row_errors(self):
+        content = (
+            'name,slug,contact_email,is_active\n'
+            'North Club,north,north@example.com,true\n'
+            'Dup Club,existing,,true\n'
+            'South Club,south,not-an-email,true\n'
+            'North Again,north,,false\n'
+        )
+        response = self._upload('clubs.csv', content)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        body = response.json()
+        self.assertEqual(body['created'], 1)
+        self.assertEqual(sorted(error['row'] for error in body['errors']), [2, 3, 4])
+        self.assertTrue(Tenant.objects.filter(slug='north', contact_email='north@example.com').exists())
+
+    def test_ndjson_import_checks_slugs_per_batch(self):
+        lines = [f'{{"name": "Club {index}", "slug": "club-{index}"}}' for index in range(30)]
+        lines.append('not json')
+        # One slug lookup plus the savepoint-wrapped INSERT for the single batch.
+        with self.assertNumQueries(4):
+            response = self._upload('clubs.ndjson', '\n'.join(lines))
+
+        self.assertEqual(response.json()['created'], 30)
+        self.assertEqual(response.json()['errors'][0]['row'], 31)
+
+    def test_unknown_format_is_rejected(self):
+        response = self._upload('clubs.txt', 'name,slug\n')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class BulkOwnerInviteTests(APITestCase):
+    def setUp(self):
+        self.superadmin = User.objects.create_superuser('bulk-invite@example.com', 'AdminPass123!')
+        self.first = Tenant.objects.create(name='First Club', slug='first-club')
+        self.second = Tenant.objects.create(name='Second Club', slug='second-club')
+        OwnerInvitation.objects.create(tenant=self.first, email='pending@example.com')
+        self.client.force_authenticate(self.superadmin)
+
+    def test_bulk_invite_creates_tokens_and_reports_duplicates(self):
+        payload = {
+            'invitations': [
+                {'tenant_id': self.first.id, 'email': 'a@example.com'},
+                {'tenant_id': self.second.id, 'email': 'a@example.com'},
+                {'tenant_id': self.first.id, 'email': 'pending@example.com'},
+                {'tenant_id': self.first.id, 'email': 'a@example.com'},
+                {'tenant_id': 999999, 'email': 'b@example.com'},
+            ]
+        }
+        # Tenant lookup, pending lookup, then invitation and outbox inserts in one savepoint.
+        with self.assertNumQueries(6):
+            response = self.client.post('/api/v1/tenants/invite-owners/', payload, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        body = response.json()
+        self.assertEqual([item['tenant_id'] for item in body['invitations']], [self.first.id, self.second.id])
+        self.assertTrue(all(item['token'] for item in body['invitations']))
+        self.assertEqual([error['index'] for error in body['errors']], [2, 3, 4])
+        self.assertEqual(OwnerInvitation.objects.filter(email='a@example.com').count(), 2)
+
+    def test_bulk_invite_with_nothing_created_is_not_a_201(self):
+        payload = {
+            'invitations': [
+                {'tenant_id': self.first.id, 'email': 'pending@example.com'},
+                {'tenant_id': 999999, 'email': 'b@example.com'},
+            ]
+        }
+        response = self.client.post('/api/v1/tenants/invite-owners/', payload, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        body = response.json()
+        self.assertEqual(body['invitations'], [])
+        self.assertEqual([error['index'] for error in body['errors']], [0, 1])
+
+
+class InvitationOutboxTests(APITestCase):
+    def setUp(self):
+        self.superadmin = User.objects.create_superuser('outbox@example.com', 'AdminPass123!')
+        self.tenant = Tenant.objects.create(name='Mail Club', slug='mail-club')
+        self.client.force_authenticate(self.superadmin)
+
+    def _invite(self, email):
+        return self.client.post(f'/api/v1/tenants/{self.tenant.id}/invite-owner/', {'email': email})
+
+    def test_invite_queues_email_without_sending_it(self):
+        response = self._invite('queued@example.com')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(mail.outbox), 0)
+        self.assertEqual(InvitationEmail.objects.filter(status=InvitationEmail.Status.PENDING).count(), 1)
+
+    def test_worker_sends_queued_emails_in_one_batch(self):
+        self._invite('first@example.com')
+        self._invite('second@example.com')
+
+        call_command('send_invitation_emails', stdout=StringIO())
+
+        self.assertEqual(sorted(message.to[0] for message in mail.outbox), ['first@example.com', 'second@example.com'])
+        token = OwnerInvitation.objects.get(email='first@example.com').token
+        self.assertTrue(any(token in message.body for message in mail.outbox))
+        self.assertFalse(InvitationEmail.objects.exclude(status=InvitationEmail.Status.SENT).exists())
+
+    def test_failed_send_is_retried_with_backoff(self):
+        self._invite('flaky@example.com')
+
+        with mock.patch(
+            'django.core.mail.backends.locmem.EmailBackend.send_messages',
+            side_effect=SMTPException('unavailable'),
+        ), self.assertLogs('tenants.outbox', 'WARNING'):
+            result = deliver_batch()
+
+        self.assertEqual(result.retried, 1)
+        email = InvitationEmail.objects.get()
+        self.assertEqual((email.status, email.attempts), (InvitationEmail.Status.PENDING, 1))
+        self.assertGreater(email.next_attempt_at, email.created_at)
+        self.assertEqual(deliver_batch().sent, 0)
+
+
+class InvitationSweepTests(APITestCase):
+    def setUp(self):
+        self.tenant = Tenant.objects.create(name='Sweep Club', slug='sweep-club')
+        now = timezone.now()
+        self.overdue = [
+            OwnerInvitation.objects.create(tenant=self.tenant, email=f'late{index}@example.com', expires_at=now - timedelta(hours=1))
+            for index in range(3)
+        ]
+        self.current = OwnerInvitation.objects.create(tenant=self.tenant, email='current@example.com')
+        self.old_accepted = OwnerInvitation.objects.create(
+            tenant=self.tenant, email='done@example.com', status=OwnerInvitation.Status.ACCEPTED
+        )
+        OwnerInvitation.objects.filter(pk=self.old_accepted.pk).update(updated_at=now - timedelta(days=120))
+
+    def test_sweep_expires_overdue_and_purges_old_invitations(self):
+        out = StringIO()
+        call_command('sweep_invitations', '--batch-size=2', stdout=out)
+
+        self.assertIn('Expired 3', out.getvalue())
+        self.assertEqual(
+            set(OwnerInvitation.objects.filter(status=OwnerInvitation.Status.EXPIRED).values_list('email', flat=True)),
+            {'late0@example.com', 'late1@example.com', 'late2@example.com'},
+        )
+        self.current.refresh_from_db()
+        self.assertEqual(self.current.status, OwnerInvitation.Status.PENDING)
+        self.assertFalse(OwnerInvitation.objects.filter(pk=self.old_accepted.pk).exists())
+
+    def test_freshly_expired_invitations_are_kept(self):
+        call_command('sweep_invitations', stdout=StringIO())
+        self.assertEqual(OwnerInvitation.objects.filter(status=OwnerInvitation.Status.EXPIRED).count(), 3)
+
+
+class AsyncReadEndpointTests(APITestCase):
+    def setUp(self):
+        self.superadmin = User.objects.create_superuser('async-admin@example.com', 'AdminPass123!')
+        self.tenant = Tenant.objects.create(name='Async Club', slug='async-club')
+        self.other = Tenant.objects.create(name='Busy Club', slug='busy-club')
+        self.owner = User.objects.create_user(
+            email='async-owner@example.com',
+            password='OwnerPass123!',
+            role=User.Role.OWNER,
+            tenant=self.tenant,
+        )
+
+    def _headers(self, user):
+        token = EmailTokenObtainPairSerializer.get_token(user).access_token
+        return {'HTTP_AUTHORIZATION': f'Bearer {token}'}
+
+    def test_async_list_matches_sync_list(self):
+        headers = self._headers(self.superadmin)
+        sync_body = self.client.get('/api/v1/tenants/?page_size=1', **headers).json()
+        async_body = self.client.get('/api/v1/async/tenants/?page_size=1', **headers).json()
+
+        self.assertEqual(async_body['results'], sync_body['results'])
+        self.assertIsNotNone(async_body['next'])
+
+    def test_async_list_applies_the_same_query_parameters(self):
+        Tenant.objects.create(name='Zed Inactive', slug='zed-inactive', is_active=False)
+        Tenant.objects.create(name='Zed Active', slug='zed-active')
+        headers = self._headers(self.superadmin)
+        for query in ('?is_active=false&q=zed&fields=id', '?q=zed&ordering=-slug&fields=slug,name', '?fields=nope'):
+            sync_response = self.client.get(f'/api/v1/tenants/{query}', **headers)
+            async_response = self.client.get(f'/api/v1/async/tenants/{query}', **headers)
+            self.assertEqual(async_response.status_code, sync_response.status_code, query)
+            # ``next`` links differ by path; errors and results must not.
+            sync_body, async_body = sync_response.json(), async_response.json()
+            self.assertEqual(async_body.get('results', async_body), sync_body.get('results', sync_body), query)
+
+    def test_async_detail_and_me_match_sync_views(self):
+        headers = self._headers(self.owner)
+        for path in (f'tenants/{self.tenant.id}/', 'me/'):
+            sync_response = self.client.get(f'/api/v1/{path}', **headers)
+            async_response = self.client.get(f'/api/v1/async/{path}', **headers)
+            self.assertEqual(async_response.status_code, status.HTTP_200_OK)
+            self.assertEqual(async_response.json(), sync_response.json())
+
+    def test_async_views_enforce_authentication_and_scope(self):
+        self.assertEqual(self.client.get('/api/v1/async/me/').status_code, status.HTTP_401_UNAUTHORIZED)
+
+        headers = self._headers(self.owner)
+        self.assertEqual(
+            self.client.get(f'/api/v1/async/tenants/{self.other.id}/', **headers).status_code,
+            status.HTTP_404_NOT_FOUND,
+        )
+        self.assertEqual(self.client.get('/api/v1/async/tenants/', **headers).status_code, status.HTTP_403_FORBIDDEN)
+
+
+class TenantResolutionTests(APITestCase):
+    def setUp(self):
+        tenant_cache.clear()
+        self.tenant = Tenant.objects.create(name='Harbour Club', slug='harbour', theme_primary='#004488')
+
+    def test_branding_resolves_tenant_from_subdomain_and_header(self):
+        by_host = self.client.get('/api/v1/branding/', HTTP_HOST='harbour.localhost')
+        by_header = self.client.get('/api/v1/branding/', HTTP_X_TENANT='harbour')
+
+        self.assertEqual(by_host.status_code, status.HTTP_200_OK)
+        self.assertEqual(by_host.json()['theme_primary'], '#004488')
+        self.assertEqual(by_header.json(), by_host.json())
+
+    def test_resolved_tenants_are_served_from_the_lru(self):
+        self.client.get('/api/v1/branding/', HTTP_X_TENANT='harbour')
+        with self.assertNumQueries(0):
+            response = self.client.get('/api/v1/branding/', HTTP_HOST='harbour.localhost')
+        self.assertEqual(response.json()['name'], 'Harbour Club')
+
+    def test_unknown_and_inactive_tenants_are_not_resolved(self):
+        self.assertEqual(
+            self.client.get('/api/v1/branding/', HTTP_X_TENANT='nowhere').status_code,
+            status.HTTP_404_NOT_FOUND,
+        )
+        self.assertEqual(self.client.get('/api/v1/branding/').status_code, status.HTTP_404_NOT_FOUND)
+
+        self.tenant.is_active = False
+        self.tenant.save()
+        self.assertEqual(
+            self.client.get('/api/v1/branding/', HTTP_X_TENANT='harbour').status_code,
+            status.HTTP_404_NOT_FOUND,
+        )
+
+    def test_saving_a_tenant_invalidates_its_entry(self):
+        self.client.get('/api/v1/branding/', HTTP_X_TENANT='harbour')
+        self.client.get('/api/v1/branding/', HTTP_X_TENANT='marina')
+
+        self.tenant.slug = 'marina'
+        self.tenant.name = 'Marina Club'
+        self.tenant.save()
+
+        self.assertEqual(
+            self.client.get('/api/v1/branding/', HTTP_X_TENANT='harbour').status_code,
+            status.HTTP_404_NOT_FOUND,
+        )
+        self.assertEqual(self.client.get('/api/v1/branding/', HTTP_X_TENANT='marina').json()['name'], 'Marina Club')
+
+
+class IndexUsageTests(APITestCase):
+    """
+    Plans for the hot predicates must use their supporting index on a
+    realistically sized dataset; a dropped or shadowed index fails here.
+    """
+
+    # Large enough that PostgreSQL prefers an index over a sequential scan.
+    TENANTS = 3000
+    MEMBERS_PER_TENANT = {'OWNER': 1, 'COACH': 2, 'CLIENT': 5}
+    INVITATIONS_PER_TENANT = 4
+
+    @classmethod
+    def setUpTestData(cls):
+        tenants = Tenant.objects.bulk_create(
+            Tenant(name=f'Club {index:04d}', slug=f'club-{index:04d}', is_active=index % 10 != 0)
+            for index in range(cls.TENANTS)
+        )
+        User.objects.bulk_create(
+            User(email=f'{role.lower()}-{number}@{tenant.slug}.example.com', password='!', role=role, tenant=tenant)
+            for tenant in tenants
+            for role, total in cls.MEMBERS_PER_TENANT.items()
+            for number in range(total)
+        )
+        now = timezone.now()
+        OwnerInvitation.objects.bulk_create(
+            OwnerInvitation(
+                tenant=tenant,
+                email=f'invitee-{number}@{tenant.slug}.example.com',
+                token=f'{tenant.slug}-{number}',
+                status=OwnerInvitation.Status.PENDING if number == 0 else OwnerInvitation.Status.ACCEPTED,
+                expires_at=now + timedelta(days=7),
+            )
+            for tenant in tenants
+            for number in range(cls.INVITATIONS_PER_TENANT)
+        )
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE')
+        cls.tenant = tenants[len(tenants) // 2]
+
+    def assertUsesIndex(self, queryset, *index_names, ordered=False):
+        plan = queryset.explain()
+        self.assertTrue(any(name in plan for name in index_names), msg=f'{index_names} not used:\n{plan}')
+        table = queryset.model._meta.db_table
+        # PostgreSQL "Seq Scan on t", SQLite "SCAN t" without "USING ... INDEX".
+        self.assertNotRegex(plan, rf'Seq Scan on "?{table}"?|SCAN "?{table}"?(?! USING)', msg=f'Full scan:\n{plan}')
+        if ordered:
+            self.assertNotRegex(plan, r'TEMP B-TREE|\bSort\b', msg=f'Rows sorted instead of read in index order:\n{plan}')
+
+    def test_owner_lookups_use_tenant_role_index(self):
+        owners = User.objects.filter(tenant_id=self.tenant.id, role=User.Role.OWNER)
+        self.assertUsesIndex(owners, 'user_tenant_role_idx')
+        self.assertUsesIndex(owners_prefetch().queryset.filter(tenant_id__in=[self.tenant.id]), 'user_tenant_role_idx')
+
+    def test_owner_count_uses_tenant_role_index(self):
+        counts = (
+            User.objects.filter(tenant_id__in=[self.tenant.id], role=User.Role.OWNER)
+            .values('tenant_id')
+            .annotate(total=Count('id'))
+            .order_by()
+        )
+        self.assertUsesIndex(counts, 'user_tenant_role_idx')
+
+    def test_pending_duplicate_check_uses_partial_index(self):
+        pending = OwnerInvitation.objects.filter(
+            tenant=self.tenant,
+            email=f'invitee-0@{self.tenant.slug}.example.com',
+            status=OwnerInvitation.Status.PENDING,
+        )
+        self.assertUsesIndex(pending, 'invitation_pending_email_idx')
+
+    def test_scoped_invitation_listing_uses_tenant_index(self):
+        with tenant_scope(self.tenant.id):
+            self.assertUsesIndex(OwnerInvitation.objects.all(), 'invitation_tenant_created_idx')
+
+    def test_filtered_tenant_listing_reads_in_index_order(self):
+        # SQLite keeps no per-value statistics and may walk (name, id) and
+        # filter instead; PostgreSQL should pick the is_active-prefixed index
+        # for the selective filter.
+        listing_indexes = ('tenant_active_name_id_idx',)
+        if connection.vendor != 'postgresql':
+            listing_indexes += ('tenant_name_id_idx',)
+        for is_active in (True, False):
+            page = Tenant.objects.filter(is_active=is_active).order_by('name', 'id')
+            self.assertUsesIndex(page[:51], *listing_indexes, ordered=True)
+            self.assertUsesIndex(
+                page.filter(Q(name__gt='Club 1500') | Q(name='Club 1500', id__gt=self.tenant.id))[:51],
+                *listing_indexes,
+                ordered=True,
+            )
+
+    @skipUnless(connection.vendor == 'postgresql', 'Trigram indexes only exist on PostgreSQL')
+    def test_tenant_search_uses_trigram_indexes(self):
+        for field in SEARCH_FIELDS:
+            self.assertUsesIndex(Tenant.objects.filter(**{f'{field}__icontains': '1234'}), f'tenant_{field}_trgm_idx')
+
+
+class TenantSearchTests(APITestCase):
+    def setUp(self):
+        self.superadmin = User.objects.create_superuser('search-admin@example.com', 'AdminPass123!')
+        self.client.force_authenticate(self.superadmin)
+        Tenant.objects.create(name='Riverside Rowing', slug='riverside', contact_email='crew@rowing.example.com')
+        Tenant.objects.create(name='Hilltop Tennis', slug='hilltop', contact_email='desk@tennis.example.com')
+        Tenant.objects.create(name='Lakeside Rowing', slug='lake-crew', is_active=False)
+
+    def _slugs(self, query):
+        response = self.client.get(f'/api/v1/tenants/{query}')
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.content)
+        return [tenant['slug'] for tenant in response.json()['results']]
+
+    def test_q_matches_name_slug_and_email_case_insensitively(self):
+        self.assertEqual(self._slugs('?q=rowing'), ['lake-crew', 'riverside'])
+        self.assertEqual(self._slugs('?q=CREW'), ['lake-crew', 'riverside'])
+        self.assertEqual(self._slugs('?q=desk@'), ['hilltop'])
+        self.assertEqual(self._slugs('?q=100%25'), [])
+
+    def test_is_active_filter(self):
+        self.assertEqual(self._slugs('?is_active=false'), ['lake-crew'])
+        self.assertEqual(self._slugs('?q=rowing&is_active=true'), ['riverside'])
+        response = self.client.get('/api/v1/tenants/?is_active=maybe')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_ordering_pages_through_every_tenant(self):
+        for ordering, expected in (
+            ('-name', ['riverside', 'lake-crew', 'hilltop']),
+            ('slug', ['hilltop', 'lake-crew', 'riverside']),
+            ('-slug', ['riverside', 'lake-crew', 'hilltop']),
+        ):
+            url, seen = f'/api/v1/tenants/?ordering={ordering}&page_size=1', []
+            while url:
+                body = self.client.get(url).json()
+                seen.extend(tenant['slug'] for tenant in body['results'])
+                url = body['next']
+            self.assertEqual(seen, expected, ordering)
+
+    def test_unknown_ordering_is_rejected(self):
+        response = self.client.get('/api/v1/tenants/?ordering=address')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class QueryBudgetTests(APITestCase):
+    """
+    Every endpoint runs a fixed number of queries, whatever the number of
+    tenants and users. Caches are cleared first so the cold path is measured.
+    """
+
+    SCALES = (1, 100, 10_000)
+    BUDGETS = {
+        'login': 2,
+        # Includes the token version check, a query while the cache is cold.
+        'refresh': 5,
+        'me': 3,
+        'tenant-list': 2,
+        'tenant-detail': 3,
+        'invite-owner': 7,
+        # Includes re-reading the SQL-incremented token_version after the role change.
+        'assign-owner': 9,
+        'accept-invite': 7,
+    }
+    PASSWORD = 'BudgetPass123!'
+
+    def setUp(self):
+        self.client.defaults['HTTP_HOST'] = 'localhost'
+        self.superadmin = User.objects.create_superuser('budget-admin@example.com', self.PASSWORD)
+        self.subject = Tenant.objects.create(name='Budget Club', slug='budget-club')
+        self.owner = User.objects.create_user(
+            email='budget-owner@example.com', password=self.PASSWORD, role=User.Role.OWNER, tenant=self.subject
+        )
+
+    def _grow_to(self, scale):
+        """Bring the dataset to ``scale`` tenants and ``scale`` users."""
+        tenants = Tenant.objects.bulk_create(
+            Tenant(name=f'Club {index:05d}', slug=f'budget-{index:05d}') for index in range(Tenant.objects.count(), scale)
+        )
+        # Half the new users own the subject tenant so its owner list grows too.
+        start = User.objects.count()
+        User.objects.bulk_create(
+            User(
+                email=f'member-{index:05d}@example.com',
+                password='!',
+                role=User.Role.OWNER if index % 2 else User.Role.CLIENT,
+                tenant=self.subject if index % 2 else (tenants[index % len(tenants)] if tenants else self.subject),
+            )
+            for index in range(start, scale)
+        )
+
+    def _auth(self, user):
+        token = EmailTokenObtainPairSerializer.get_token(user).access_token
+        return {'HTTP_AUTHORIZATION': f'Bearer {token}'}
+
+    def _measure(self, scale):
+        admin = self._auth(self.superadmin)
+        requests = {
+            'login': lambda: self.client.post(
+                '/auth/login/', {'email': self.owner.email, 'password': self.PASSWORD}, format='json'
+            ),
+            'me': lambda: self.client.get('/api/v1/me/', **self._auth(self.owner)),
+            'tenant-list': lambda: self.client.get('/api/v1/tenants/', **admin),
+            'tenant-detail': lambda: self.client.get(f'/api/v1/tenants/{self.subject.id}/', **admin),
+            'invite-owner': lambda: self.client.post(
+                f'/api/v1/tenants/{self.subject.id}/invite-owner/',
+                {'email': f'invitee-{scale}@example.com'},
+                format='json',
+                **admin,
+            ),
+        }
+        counts, responses = {}, {}
+        for name, send in requests.items():
+            cache.clear()
+            with CaptureQueriesContext(connection) as queries:
+                responses[name] = send()
+            counts[name] = len(queries)
+
+        refresh = responses['login'].json()['refresh']
+        invitation = OwnerInvitation.objects.get(email=f'invitee-{scale}@example.com')
+        # An owner of another club, moved over by assign-owner.
+        new_owner = User.objects.create_user(
+            email=f'spare-{scale}@example.com',
+            password=self.PASSWORD,
+            role=User.Role.OWNER,
+            tenant=Tenant.objects.create(name=f'Spare {scale}', slug=f'spare-{scale}'),
+        )
+        followups = {
+            'refresh': lambda: self.client.post('/auth/refresh/', {'refresh': refresh}, format='json'),
+            'assign-owner': lambda: self.client.post(
+                f'/api/v1/tenants/{self.subject.id}/assign-owner/', {'user_id': new_owner.id}, format='json', **admin
+            ),
+            'accept-invite': lambda: self.client.post(
+                '/api/v1/owners/accept-invite/',
+                {'token': invitation.token, 'password': self.PASSWORD, 'first_name': 'Ada', 'last_name': 'Lovelace'},
+                format='json',
+            ),
+        }
+        for name, send in followups.items():
+            cache.clear()
+            with CaptureQueriesContext(connection) as queries:
+                responses[name] = send()
+            counts[name] = len(queries)
+
+        for name, response in responses.items():
+            self.assertLess(response.status_code, 300, msg=f'{name} at scale {scale}: {response.content[:200]}')
+        return counts
+
+    def test_query_counts_do_not_grow_with_data(self):
+        for scale in self.SCALES:
+            self._grow_to(scale)
+            counts = self._measure(scale)
+            for name, budget in self.BUDGETS.items():
+                with self.subTest(endpoint=name, scale=scale):
+                    self.assertEqual(counts[name], budget)
+
+
+class ConditionalGetTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.superadmin = User.objects.create_superuser('etag-admin@example.com', 'AdminPass123!')
+        self.tenant = Tenant.objects.create(name='Etag Club', slug='etag-club')
+        Tenant.objects.create(name='Other Club', slug='other-club')
+        self.client.force_authenticate(self.superadmin)
+
+    def test_unchanged_detail_is_revalidated_without_queries(self):
+        url = f'/api/v1/tenants/{self.tenant.id}/'
+        first = self.client.get(url)
+        self.assertEqual(first['Cache-Control'], 'private, no-cache')
+        self.assertIn('Last-Modified', first)
+
+        with self.assertNumQueries(0):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response['ETag'], first['ETag'])
+
+        User.objects.create_user(
+            email='late-owner@example.com', password='OwnerPass123!', role=User.Role.OWNER, tenant=self.tenant
+        )
+        changed = self.client.get(url, HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(changed.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(changed['ETag'], first['ETag'])
+
+    def test_list_page_is_revalidated_from_its_rows(self):
+        first = self.client.get('/api/v1/tenants/')
+
+        with self.assertNumQueries(1):
+            response = self.client.get('/api/v1/tenants/', HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        # Counter updates bypass updated_at but still change the page.
+        User.objects.create_user(
+            email='counted-owner@example.com', password='OwnerPass123!', role=User.Role.OWNER, tenant=self.tenant
+        )
+        changed = self.client.get('/api/v1/tenants/', HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(changed.status_code, status.HTTP_200_OK)
+
+    def test_list_is_not_validated_by_date(self):
+        first = self.client.get('/api/v1/tenants/')
+        self.assertNotIn('Last-Modified', first)
+
+        since = http_date(time.time() + 60)
+        User.objects.create_user(
+            email='dated-owner@example.com', password='OwnerPass123!', role=User.Role.OWNER, tenant=self.tenant
+        )
+        self.assertEqual(self.client.get('/api/v1/tenants/', HTTP_IF_MODIFIED_SINCE=since).status_code, status.HTTP_200_OK)
+        self.tenant.delete()
+        response = self.client.get('/api/v1/tenants/', HTTP_IF_MODIFIED_SINCE=since)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([row['slug'] for row in response.json()['results']], ['other-club'])
+
+    def test_if_modified_since_is_honoured(self):
+        first = self.client.get(f'/api/v1/tenants/{self.tenant.id}/')
+        response = self.client.get(f'/api/v1/tenants/{self.tenant.id}/', HTTP_IF_MODIFIED_SINCE=first['Last-Modified'])
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+
+class FastListSerializationTests(APITestCase):
+    def setUp(self):
+        Tenant.objects.create(name='Zürich Club', slug='zurich', address='Line\u2028break', theme_primary='#fff')
+        Tenant.objects.create(name='Empty Club', slug='empty', is_active=False)
+        Tenant.objects.filter(slug='empty').update(owners_count=3)
+
+    def test_rows_match_the_model_serializer(self):
+        tenants = Tenant.objects.order_by('name', 'id')
+        expected = TenantSerializer(tenants, many=True).data
+        rows = tenant_rows.serialize(tenants.values_list(*tenant_rows.columns))
+
+        self.assertEqual(rows, expected)
+        self.assertEqual([list(row) for row in rows], [list(row) for row in expected])
+
+    def test_orjson_renderer_output_is_byte_identical(self):
+        payload = {'next': None, 'results': TenantSerializer(Tenant.objects.order_by('name'), many=True).data}
+        self.assertEqual(ORJSONRenderer().render(payload), JSONRenderer().render(payload))
+
+    def test_list_endpoint_renders_with_orjson(self):
+        superadmin = User.objects.create_superuser('fast-admin@example.com', 'AdminPass123!')
+        self.client.force_authenticate(superadmin)
+
+        response = self.client.get('/api/v1/tenants/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsInstance(response.accepted_renderer, ORJSONRenderer)
+        self.assertEqual(
+            response.json()['results'],
+            TenantSerializer(Tenant.objects.order_by('name', 'id'), many=True).data,
+        )
+
+    def test_orjson_parser_rejects_invalid_json(self):
+        superadmin = User.objects.create_superuser('parse-admin@example.com', 'AdminPass123!')
+        self.client.force_authenticate(superadmin)
+
+        response = self.client.post('/api/v1/tenants/', '{"name": NaN}', content_type='application/json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('JSON parse error', response.json()['detail'])
+
+        response = self.client.post(
+            '/api/v1/tenants/', '{"name": "Café", "slug": "cafe"}', content_type='application/json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.json()['name'], 'Café')
+
+
+class SparseFieldsetTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.superadmin = User.objects.create_superuser('sparse-admin@example.com', 'AdminPass123!')
+        self.tenant = Tenant.objects.create(name='Sparse Club', slug='sparse-club', address='1 Long Street')
+        User.objects.create_user(
+            email='sparse-owner@example.com', password='OwnerPass123!', role=User.Role.OWNER, tenant=self.tenant
+        )
+        self.client.force_authenticate(self.superadmin)
+
+    def test_list_selects_only_requested_columns(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/api/v1/tenants/?fields=id,name,slug,is_active')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.json()['results'],
+            [{'id': self.tenant.id, 'name': 'Sparse Club', 'slug': 'sparse-club', 'is_active': True}],
+        )
+        sql = queries[0]['sql']
+        self.assertNotIn('address', sql)
+        self.assertNotIn('owners_count', sql)
+
+    def test_list_fields_survive_the_next_link(self):
+        Tenant.objects.create(name='Tail Club', slug='tail-club')
+        first = self.client.get('/api/v1/tenants/?fields=slug&page_size=1').json()
+
+        self.assertEqual(first['results'], [{'slug': 'sparse-club'}])
+        self.assertEqual(self.client.get(first['next']).json()['results'], [{'slug': 'tail-club'}])
+
+    def test_detail_skips_unrequested_owners(self):
+        url = f'/api/v1/tenants/{self.tenant.id}/'
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url + '?fields=name,owners_count')
+
+        self.assertEqual(response.json(), {'name': 'Sparse Club', 'owners_count': 1})
+        self.assertEqual(len(queries), 1)
+        self.assertNotIn('address', queries[0]['sql'])
+
+        full = self.client.get(url)
+        self.assertEqual(len(full.json()['owners']), 1)
+        self.assertNotEqual(full['ETag'], response['ETag'])
+
+    def test_unknown_fields_are_rejected(self):
+        response = self.client.get('/api/v1/tenants/?fields=id,secret')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.json(), {'fields': ['Unknown field(s): secret.']})
+
+
+class TenantScopedManagerTests(APITestCase):
+    def setUp(self):
+        tenant_cache.clear()
+        self.factory = RequestFactory()
+        self.home = Tenant.objects.create(name='Home Club', slug='home')
+        self.away = Tenant.objects.create(name='Away Club', slug='away')
+        for tenant in (self.home, self.away):
+            OwnerInvitation.objects.create(tenant=tenant, email=f'owner@{tenant.slug}.example.com')
+        self.owner = User.objects.create_user(
+            email='scoped-owner@example.com', password='OwnerPass123!', role=User.Role.OWNER, tenant=self.home
+        )
+        self.superadmin = User.objects.create_superuser('scoped-admin@example.com', 'AdminPass123!')
+
+    def _visible_invitations(self, user=None, **headers):
+        def view(request):
+            if user is not None:
+                request.user = user
+            request.emails = sorted(OwnerInvitation.objects.values_list('email', flat=True))
+            return HttpResponse()
+
+        request = self.factory.get('/api/v1/tenants/', **headers)
+        TenantResolutionMiddleware(view)(request)
+        return request.emails
+
+    def test_members_only_see_their_tenant(self):
+        self.assertEqual(self._visible_invitations(self.owner), ['owner@home.example.com'])
+        self.assertEqual(self._visible_invitations(self.owner, HTTP_X_TENANT='away'), ['owner@home.example.com'])
+        self.assertEqual(len(self._visible_invitations(self.superadmin)), 2)
+
+    def test_anonymous_requests_follow_the_resolved_tenant(self):
+        self.assertEqual(self._visible_invitations(HTTP_X_TENANT='away'), ['owner@away.example.com'])
+
+    def test_anonymous_requests_without_a_tenant_see_nothing(self):
+        self.assertEqual(self._visible_invitations(), [])
+        self.assertEqual(self._visible_invitations(HTTP_X_TENANT='unknown'), [])
+
+    def test_explicit_scope_outside_requests(self):
+        self.assertEqual(OwnerInvitation.objects.count(), 2)
+        with tenant_scope(self.home.id):
+            self.assertEqual(list(User.scoped.values_list('email', flat=True)), [self.owner.email])
+            self.assertIn('"tenant_id" =', str(owners_prefetch().queryset.query))
+            self.assertIn('"tenant_id" =', str(OwnerInvitation.objects.all().query))
+            self.assertEqual(OwnerInvitation.all_tenants.count(), 2)
+            with tenant_scope(UNSCOPED):
+                self.assertEqual(OwnerInvitation.objects.count(), 2)
+        with tenant_scope(None):
+            self.assertFalse(OwnerInvitation.objects.exists())
+
+
+@override_settings(REPLICA_DATABASES=['replica'])
+class ReplicaRoutingTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.factory = RequestFactory()
+        self.writer = User.objects.create_user(email='writer@example.com', password='WriterPass123!')
+        self.reader = User.objects.create_user(email='reader@example.com', password='ReaderPass123!')
+        self.middleware = ReplicaRoutingMiddleware(self._record_database)
+
+    def _record_database(self, request):
+        request.read_database = router.db_for_read(Tenant)
+        return HttpResponse()
+
+    def _send(self, method, user=None, path='/api/v1/tenants/', cookies=None):
+        headers = {}
+        if user is not None:
+            token = EmailTokenObtainPairSerializer.get_token(user).access_token
+            headers['HTTP_AUTHORIZATION'] = f'Bearer {token}'
+        request = getattr(self.factory, method)(path, **headers)
+        request.COOKIES.update(cookies or {})
+        request.response = self.middleware(request)
+        self.last_response = request.response
+        return request.read_database
+
+    def test_safe_requests_read_from_replica_and_writes_from_primary(self):
+        self.assertEqual(self._send('get', self.reader), 'replica')
+        self.assertEqual(self._send('get'), 'replica')
+        self.assertEqual(self._send('post', self.writer), 'default')
+        self.assertEqual(router.db_for_read(Tenant), 'default')
+
+    def test_client_sticks_to_primary_after_a_write(self):
+        self._send('post', self.writer)
+
+        self.assertEqual(self._send('get', self.writer), 'default')
+        self.assertEqual(self._send('get', self.reader), 'replica')
+
+        cache.clear()
+        self.assertEqual(self._send('get', self.writer), 'replica')
+
+    def test_cached_payloads_are_built_from_primary(self):
+        def build_through_cache(request):
+            request.read_database = cached_response('routing-test', lambda: router.db_for_read(Tenant))
+            return HttpResponse()
+
+        request = self.factory.get('/api/v1/me/')
+        ReplicaRoutingMiddleware(build_through_cache)(request)
+        self.assertEqual(request.read_database, 'default')
+
+    def test_write_without_bearer_token_pins_with_a_cookie(self):
+        self.assertEqual(self._send('post', path='/api/v1/owners/accept-invite/'), 'default')
+        cookie = self.last_response.cookies[settings.REPLICA_PIN_COOKIE]
+        self.assertEqual(cookie['max-age'], settings.REPLICA_PIN_SECONDS)
+
+        pinned = {settings.REPLICA_PIN_COOKIE: cookie.value}
+        self.assertEqual(self._send('get', self.reader, cookies=pinned), 'default')
+        self.assertEqual(self._send('get', cookies=pinned, path='/api/v1/me/'), 'default')
+        self.assertEqual(self._send('get', self.reader), 'replica')
+
+    def test_only_marked_api_reads_use_replicas(self):
+        self.assertEqual(self._send('get', self.reader, path='/api/v1/me/'), 'replica')
+        self.assertEqual(self._send('get', self.reader, path='/api/v1/tenants/1/'), 'replica')
+        self.assertEqual(self._send('get', self.reader, path='/api/v1/async/tenants/'), 'replica')
+        for path in ('/admin/', '/admin/tenants/tenant/', '/api/v1/tenants/owners/', '/api/v1/branding/', '/nowhere/'):
+            self.assertEqual(self._send('get', self.reader, path=path), 'default', path)
+
+    @override_settings(REPLICA_DATABASES=[])
+    def test_without_replicas_everything_uses_primary(self):
+        self.assertEqual(self._send('get', self.reader), 'default')
+
+
+class ReplicaDatabaseTests(APITestCase):
+    """
+    End to end against a second, real database: a SQLite file standing in
+    for the replica, holding different rows from the primary.
+    """
+
+    replica = 'replica_file'
+
+    def setUp(self):
+        cache.clear()
+        self.workdir = tempfile.TemporaryDirectory()
+        connections.settings[self.replica] = {
+            **connections.settings['default'],
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': os.path.join(self.workdir.name, 'replica.sqlite3'),
+            'TEST': {},
+        }
+        self.addCleanup(self._drop_replica)
+        # Just the table: the trigram indexes are PostgreSQL-only.
+        with connections[self.replica].schema_editor() as editor:
+            editor.execute(*editor.table_sql(Tenant))
+        Tenant.objects.using(self.replica).create(name='Replica Club', slug='replica-club')
+
+        self.primary_tenant = Tenant.objects.create(name='Primary Club', slug='primary-club')
+        self.superadmin = User.objects.create_superuser('replica-admin@example.com', 'AdminPass123!')
+        self.invitation = OwnerInvitation.objects.create(tenant=self.primary_tenant, email='lagged@example.com')
+        access = EmailTokenObtainPairSerializer.get_token(self.superadmin).access_token
+        self.bearer = {'HTTP_AUTHORIZATION': f'Bearer {access}'}
+
+        routing = override_settings(REPLICA_DATABASES=[self.replica])
+        routing.enable()
+        self.addCleanup(routing.disable)
+
+    def _drop_replica(self):
+        connections[self.replica].close()
+        del connections[self.replica]
+        del connections.settings[self.replica]
+        self.workdir.cleanup()
+
+    def _tenant_names(self):
+        response = self.client.get('/api/v1/tenants/', **self.bearer)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [tenant['name'] for tenant in response.json()['results']]
+
+    def test_api_reads_come_from_the_replica(self):
+        self.assertEqual(self._tenant_names(), ['Replica Club'])
+
+    def test_anonymous_write_keeps_the_client_on_the_primary(self):
+        response = self.client.post(
+            '/api/v1/owners/accept-invite/',
+            {'token': self.invitation.token, 'password': 'StrongPass123!', 'first_name': 'Ana', 'last_name': 'Lee'},
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        # The test client sends the pin cookie back with the next request.
+        self.assertEqual(self._tenant_names(), ['Primary Club'])
+        self.client.cookies.pop(settings.REPLICA_PIN_COOKIE)
+        self.assertEqual(self._tenant_names(), ['Replica Club'])
+
+    def test_admin_reads_from_the_primary(self):
+        self.client.force_login(self.superadmin)
+        response = self.client.get('/admin/tenants/tenant/', HTTP_HOST='localhost')
+        self.assertContains(response, 'Primary Club')
+        self.assertNotContains(response, 'Replica Club')
+
+
 class OwnerInvitationAcceptanceTests(APITestCase):
     def setUp(self):
         self.tenant = Tenant.objects.create(
@@ -63,3 +1108,95 @@ class OwnerInvitationAcceptanceTests(APITestCase):
 
         self.invitation.refresh_from_db()
         self.assertEqual(self.invitation.status, OwnerInvitation.Status.ACCEPTED)
+        self.tenant.refresh_from_db()
+        self.assertEqual(self.tenant.owners_count, 1)
+
+    def test_accept_invitation_while_signed_in_to_another_tenant(self):
+        other = Tenant.objects.create(name='Other Club', slug='other-club')
+        member = User.objects.create_user(
+            email='coach@other.example.com', password='CoachPass123!', role=User.Role.COACH, tenant=other
+        )
+        access = EmailTokenObtainPairSerializer.get_token(member).access_token
+        payload = {
+            'token': self.invitation.token,
+            'password': 'StrongPass123!',
+            'first_name': 'Alex',
+            'last_name': 'Morgan',
+        }
+
+        response = self.client.post(
+            '/api/v1/owners/accept-invite/', payload, HTTP_AUTHORIZATION=f'Bearer {access}'
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.content)
+        self.invitation.refresh_from_db()
+        self.assertEqual(self.invitation.status, OwnerInvitation.Status.ACCEPTED)
+
+    def test_admin_changelist_is_not_tenant_scoped(self):
+        other = Tenant.objects.create(name='Other Club', slug='other-club')
+        OwnerInvitation.objects.create(tenant=other, email='other-owner@example.com')
+        staff = User.objects.create_user(
+            email='staff@example.com', password='StaffPass123!', role=User.Role.OWNER, tenant=other, is_staff=True
+        )
+        staff.user_permissions.add(Permission.objects.get(codename='view_ownerinvitation'))
+        self.client.force_login(staff)
+
+        response = self.client.get('/admin/tenants/ownerinvitation/', HTTP_HOST='localhost')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertContains(response, 'new-owner@example.com')
+        self.assertContains(response, 'other-owner@example.com')
+
+
+class TenantResponseCacheTests(APITestCase):
+    def setUp(self):
+        self.superadmin = User.objects.create_superuser('cache-admin@example.com', 'AdminPass123!')
+        self.tenant = Tenant.objects.create(name='Cached Club', slug='cached-club')
+        self.owner = User.objects.create_user(
+            email='cached-owner@example.com',
+            password='OwnerPass123!',
+            role=User.Role.OWNER,
+            tenant=self.tenant,
+        )
+        reset_cache_stats()
+
+    def test_me_payload_is_served_from_cache(self):
+        self.client.force_authenticate(self.owner)
+        self.client.get('/api/v1/me/')
+
+        with self.assertNumQueries(0):
+            response = self.client.get('/api/v1/me/')
+
+        self.assertEqual(response.json()['tenant']['name'], 'Cached Club')
+        self.assertEqual(cache_stats(), {'me.miss': 1, 'me.hit': 1})
+
+    def test_tenant_save_invalidates_cached_payloads(self):
+        self.client.force_authenticate(self.owner)
+        self.client.get('/api/v1/me/')
+        self.client.get(f'/api/v1/tenants/{self.tenant.id}/')
+
+        self.tenant.name = 'Renamed Club'
+        self.tenant.save()
+
+        self.assertEqual(self.client.get('/api/v1/me/').json()['tenant']['name'], 'Renamed Club')
+        detail = self.client.get(f'/api/v1/tenants/{self.tenant.id}/').json()
+        self.assertEqual(detail['name'], 'Renamed Club')
+
+    def test_owner_change_invalidates_tenant_detail(self):
+        self.client.force_authenticate(self.superadmin)
+        url = f'/api/v1/tenants/{self.tenant.id}/'
+        self.assertEqual(self.client.get(url).json()['owners_count'], 1)
+
+        self.owner.tenant = None
+        self.owner.save()
+
+        self.assertEqual(self.client.get(url).json()['owners_count'], 0)
+
+    def test_owner_cannot_read_cached_detail_of_other_tenant(self):
+        self.client.force_authenticate(self.superadmin)
+        other = Tenant.objects.create(name='Other Club', slug='other-club')
+        self.client.get(f'/api/v1/tenants/{other.id}/')
+
+        self.client.force_authenticate(self.owner)
+        response = self.client.get(f'/api/v1/tenants/{other.id}/')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
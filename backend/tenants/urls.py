@@ -1,12 +1,13 @@
 from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 
-from .views import AcceptOwnerInviteView, TenantViewSet
+from .views import AcceptOwnerInviteView, TenantBrandingView, TenantViewSet
 
 router = DefaultRouter()
 router.register('tenants', TenantViewSet, basename='tenant')
 
 urlpatterns = [
     path('', include(router.urls)),
+    path('branding/', TenantBrandingView.as_view(), name='tenant-branding'),
     path('owners/accept-invite/', AcceptOwnerInviteView.as_view(), name='owner-accept-invite'),
 ]
@@ -3,22 +3,43 @@ from __future__ import annotations
 import logging
 
 from django.contrib.auth import get_user_model
-from django.db.models import Count, Q
+from django.db.models import QuerySet
 from rest_framework import permissions, status, viewsets
 from rest_framework.decorators import action
+from rest_framework.exceptions import NotFound
+from rest_framework.parsers import MultiPartParser
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from accounts.permissions import IsSuperAdmin
-
+from sports.fieldsets import concrete_columns, requested_fields
+from sports.metrics import timed
+
+from .conditional import (
+    apply_validators,
+    conditional_cached_response,
+    not_modified,
+    rows_etag,
+    sparse_namespace,
+)
+from .filters import TenantSearchFilter
+from .importers import IMPORT_FORMATS, detect_format, import_tenants, iter_rows
 from .models import Tenant
+from .pagination import TenantCursorPagination
 from .serializers import (
     AcceptOwnerInviteSerializer,
     AssignOwnerSerializer,
+    BulkOwnerInvitationResponseSerializer,
+    BulkOwnerInviteSerializer,
     OwnerInvitationResponseSerializer,
     OwnerInviteSerializer,
+    OWNER_FIELDS,
+    TenantBrandingSerializer,
     TenantDetailSerializer,
+    TenantOwnersQuerySerializer,
     TenantSerializer,
+    owners_prefetch,
+    tenant_rows,
 )
 
 
@@ -26,26 +47,55 @@ logger = logging.getLogger(__name__)
 User = get_user_model()
 
 
+def tenants_visible_to(user) -> QuerySet:
+    queryset = Tenant.objects.all().order_by('name')
+    if not user.is_authenticated:
+        return queryset.none()
+    if user.role == User.Role.SUPERADMIN:
+        return queryset
+    if user.role == User.Role.OWNER and user.tenant_id:
+        return queryset.filter(id=user.tenant_id)
+    return queryset.none()
+
+
+def tenant_list_rows(request, paginator, queryset: QuerySet):
+    """
+    Resolve ``?fields=`` for a tenant list and return ``(fields, rows,
+    columns, values)``: ``rows`` renders the plain rows exactly as
+    ``TenantSerializer`` would, and ``values`` fetches the requested columns
+    of ``queryset`` followed by any cursor column the page needs.
+    """
+    fields = requested_fields(request, TenantSerializer.Meta.fields)
+    rows = tenant_rows.subset(fields)
+    columns = (*rows.columns, *(
+        column for column in paginator.cursor_fields(request) if column not in rows.columns
+    ))
+    return fields, rows, columns, queryset.values_list(*columns, named=True)
+
+
 class TenantViewSet(viewsets.ModelViewSet):
     queryset = Tenant.objects.all()
     serializer_class = TenantSerializer
+    pagination_class = TenantCursorPagination
+    filter_backends = [TenantSearchFilter]
+    replica_read_actions = ('list', 'retrieve')
+
+    # Fields picked with ``?fields=`` for list/retrieve; ``None`` means all of them.
+    sparse_fields: tuple[str, ...] | None = None
 
     def get_queryset(self):
-        queryset = (
-            Tenant.objects.all()
-            .annotate(
-                owners_count=Count('users', filter=Q(users__role=User.Role.OWNER))
-            )
-            .order_by('name')
-        )
-        user = self.request.user
-        if not user.is_authenticated:
-            return queryset.none()
-        if user.role == User.Role.SUPERADMIN:
-            return queryset
-        if user.role == User.Role.OWNER and user.tenant_id:
-            return queryset.filter(id=user.tenant_id)
-        return queryset.none()
+        queryset = tenants_visible_to(self.request.user)
+        if self.action == 'retrieve':
+            if self.sparse_fields is None or 'owners' in self.sparse_fields:
+                queryset = queryset.prefetch_related(owners_prefetch())
+            if self.sparse_fields is not None:
+                queryset = queryset.only(*concrete_columns(Tenant, self.sparse_fields))
+        return queryset
+
+    def get_serializer(self, *args, **kwargs):
+        if self.sparse_fields is not None:
+            kwargs.setdefault('fields', self.sparse_fields)
+        return super().get_serializer(*args, **kwargs)
 
     def get_serializer_class(self):
         if self.action == 'retrieve':
@@ -53,7 +103,7 @@ class TenantViewSet(viewsets.ModelViewSet):
         return super().get_serializer_class()
 
     def get_permissions(self):
-        if self.action in {'list', 'create', 'invite_owner', 'assign_owner'}:
+        if self.action in {'list', 'create', 'invite_owner', 'assign_owner', 'owners', 'bulk_import', 'invite_owners'}:
             permission_classes = [IsSuperAdmin]
         elif self.action == 'retrieve':
             permission_classes = [permissions.IsAuthenticated]
@@ -68,11 +118,65 @@ class TenantViewSet(viewsets.ModelViewSet):
         serializer.is_valid(raise_exception=True)
         invitation = serializer.save()
 
-        logger.info('Mock sending owner invitation to %s with token %s', invitation.email, invitation.token)
+        logger.info('Queued owner invitation email for %s', invitation.email)
 
         response_serializer = OwnerInvitationResponseSerializer(invitation)
         return Response(response_serializer.data, status=status.HTTP_201_CREATED)
 
+    @action(detail=False, methods=['get'], url_path='owners', permission_classes=[IsSuperAdmin])
+    def owners(self, request):
+        query = TenantOwnersQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        tenant_ids = query.validated_data['ids']
+
+        owners_by_tenant: dict[str, list[dict]] = {str(tenant_id): [] for tenant_id in tenant_ids}
+        owners = (
+            User.objects.filter(tenant_id__in=tenant_ids, role=User.Role.OWNER)
+            .order_by('tenant_id', 'email')
+            .values('tenant_id', *OWNER_FIELDS)
+        )
+        for owner in owners:
+            owners_by_tenant[str(owner.pop('tenant_id'))].append(owner)
+        return Response(owners_by_tenant)
+
+    @action(detail=False, methods=['post'], url_path='invite-owners', permission_classes=[IsSuperAdmin])
+    def invite_owners(self, request):
+        serializer = BulkOwnerInviteSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        invitations = serializer.save()
+
+        logger.info('Queued %d owner invitation email(s)', len(invitations))
+
+        return Response(
+            {
+                'invitations': BulkOwnerInvitationResponseSerializer(invitations, many=True).data,
+                'errors': serializer.item_errors,
+            },
+            # Nothing created when every entry was skipped.
+            status=status.HTTP_201_CREATED if invitations else status.HTTP_200_OK,
+        )
+
+    @action(
+        detail=False,
+        methods=['post'],
+        url_path='import',
+        permission_classes=[IsSuperAdmin],
+        parser_classes=[MultiPartParser],
+    )
+    def bulk_import(self, request):
+        upload = request.data.get('file')
+        if upload is None:
+            return Response({'file': ['No file was submitted.']}, status=status.HTTP_400_BAD_REQUEST)
+        file_format = request.data.get('type') or detect_format(upload.name, upload.content_type)
+        if file_format not in IMPORT_FORMATS:
+            return Response(
+                {'type': [f"Unsupported import format, expected one of: {', '.join(IMPORT_FORMATS)}."]},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        report = import_tenants(iter_rows(upload.file, file_format))
+        return Response(report.as_dict(), status=status.HTTP_200_OK)
+
     @action(detail=True, methods=['post'], url_path='assign-owner', permission_classes=[IsSuperAdmin])
     def assign_owner(self, request, pk=None):
         tenant = self.get_object()
@@ -81,10 +185,45 @@ class TenantViewSet(viewsets.ModelViewSet):
         serializer.save()
         return Response(status=status.HTTP_204_NO_CONTENT)
 
+    def retrieve(self, request, *args, **kwargs):
+        user = request.user
+        tenant_id = str(kwargs.get(self.lookup_field, ''))
+        can_view = user.role == User.Role.SUPERADMIN or (
+            user.role == User.Role.OWNER and str(user.tenant_id) == tenant_id
+        )
+        if not can_view or not tenant_id.isdigit():
+            return super().retrieve(request, *args, **kwargs)
+
+        self.sparse_fields = requested_fields(request, TenantDetailSerializer.Meta.fields)
+        return conditional_cached_response(
+            request,
+            sparse_namespace('tenant-detail', self.sparse_fields),
+            lambda: super(TenantViewSet, self).retrieve(request, *args, **kwargs).data,
+            tenant_id=int(tenant_id),
+        )
+
     def list(self, request, *args, **kwargs):
         if request.user.role != User.Role.SUPERADMIN:
             return Response(status=status.HTTP_403_FORBIDDEN)
-        return super().list(request, *args, **kwargs)
+
+        # Plain rows of just the requested columns instead of model instances.
+        self.sparse_fields, rows, columns, values = tenant_list_rows(
+            request, self.paginator, self.filter_queryset(self.get_queryset())
+        )
+        page = self.paginate_queryset(values)
+        # Validated from the fetched rows, before any serializer work.
+        etag = rows_etag(
+            page,
+            columns,
+            variant=sparse_namespace(request.accepted_renderer.format, self.sparse_fields),
+            extra=(self.paginator.get_next_link(),),
+        )
+        response = not_modified(request, etag, None)
+        if response is not None:
+            return response
+        with timed('serialize'):
+            data = rows.serialize(page)
+        return apply_validators(self.get_paginated_response(data), etag, None)
 
 
 class AcceptOwnerInviteView(APIView):
@@ -95,3 +234,15 @@ class AcceptOwnerInviteView(APIView):
         serializer.is_valid(raise_exception=True)
         user = serializer.save()
         return Response({'message': 'Invitation accepted', 'email': user.email}, status=status.HTTP_201_CREATED)
+
+
+class TenantBrandingView(APIView):
+    """Public branding of the tenant resolved from the host or ``X-Tenant`` header."""
+
+    authentication_classes = []
+    permission_classes = [permissions.AllowAny]
+
+    def get(self, request, *args, **kwargs):
+        if request.tenant is None:
+            raise NotFound('Unknown tenant.')
+        return Response(TenantBrandingSerializer(request.tenant).data)
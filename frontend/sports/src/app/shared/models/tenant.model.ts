@@ -21,3 +21,10 @@ export interface TenantDetail extends TenantSummary {
   owners?: OwnerSummary[];
   owners_count?: number;
 }
+
+export interface TenantPage {
+  next: string | null;
+  results: TenantDetail[];
+}
+
+export type TenantOwnersMap = Record<string, OwnerSummary[]>;
@@ -2,7 +2,7 @@ import { Injectable } from '@angular/core';
 import { HttpClient } from '@angular/common/http';
 import { Observable } from 'rxjs';
 
-import { TenantDetail } from '../models/tenant.model';
+import { TenantDetail, TenantOwnersMap, TenantPage } from '../models/tenant.model';
 
 interface CreateTenantPayload {
   name: string;
@@ -21,8 +21,14 @@ export class TenantService {
 
   constructor(private http: HttpClient) {}
 
-  listTenants(): Observable<TenantDetail[]> {
-    return this.http.get<TenantDetail[]>(`${this.apiBase}/tenants/`);
+  listTenants(nextUrl?: string | null): Observable<TenantPage> {
+    // The next link already carries the `fields` parameter.
+    if (nextUrl) {
+      return this.http.get<TenantPage>(nextUrl);
+    }
+    return this.http.get<TenantPage>(`${this.apiBase}/tenants/`, {
+      params: { fields: 'id,name,slug,is_active,owners_count' },
+    });
   }
 
   createTenant(payload: CreateTenantPayload): Observable<TenantDetail> {
@@ -33,6 +39,12 @@ export class TenantService {
     return this.http.get<TenantDetail>(`${this.apiBase}/tenants/${id}/`);
   }
 
+  getOwners(tenantIds: number[]): Observable<TenantOwnersMap> {
+    return this.http.get<TenantOwnersMap>(`${this.apiBase}/tenants/owners/`, {
+      params: { ids: tenantIds.join(',') },
+    });
+  }
+
   inviteOwner(tenantId: number, email: string): Observable<{ token: string }> {
     return this.http.post<{ token: string }>(
       `${this.apiBase}/tenants/${tenantId}/invite-owner/`,
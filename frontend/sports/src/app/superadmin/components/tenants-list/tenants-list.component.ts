@@ -1,7 +1,7 @@
 import { Component, OnInit } from '@angular/core';
 import { Router } from '@angular/router';
 
-import { TenantDetail } from '../../../shared/models/tenant.model';
+import { OwnerSummary, TenantDetail } from '../../../shared/models/tenant.model';
 import { TenantService } from '../../../shared/services/tenant.service';
 
 @Component({
@@ -11,6 +11,8 @@ import { TenantService } from '../../../shared/services/tenant.service';
 })
 export class TenantsListComponent implements OnInit {
   tenants: TenantDetail[] = [];
+  owners: Record<string, OwnerSummary[]> = {};
+  nextUrl: string | null = null;
   loading = false;
   error?: string;
 
@@ -21,12 +23,27 @@ export class TenantsListComponent implements OnInit {
   }
 
   fetchTenants(): void {
+    this.tenants = [];
+    this.owners = {};
+    this.nextUrl = null;
+    this.loadPage();
+  }
+
+  loadMore(): void {
+    if (this.nextUrl) {
+      this.loadPage(this.nextUrl);
+    }
+  }
+
+  private loadPage(url?: string): void {
     this.loading = true;
     this.error = undefined;
-    this.tenantService.listTenants().subscribe({
-      next: (tenants) => {
-        this.tenants = tenants;
+    this.tenantService.listTenants(url).subscribe({
+      next: (page) => {
+        this.tenants = [...this.tenants, ...page.results];
+        this.nextUrl = page.next;
         this.loading = false;
+        this.loadOwners(page.results.map((tenant) => tenant.id));
       },
       error: () => {
         this.loading = false;
@@ -35,6 +52,21 @@ export class TenantsListComponent implements OnInit {
     });
   }
 
+  ownerEmails(tenantId: number): string {
+    return (this.owners[tenantId] ?? []).map((owner) => owner.email).join(', ');
+  }
+
+  private loadOwners(tenantIds: number[]): void {
+    if (!tenantIds.length) {
+      return;
+    }
+    this.tenantService.getOwners(tenantIds).subscribe({
+      next: (owners) => {
+        this.owners = { ...this.owners, ...owners };
+      },
+    });
+  }
+
   goToTenant(id: number): void {
     this.router.navigate(['/superadmin/tenants', id]);
   }